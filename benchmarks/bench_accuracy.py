@@ -0,0 +1,62 @@
+"""
+Measure match accuracy and throughput per fuzzy threshold on a noisy corpus.
+
+Generates a seeded, labelled corpus of fixture team names (see
+ncaa_d1_team_normalizer.corpus) and normalizes it at each threshold,
+reporting how many names matched the right team, the wrong team or nothing,
+overall and per noise type.
+
+Run with: python benchmarks/bench_accuracy.py [--names 50000] [--seed 7] [--thresholds 75 80 85 90]
+"""
+
+import argparse
+import time
+from collections import Counter
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.corpus import NoisyNameGenerator
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--names', type=int, default=50_000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--thresholds', type=int, nargs='+', default=[75, 80, 85, 90, 95])
+    args = parser.parse_args()
+
+    data = load_offline_teams().get_team_lookup_dict()
+    corpus = list(NoisyNameGenerator(data, seed=args.seed).generate(args.names))
+    texts = [name.text for name in corpus]
+    print(f"{len(corpus):,} names, {len(set(texts)):,} distinct, {len(data['by_name'])} teams")
+
+    for threshold in args.thresholds:
+        normalizer = TeamNormalizer(fuzzy_threshold=threshold, cache_size=0)
+        start = time.perf_counter()
+        results = normalizer.normalize_batch(texts)
+        elapsed = time.perf_counter() - start
+
+        outcomes = Counter()
+        by_noise = Counter()
+        for name, result in zip(corpus, results):
+            outcome = 'unmatched' if result is None else (
+                'correct' if result['espn_id'] == name.espn_id else 'wrong'
+            )
+            outcomes[outcome] += 1
+            for noise in name.noise or ('clean',):
+                by_noise[noise, outcome] += 1
+
+        print(f"\nthreshold {threshold}: {len(corpus) / elapsed:,.0f} names/s  " + "  ".join(
+            f"{outcome} {outcomes[outcome] / len(corpus):6.2%}" for outcome in ('correct', 'wrong', 'unmatched')
+        ))
+        for noise in sorted({noise for noise, _ in by_noise}):
+            total = sum(by_noise[noise, outcome] for outcome in ('correct', 'wrong', 'unmatched'))
+            print(f"  {noise:<13}" + "  ".join(
+                f"{outcome} {by_noise[noise, outcome] / total:6.2%}"
+                for outcome in ('correct', 'wrong', 'unmatched')
+            ))
+
+
+if __name__ == '__main__':
+    main()
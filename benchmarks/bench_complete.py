@@ -0,0 +1,64 @@
+"""
+Benchmark per-keystroke latency of TeamNormalizer.complete.
+
+Types every fixture team's display name, alias and nickname one character
+at a time (as a search box would) and reports latency percentiles per
+keystroke, next to a fuzzy extractOne over all names for the same prefixes.
+
+Run with: python benchmarks/bench_complete.py [--limit 10] [--rounds 5]
+"""
+
+import argparse
+import time
+
+from rapidfuzz import fuzz, process
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+def percentiles(samples):
+    """p50/p99/max of a list of seconds, in microseconds."""
+    ordered = sorted(samples)
+    p50 = ordered[len(ordered) // 2]
+    p99 = ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+    return p50 * 1e6, p99 * 1e6, ordered[-1] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    data = load_offline_teams().get_team_lookup_dict()
+    typed = [team['display_name'] for team in data['by_name'].values()]
+    typed += list(data['by_alias']) + list(data['by_nickname'])
+    keystrokes = [text[:size] for text in typed for size in range(1, len(text) + 1)]
+
+    normalizer = TeamNormalizer()
+    normalizer.complete('warm up')
+
+    complete_times = []
+    for _ in range(args.rounds):
+        for prefix in keystrokes:
+            start = time.perf_counter()
+            normalizer.complete(prefix, args.limit)
+            complete_times.append(time.perf_counter() - start)
+
+    all_names = data['all_names']
+    fuzzy_times = []
+    for prefix in keystrokes:
+        start = time.perf_counter()
+        process.extractOne(prefix.lower(), all_names, scorer=fuzz.ratio)
+        fuzzy_times.append(time.perf_counter() - start)
+
+    print(f"{len(keystrokes):,} keystrokes over {len(typed)} names, {len(all_names)} teams")
+    for label, samples in (('complete', complete_times), ('extractOne', fuzzy_times)):
+        p50, p99, worst = percentiles(samples)
+        print(f"{label:<11} p50 {p50:7.1f} us   p99 {p99:7.1f} us   max {worst:7.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark ESPN -> provider id translation: pandas merge vs IdCrosswalk.
+
+Builds a seeded crosswalk with one row per fixture team plus filler teams,
+then translates a column of ESPN ids both ways and checks they agree.
+
+Run with: python benchmarks/bench_crosswalk.py [--rows 5000000] [--teams 400] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from common import TEAMS
+
+from ncaa_d1_team_normalizer.crosswalk import MISSING_ID, IdCrosswalk
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5_000_000)
+    parser.add_argument('--teams', type=int, default=400)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    espn_ids = [team[1] for team in TEAMS]
+    espn_ids += [20000 + i for i in range(max(0, args.teams - len(espn_ids)))]
+    kenpom_ids = rng.sample(range(1, 10 * len(espn_ids)), len(espn_ids))
+    crosswalk = IdCrosswalk({'espn': e, 'kenpom': k} for e, k in zip(espn_ids, kenpom_ids))
+    table = pd.DataFrame({'espn_id': espn_ids, 'kenpom_id': kenpom_ids})
+
+    np_rng = np.random.default_rng(args.seed)
+    games = pd.DataFrame({'espn_id': np_rng.choice(espn_ids, size=args.rows)})
+
+    start = time.perf_counter()
+    merged = games.merge(table, on='espn_id', how='left')['kenpom_id']
+    merge_seconds = time.perf_counter() - start
+
+    crosswalk.translate_ids(games['espn_id'].to_numpy()[:1])  # build the dense mapping
+    start = time.perf_counter()
+    translated = crosswalk.translate_ids(games['espn_id'].to_numpy())
+    translate_seconds = time.perf_counter() - start
+
+    assert (merged.fillna(MISSING_ID).to_numpy(dtype=np.int64) == translated).all()
+    print(f"{args.rows:,} ids, {len(espn_ids)} teams")
+    print(f"pandas merge:    {merge_seconds * 1000:8.1f} ms")
+    print(f"translate_ids:   {translate_seconds * 1000:8.1f} ms ({merge_seconds / translate_seconds:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
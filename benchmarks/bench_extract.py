@@ -0,0 +1,58 @@
+"""
+Benchmark extract_teams throughput on short synthetic documents.
+
+Builds seeded headline / bet-description style documents mentioning fixture
+teams by display name, alias, abbreviation or mascot, and reports documents
+per second (and per hour) for extract_teams_batch.
+
+Run with: python benchmarks/bench_extract.py [--docs 100000] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+TEMPLATES = (
+    "{} vs {} 1H Spread",
+    "{} at {}: guard questionable (ankle)",
+    "{} -3.5 over {} tonight",
+    "Injury report: {} forward out, {} at full strength",
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--docs', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    data = load_offline_teams().get_team_lookup_dict()
+    teams = list(data['by_name'].values())
+    mentions = (
+        [team['display_name'] for team in teams]
+        + [team['abbreviation'] for team in teams]
+        + [team['nickname'] for team in teams]
+    )
+
+    rng = random.Random(args.seed)
+    docs = [
+        rng.choice(TEMPLATES).format(rng.choice(mentions), rng.choice(mentions))
+        for _ in range(args.docs)
+    ]
+
+    normalizer = TeamNormalizer()
+    start = time.perf_counter()
+    results = normalizer.extract_teams_batch(docs)
+    elapsed = time.perf_counter() - start
+
+    found = sum(len(result) for result in results)
+    print(f"{args.docs:,} documents, {found / args.docs:.2f} mentions/doc")
+    print(f"{args.docs / elapsed:,.0f} docs/s ({args.docs / elapsed * 3600 / 1e6:,.0f}M docs/hour)")
+
+
+if __name__ == '__main__':
+    main()
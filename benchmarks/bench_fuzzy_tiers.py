@@ -0,0 +1,86 @@
+"""
+Benchmark latency and accuracy of fuzzy scorer tier configurations.
+
+Builds a seeded corpus of labelled noisy fixture names (typos, reordered
+words such as "State Michigan", dropped and extra words) and runs
+TeamNormalizer's fuzzy stage under each scorer/prefilter configuration,
+reporting names per second and how many inputs matched the right team, the
+wrong team, or nothing.
+
+Run with: python benchmarks/bench_fuzzy_tiers.py [--names 5000] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.corpus import typo
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+NOISE_WORDS = ('the', 'univ', 'college', 'of')
+
+# (label, TeamNormalizer keyword arguments)
+CONFIGURATIONS = [
+    ('ratio', {}),
+    ('token_sort_ratio', {'scorer': 'token_sort_ratio'}),
+    ('token_set_ratio', {'scorer': 'token_set_ratio'}),
+    ('WRatio', {'scorer': 'WRatio'}),
+    ('ratio@50 -> token_set_ratio', {'prefilter': 'ratio', 'scorer': 'token_set_ratio'}),
+    ('ratio@50 -> WRatio', {'prefilter': 'ratio', 'scorer': 'WRatio'}),
+    ('token_sort@60 -> WRatio',
+     {'prefilter': 'token_sort_ratio', 'prefilter_cutoff': 60, 'scorer': 'WRatio'}),
+]
+
+
+def variant(name: str, rng: random.Random) -> str:
+    """A noisy spelling of a cleaned name."""
+    words = name.split()
+    kind = rng.randrange(4)
+    if kind == 0 or len(words) < 2:
+        return typo(name, rng.choice((1, 2)), rng)
+    if kind == 1:
+        rng.shuffle(words)
+        return ' '.join(words)
+    if kind == 2:
+        del words[rng.randrange(len(words))]
+        return ' '.join(words)
+    words.insert(rng.randrange(len(words) + 1), rng.choice(NOISE_WORDS))
+    return typo(' '.join(words), 1, rng)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--names', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--fuzzy-threshold', type=int, default=85)
+    args = parser.parse_args()
+
+    data = load_offline_teams().get_team_lookup_dict()
+    rng = random.Random(args.seed)
+    corpus = []
+    for _ in range(args.names):
+        name = rng.choice(data['all_names'])
+        corpus.append((variant(name, rng), data['by_name'][name]['team_id']))
+
+    print(f"{args.names:,} noisy names, {len(data['all_names'])} teams, "
+          f"threshold {args.fuzzy_threshold}")
+    print(f"{'configuration':<28} {'names/s':>9} {'correct':>8} {'wrong':>7} {'none':>7}")
+    for label, config in CONFIGURATIONS:
+        normalizer = TeamNormalizer(fuzzy_threshold=args.fuzzy_threshold, **config)
+
+        start = time.perf_counter()
+        results = [normalizer._fuzzy_match(name, data) for name, _ in corpus]
+        elapsed = time.perf_counter() - start
+
+        correct = sum(result is not None and result['espn_id'] == team_id
+                      for result, (_, team_id) in zip(results, corpus))
+        unmatched = sum(result is None for result in results)
+        wrong = len(corpus) - correct - unmatched
+        print(f"{label:<28} {len(corpus) / elapsed:>9,.0f} {correct / len(corpus):>8.1%} "
+              f"{wrong / len(corpus):>7.1%} {unmatched / len(corpus):>7.1%}")
+
+
+if __name__ == '__main__':
+    main()
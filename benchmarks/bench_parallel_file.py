@@ -0,0 +1,60 @@
+"""
+Benchmark memory-mapped, multi-process file normalization.
+
+Reports rows/second for 1, 2, 4 and N (cpu_count) workers using the offline
+fixture team table, so no network access is required. Rows come from a
+seeded noisy corpus with a typo in every name and uniform team draws, so
+most rows are distinct and the match caches do not hide the work.
+
+Run with: python benchmarks/bench_parallel_file.py [--rows 200000] [--seed 7]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.corpus import NoisyNameGenerator
+from ncaa_d1_team_normalizer.parallel import normalize_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    loader = load_offline_teams()
+    generator = NoisyNameGenerator(loader.get_team_lookup_dict(), seed=args.seed,
+                                   typo_rate=1.0, zipf_exponent=0)
+    texts = [name.text for name in generator.generate(args.rows)]
+    print(f"{len(texts):,} rows, {len(set(texts)):,} distinct")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, 'teams.snapshot')
+        input_path = os.path.join(tmp, 'input.txt')
+        output_path = os.path.join(tmp, 'output.tsv')
+
+        loader.save_snapshot(snapshot_path)
+        with open(input_path, 'w', encoding='utf-8') as fh:
+            for text in texts:
+                fh.write(text + '\n')
+
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, cpu_count})
+
+        print(f"{'workers':>8} {'seconds':>10} {'rows/sec':>12} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            rows = normalize_file(input_path, output_path, snapshot_path, workers=workers)
+            elapsed = time.perf_counter() - start
+            rate = rows / elapsed
+            baseline = baseline or rate
+            print(f"{workers:>8} {elapsed:>10.2f} {rate:>12,.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
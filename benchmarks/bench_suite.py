@@ -0,0 +1,389 @@
+"""
+Benchmark every pipeline stage against the offline fixture team table.
+
+Measures TextCleaner.clean and remove_suffixes, exact/alias/fuzzy hits,
+misses, cache hits, normalize_batch at several sizes and duplication
+ratios and on a noisy labelled corpus, index build time and cold start
+(fresh interpreter to first result). Inputs are seeded, no network is
+used, and results are written as JSON so runs can be compared across
+commits.
+
+Each stage is also reported relative to a fixed pure-Python calibration
+loop timed in the same run; comparing those ratios with a stored baseline
+(--baseline) flags regressions without depending on the machine's speed.
+
+Run with: python benchmarks/bench_suite.py [--output results.json] [--stages clean fuzzy ...]
+          python benchmarks/bench_suite.py --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from common import SAMPLE_INPUTS, load_offline_teams, teams_dataframe
+
+from ncaa_d1_team_normalizer.corpus import NoisyNameGenerator, typo
+from ncaa_d1_team_normalizer.text_cleaner import TextCleaner
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# normalize_batch sizes and the share of repeated names in each batch
+BATCH_SIZES = (100, 1_000, 10_000)
+DUPLICATE_RATIOS = (0.0, 0.9)
+
+# Names per normalize_batch call in the noisy corpus stage
+CORPUS_SIZE = 10_000
+
+# Committed reference results for the regression gate
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+
+# Largest tolerated drop in relative throughput before a stage counts as a
+# regression; batches (few long calls per round), index builds and process
+# startup are noisier than single lookups
+DEFAULT_TOLERANCE = 0.35
+STAGE_TOLERANCES = {
+    **{f'batch_{size}_dup{int(ratio * 100)}': 0.5 for size in BATCH_SIZES for ratio in DUPLICATE_RATIOS},
+    'corpus_10000': 0.5,
+    'index_build': 0.5,
+    'cold_start': 0.6,
+}
+
+# Inputs of the calibration loop: plain string, list and dict work of the
+# kind the pipeline does, but none of its code
+_CALIBRATION_INPUTS = [f"team {i} of {'x' * (i % 7)} state university" for i in range(200)]
+
+# A stage builds (work, ops): work() performs ops operations
+Stage = Callable[['Context'], Tuple[Callable[[], object], int]]
+
+
+class Context:
+    """Seeded inputs shared by the stages."""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.data = load_offline_teams().get_team_lookup_dict()
+        self.display_names = [team['display_name'] for team in self.data['by_name'].values()]
+        self.aliases = sorted(self.data['by_alias'])
+        by_name = self.data['by_name']
+
+        # One-edit typos that miss every hash stage, i.e. reach fuzzy matching
+        probe = TeamNormalizer(cache_size=0)
+        self.typos: List[str] = []
+        while len(self.typos) < 200:
+            name = self.rng.choice(self.data['all_names'])
+            variant = typo(name, 1, self.rng)
+            cleaned = TextCleaner.clean(variant)
+            if cleaned in by_name or not cleaned.strip():
+                continue
+            if probe._match_hashed(probe._prepare(variant, self.data), self.data) is None:
+                self.typos.append(variant)
+
+        self.misses = [
+            ''.join(self.rng.choice(string.ascii_lowercase) for _ in range(self.rng.randint(6, 14)))
+            for _ in range(200)
+        ]
+
+    def batch(self, size: int, duplicate_ratio: float) -> List[str]:
+        """A batch with `size` names of which about `duplicate_ratio` are repeats."""
+        pool = self.display_names + self.aliases + self.typos + self.misses
+        distinct = max(1, int(size * (1 - duplicate_ratio)))
+        unique = []
+        seen = set()
+        while len(unique) < distinct:
+            name = self.rng.choice(pool)
+            if name in seen:
+                name = typo(name, 1, self.rng)
+            if name.strip() and name not in seen:
+                seen.add(name)
+                unique.append(name)
+        names = unique + [self.rng.choice(unique) for _ in range(size - distinct)]
+        self.rng.shuffle(names)
+        return names
+
+
+def _each(function: Callable, inputs: List) -> Tuple[Callable[[], None], int]:
+    """Work that calls function once per input."""
+    def work():
+        for item in inputs:
+            function(item)
+    return work, len(inputs)
+
+
+def stage_clean(ctx: Context):
+    return _each(TextCleaner.clean, SAMPLE_INPUTS * 10)
+
+
+def stage_remove_suffixes(ctx: Context):
+    inputs = [TextCleaner.clean(name, strip_suffixes=False) for name in SAMPLE_INPUTS] * 10
+    return _each(TextCleaner.remove_suffixes, inputs)
+
+
+def stage_exact(ctx: Context):
+    return _each(TeamNormalizer(cache_size=0).normalize, ctx.display_names)
+
+
+def stage_alias(ctx: Context):
+    return _each(TeamNormalizer(cache_size=0).normalize, ctx.aliases)
+
+
+def stage_fuzzy(ctx: Context):
+    return _each(TeamNormalizer(cache_size=0).normalize, ctx.typos)
+
+
+def stage_miss(ctx: Context):
+    return _each(TeamNormalizer(cache_size=0).normalize, ctx.misses)
+
+
+def stage_cache_hit(ctx: Context):
+    normalizer = TeamNormalizer()
+    inputs = ctx.display_names + ctx.aliases + ctx.typos
+    for name in inputs:
+        normalizer.normalize(name)
+    return _each(normalizer.normalize, inputs)
+
+
+def _batch_stage(size: int, duplicate_ratio: float) -> Stage:
+    def stage(ctx: Context):
+        names = ctx.batch(size, duplicate_ratio)
+        normalizer = TeamNormalizer(cache_size=0)
+        return (lambda: normalizer.normalize_batch(names)), size
+    return stage
+
+
+def stage_corpus(ctx: Context):
+    names = [name.text for name in NoisyNameGenerator(ctx.data, seed=ctx.seed).generate(CORPUS_SIZE)]
+    normalizer = TeamNormalizer(cache_size=0)
+    return (lambda: normalizer.normalize_batch(names)), len(names)
+
+
+def stage_index_build(ctx: Context):
+    teams_df = teams_dataframe()
+    loader = load_offline_teams()
+    return (lambda: loader._build_lookup_dict(teams_df)), 1
+
+
+_COLD_START = (
+    "import sys; sys.path.insert(0, {bench_dir!r}); "
+    "from common import load_offline_teams; load_offline_teams(); "
+    "from ncaa_d1_team_normalizer import TeamNormalizer; TeamNormalizer().normalize('Duke')"
+)
+
+
+def stage_cold_start(ctx: Context):
+    command = [sys.executable, '-c', _COLD_START.format(bench_dir=BENCH_DIR)]
+    return (lambda: subprocess.run(command, check=True)), 1
+
+
+STAGES: Dict[str, Stage] = {
+    'clean': stage_clean,
+    'remove_suffixes': stage_remove_suffixes,
+    'exact': stage_exact,
+    'alias': stage_alias,
+    'fuzzy': stage_fuzzy,
+    'miss': stage_miss,
+    'cache_hit': stage_cache_hit,
+    **{
+        f'batch_{size}_dup{int(ratio * 100)}': _batch_stage(size, ratio)
+        for size in BATCH_SIZES for ratio in DUPLICATE_RATIOS
+    },
+    'corpus_10000': stage_corpus,
+    'index_build': stage_index_build,
+    'cold_start': stage_cold_start,
+}
+
+
+def measure(work: Callable[[], object], ops: int, min_time: float = 0.2, repeat: int = 3) -> Dict:
+    """
+    Time work() and report its best round.
+
+    Each round calls work() until at least min_time has passed; the fastest
+    round per call is kept, which is the least disturbed by other load.
+    """
+    work()  # warm caches and lazy initialization
+    best = float('inf')
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            work()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return {
+        'ops': ops,
+        'seconds': best,
+        'ops_per_sec': ops / best,
+        'us_per_op': best / ops * 1e6,
+    }
+
+
+def _calibration_step(text: str) -> None:
+    words = text.upper().split()
+    index = {word: position for position, word in enumerate(words)}
+    ' '.join(sorted(index, key=len)).lower()
+
+
+def calibrate(min_time: float = 0.2, repeat: int = 3) -> float:
+    """Operations per second of the fixed calibration loop on this machine."""
+    work, ops = _each(_calibration_step, _CALIBRATION_INPUTS)
+    return measure(work, ops, min_time, repeat)['ops_per_sec']
+
+
+def run_stages(names: Optional[List[str]] = None, seed: int = 7, min_time: float = 0.2,
+               repeat: int = 3, calibrated: bool = False) -> Dict[str, Dict]:
+    """
+    Run the named stages (all by default).
+
+    Args:
+        names: Stages to run (all if None)
+        seed: Seed of the generated inputs
+        min_time: Minimum seconds per measured round
+        repeat: Rounds per stage; the best one is reported
+        calibrated: Also time the calibration loop just before and after
+            each stage (keeping the faster run, so load that comes and goes
+            during the suite affects both sides of the ratio alike) and add
+            'calibration_ops_per_sec' and 'relative' (stage ops/s divided by
+            calibration ops/s) to each result
+
+    Returns:
+        {stage name: measure() result}, in STAGES order
+    """
+    unknown = set(names or ()) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+    ctx = Context(seed)
+    results = {}
+    for name, stage in STAGES.items():
+        if names and name not in names:
+            continue
+        work, ops = stage(ctx)
+        if not calibrated:
+            results[name] = measure(work, ops, min_time, repeat)
+            continue
+        before = calibrate(min_time, repeat)
+        result = measure(work, ops, min_time, repeat)
+        calibration = max(before, calibrate(min_time, repeat))
+        result['calibration_ops_per_sec'] = calibration
+        result['relative'] = result['ops_per_sec'] / calibration
+        results[name] = result
+    return results
+
+
+def benchmark(names: Optional[List[str]] = None, seed: int = 7, min_time: float = 0.2,
+              repeat: int = 3) -> Dict:
+    """
+    Run calibrated stages (see run_stages) and wrap them in a report.
+
+    Returns:
+        environment() plus 'stages'
+    """
+    return dict(environment(), stages=run_stages(names, seed, min_time, repeat, calibrated=True))
+
+
+def compare(baseline: Dict, current: Dict, tolerances: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """
+    Compare the relative throughput of two reports stage by stage.
+
+    Args:
+        baseline: Reference report from benchmark()
+        current: New report from benchmark()
+        tolerances: {stage: largest tolerated drop as a fraction}; stages not
+            listed use STAGE_TOLERANCES, then DEFAULT_TOLERANCE
+
+    Returns:
+        One row per stage present in both reports, in current's order:
+        stage, baseline and current relative throughput, change (fraction,
+        negative when slower), tolerance and regressed
+    """
+    tolerances = dict(STAGE_TOLERANCES, **(tolerances or {}))
+    rows = []
+    for name, result in current['stages'].items():
+        reference = baseline['stages'].get(name)
+        if reference is None or 'relative' not in reference:
+            continue
+        change = result['relative'] / reference['relative'] - 1
+        tolerance = tolerances.get(name, DEFAULT_TOLERANCE)
+        rows.append({
+            'stage': name,
+            'baseline': reference['relative'],
+            'current': result['relative'],
+            'change': change,
+            'tolerance': tolerance,
+            'regressed': change < -tolerance,
+        })
+    return rows
+
+
+def format_comparison(rows: List[Dict]) -> str:
+    """Per-stage diff table of compare() rows, regressions marked."""
+    lines = [f"{'stage':<22} {'baseline':>10} {'current':>10} {'change':>8} {'allowed':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['stage']:<22} {row['baseline']:>10.4g} {row['current']:>10.4g} "
+            f"{row['change']:>+8.1%} {-row['tolerance']:>+8.0%}"
+            + ('  REGRESSION' if row['regressed'] else '')
+        )
+    return '\n'.join(lines)
+
+
+def environment() -> Dict:
+    """Where and on which commit the suite ran."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=BENCH_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), metavar='STAGE')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--baseline', help='compare with this report and exit 1 on a regression')
+    args = parser.parse_args()
+
+    report = benchmark(args.stages, args.seed, args.min_time, args.repeat)
+    for name, result in report['stages'].items():
+        print(f"{name:<22} {result['ops_per_sec']:>14,.0f} ops/s {result['us_per_op']:>12,.1f} us/op",
+              file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            fh.write(text + '\n')
+    elif not args.baseline:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            rows = compare(json.load(fh), report)
+        print(format_comparison(rows))
+        if any(row['regressed'] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark the symmetric-deletion typo fast path against a full extractOne scan.
+
+Builds seeded synthetic corpora with 1, 2 and 3 character edits of fixture
+team names and times TeamNormalizer's fuzzy stage with and without the typo
+index, checking both return identical results. extractOne is linear in the
+number of teams while the index is not, so the full ESPN table (~360 teams)
+gains more than the ~115-team offline fixture.
+
+Run with: python benchmarks/bench_typo_index.py [--names 20000] [--seed 7]
+"""
+
+import argparse
+import random
+import time
+
+from common import load_offline_teams
+
+from ncaa_d1_team_normalizer.corpus import typo
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--names', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--fuzzy-threshold', type=int, default=85)
+    args = parser.parse_args()
+
+    data = load_offline_teams().get_team_lookup_dict()
+    without_index = dict(data, typo_index=None)
+
+    normalizer = TeamNormalizer(fuzzy_threshold=args.fuzzy_threshold)
+    rng = random.Random(args.seed)
+
+    print(f"{args.names:,} names per corpus, {len(data['all_names'])} teams, "
+          f"threshold {args.fuzzy_threshold}")
+    print(f"{'edits':>5} {'matched':>8} {'extractOne/s':>13} {'index/s':>10} {'speedup':>8}")
+    for edits in (1, 2, 3):
+        corpus = [typo(rng.choice(data['all_names']), edits, rng) for _ in range(args.names)]
+
+        timings = {}
+        results = {}
+        for label, lookup in (('extractOne', without_index), ('typo index', data)):
+            start = time.perf_counter()
+            results[label] = [normalizer._fuzzy_match(name, lookup) for name in corpus]
+            timings[label] = time.perf_counter() - start
+
+        assert results['typo index'] == results['extractOne'], "typo index changed results"
+        matched = sum(result is not None for result in results['extractOne']) / len(corpus)
+        print(f"{edits:>5} {matched:>8.1%} {len(corpus) / timings['extractOne']:>13,.0f} "
+              f"{len(corpus) / timings['typo index']:>10,.0f} "
+              f"{timings['extractOne'] / timings['typo index']:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
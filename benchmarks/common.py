@@ -0,0 +1,164 @@
+"""Shared offline fixtures for benchmark scripts (no network access)."""
+
+import os
+import sys
+
+import pandas as pd
+
+# Allow running scripts directly from a source checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader  # noqa: E402
+
+# (display_name, id, abbreviation, location, nickname)
+# IDs are fixture values; only the ones also used in tests/ mirror ESPN.
+TEAMS = [
+    ('Duke', 150, 'DUKE', 'Durham', 'Blue Devils'),
+    ('North Carolina', 153, 'UNC', 'Chapel Hill', 'Tar Heels'),
+    ('Connecticut', 41, 'CONN', 'Storrs', 'Huskies'),
+    ('Massachusetts', 113, 'UMASS', 'Amherst', 'Minutemen'),
+    ('Mississippi', 145, 'MISS', 'Oxford', 'Rebels'),
+    ('Pennsylvania', 219, 'PENN', 'Philadelphia', 'Quakers'),
+    ('Penn State', 213, 'PSU', 'University Park', 'Nittany Lions'),
+    ('Miami (FL)', 2390, 'MIA', 'Coral Gables', 'Hurricanes'),
+    ('Miami (OH)', 193, 'MU', 'Oxford', 'RedHawks'),
+    ("St. John's (NY)", 2599, 'SJU', 'Queens', 'Red Storm'),
+    ("Saint Mary's (CA)", 2608, 'SMC', 'Moraga', 'Gaels'),
+    ('Texas A&M', 245, 'A&M', 'College Station', 'Aggies'),
+    ('Michigan State', 127, 'MSU', 'East Lansing', 'Spartans'),
+    ('NC State', 152, 'NCSU', 'Raleigh', 'Wolfpack'),
+    ('Villanova', 222, 'NOVA', 'Villanova', 'Wildcats'),
+    ('Syracuse', 183, 'SYR', 'Syracuse', 'Orange'),
+    ('Kentucky', 10001, 'UK', 'Lexington', 'Wildcats'),
+    ('Kansas', 10002, 'KU', 'Lawrence', 'Jayhawks'),
+    ('Kansas State', 10003, 'KSU', 'Manhattan', 'Wildcats'),
+    ('Gonzaga', 10004, 'GONZ', 'Spokane', 'Bulldogs'),
+    ('Xavier', 10005, 'XAV', 'Cincinnati', 'Musketeers'),
+    ('Marquette', 10006, 'MARQ', 'Milwaukee', 'Golden Eagles'),
+    ('Creighton', 10007, 'CREI', 'Omaha', 'Bluejays'),
+    ('Butler', 10008, 'BUT', 'Indianapolis', 'Bulldogs'),
+    ('Georgetown', 10009, 'GTWN', 'Washington', 'Hoyas'),
+    ('Providence', 10010, 'PROV', 'Providence', 'Friars'),
+    ('Seton Hall', 10011, 'HALL', 'South Orange', 'Pirates'),
+    ('DePaul', 10012, 'DEP', 'Chicago', 'Blue Demons'),
+    ('Michigan', 10013, 'MICH', 'Ann Arbor', 'Wolverines'),
+    ('Ohio State', 10014, 'OSU', 'Columbus', 'Buckeyes'),
+    ('Indiana', 10015, 'IND', 'Bloomington', 'Hoosiers'),
+    ('Purdue', 10016, 'PUR', 'West Lafayette', 'Boilermakers'),
+    ('Illinois', 10017, 'ILL', 'Champaign', 'Fighting Illini'),
+    ('Iowa', 10018, 'IOWA', 'Iowa City', 'Hawkeyes'),
+    ('Iowa State', 10019, 'ISU', 'Ames', 'Cyclones'),
+    ('Wisconsin', 10020, 'WIS', 'Madison', 'Badgers'),
+    ('Minnesota', 10021, 'MINN', 'Minneapolis', 'Golden Gophers'),
+    ('Maryland', 10022, 'MD', 'College Park', 'Terrapins'),
+    ('Rutgers', 10023, 'RUTG', 'Piscataway', 'Scarlet Knights'),
+    ('Nebraska', 10024, 'NEB', 'Lincoln', 'Cornhuskers'),
+    ('Northwestern', 10025, 'NU', 'Evanston', 'Wildcats'),
+    ('UCLA', 10026, 'UCLA', 'Los Angeles', 'Bruins'),
+    ('USC', 10027, 'USC', 'Los Angeles', 'Trojans'),
+    ('Oregon', 10028, 'ORE', 'Eugene', 'Ducks'),
+    ('Arizona', 10029, 'ARIZ', 'Tucson', 'Wildcats'),
+    ('Arizona State', 10030, 'ASU', 'Tempe', 'Sun Devils'),
+    ('Colorado', 10031, 'COLO', 'Boulder', 'Buffaloes'),
+    ('Utah', 10032, 'UTAH', 'Salt Lake City', 'Utes'),
+    ('Baylor', 10033, 'BAY', 'Waco', 'Bears'),
+    ('Houston', 10034, 'HOU', 'Houston', 'Cougars'),
+    ('Texas', 10035, 'TEX', 'Austin', 'Longhorns'),
+    ('Texas Tech', 10036, 'TTU', 'Lubbock', 'Red Raiders'),
+    ('TCU', 10037, 'TCU', 'Fort Worth', 'Horned Frogs'),
+    ('Oklahoma', 10038, 'OU', 'Norman', 'Sooners'),
+    ('Oklahoma State', 10039, 'OKST', 'Stillwater', 'Cowboys'),
+    ('West Virginia', 10040, 'WVU', 'Morgantown', 'Mountaineers'),
+    ('Cincinnati', 10041, 'CIN', 'Cincinnati', 'Bearcats'),
+    ('BYU', 10042, 'BYU', 'Provo', 'Cougars'),
+    ('UCF', 10043, 'UCF', 'Orlando', 'Knights'),
+    ('Alabama', 10044, 'ALA', 'Tuscaloosa', 'Crimson Tide'),
+    ('Auburn', 10045, 'AUB', 'Auburn', 'Tigers'),
+    ('Arkansas', 10046, 'ARK', 'Fayetteville', 'Razorbacks'),
+    ('Florida', 10047, 'FLA', 'Gainesville', 'Gators'),
+    ('Georgia', 10048, 'UGA', 'Athens', 'Bulldogs'),
+    ('LSU', 10049, 'LSU', 'Baton Rouge', 'Tigers'),
+    ('Mississippi State', 10050, 'MSST', 'Starkville', 'Bulldogs'),
+    ('Missouri', 10051, 'MIZ', 'Columbia', 'Tigers'),
+    ('South Carolina', 10052, 'SC', 'Columbia', 'Gamecocks'),
+    ('Tennessee', 10053, 'TENN', 'Knoxville', 'Volunteers'),
+    ('Vanderbilt', 10054, 'VAN', 'Nashville', 'Commodores'),
+    ('Virginia', 10055, 'UVA', 'Charlottesville', 'Cavaliers'),
+    ('Virginia Tech', 10056, 'VT', 'Blacksburg', 'Hokies'),
+    ('Wake Forest', 10057, 'WAKE', 'Winston-Salem', 'Demon Deacons'),
+    ('Clemson', 10058, 'CLEM', 'Clemson', 'Tigers'),
+    ('Florida State', 10059, 'FSU', 'Tallahassee', 'Seminoles'),
+    ('Louisville', 10060, 'LOU', 'Louisville', 'Cardinals'),
+    ('Pittsburgh', 10061, 'PITT', 'Pittsburgh', 'Panthers'),
+    ('Notre Dame', 10062, 'ND', 'Notre Dame', 'Fighting Irish'),
+    ('Boston College', 10063, 'BC', 'Chestnut Hill', 'Eagles'),
+    ('Georgia Tech', 10064, 'GT', 'Atlanta', 'Yellow Jackets'),
+    ('Memphis', 10065, 'MEM', 'Memphis', 'Tigers'),
+    ('Wichita State', 10066, 'WICH', 'Wichita', 'Shockers'),
+    ('San Diego State', 10067, 'SDSU', 'San Diego', 'Aztecs'),
+    ('Nevada', 10068, 'NEV', 'Reno', 'Wolf Pack'),
+    ('Boise State', 10069, 'BSU', 'Boise', 'Broncos'),
+    ('Utah State', 10070, 'USU', 'Logan', 'Aggies'),
+    ('New Mexico', 10071, 'UNM', 'Albuquerque', 'Lobos'),
+    ('Dayton', 10072, 'DAY', 'Dayton', 'Flyers'),
+    ('VCU', 10073, 'VCU', 'Richmond', 'Rams'),
+    ("Saint Joseph's", 10074, 'JOES', 'Philadelphia', 'Hawks'),
+    ('Saint Louis', 10075, 'SLU', 'St. Louis', 'Billikens'),
+    ('Middle Tennessee', 10076, 'MTSU', 'Murfreesboro', 'Blue Raiders'),
+    ('Bowling Green', 10077, 'BGSU', 'Bowling Green', 'Falcons'),
+    ('SIU Edwardsville', 10078, 'SIUE', 'Edwardsville', 'Cougars'),
+    ('Kent State', 10079, 'KENT', 'Kent', 'Golden Flashes'),
+    ('Akron', 10080, 'AKR', 'Akron', 'Zips'),
+    ('Detroit Mercy', 10081, 'DET', 'Detroit', 'Titans'),
+    ('Kansas City', 10082, 'UMKC', 'Kansas City', 'Roos'),
+    ('Purdue Fort Wayne', 10083, 'PFW', 'Fort Wayne', 'Mastodons'),
+    ('Loyola Chicago', 10084, 'LUC', 'Chicago', 'Ramblers'),
+    ('Drake', 10085, 'DRKE', 'Des Moines', 'Bulldogs'),
+    ('Belmont', 10086, 'BEL', 'Nashville', 'Bruins'),
+    ('Murray State', 10087, 'MUR', 'Murray', 'Racers'),
+    ('Vermont', 10088, 'UVM', 'Burlington', 'Catamounts'),
+    ('Princeton', 10089, 'PRIN', 'Princeton', 'Tigers'),
+    ('Yale', 10090, 'YALE', 'New Haven', 'Bulldogs'),
+    ('Harvard', 10091, 'HARV', 'Cambridge', 'Crimson'),
+    ('Davidson', 10092, 'DAV', 'Davidson', 'Wildcats'),
+    ('Richmond', 10093, 'RICH', 'Richmond', 'Spiders'),
+    ('Florida Atlantic', 10094, 'FAU', 'Boca Raton', 'Owls'),
+    ('Oral Roberts', 10095, 'ORU', 'Tulsa', 'Golden Eagles'),
+    ('Grand Canyon', 10096, 'GCU', 'Phoenix', 'Antelopes'),
+    ('Saint Peter\'s', 10097, 'SPU', 'Jersey City', 'Peacocks'),
+    ('Fairleigh Dickinson', 10098, 'FDU', 'Teaneck', 'Knights'),
+    ('UMBC', 10099, 'UMBC', 'Baltimore', 'Retrievers'),
+    ('Northern Iowa', 10100, 'UNI', 'Cedar Falls', 'Panthers'),
+]
+
+
+def teams_dataframe() -> pd.DataFrame:
+    """Return the fixture team table in the shape ESPN returns."""
+    return pd.DataFrame([
+        {
+            'display_name': display_name,
+            'id': team_id,
+            'abbreviation': abbreviation,
+            'location': location,
+            'nickname': nickname,
+            'name': f"{display_name} {nickname}",
+        }
+        for display_name, team_id, abbreviation, location, nickname in TEAMS
+    ])
+
+
+def load_offline_teams() -> ESPNDataLoader:
+    """Populate the shared loader from the fixture table and return it."""
+    loader = ESPNDataLoader()
+    loader.clear_cache()
+    loader.load_from_dataframe(teams_dataframe())
+    return loader
+
+
+# Input variants that exercise each pipeline stage
+SAMPLE_INPUTS = [
+    'Duke', 'UConn', 'North Carolina Tar Heels', 'Dook', 'Kentuckey',
+    'Vilanova', 'Michigan St.', 'St Johns', 'University of Kansas',
+    'Gonzaga Bulldogs', 'Texas A and M', 'Miami OH', 'Fake University',
+    'Penn', 'Penn State', 'Purdue Boilermakers', 'Marquete', 'Xavier',
+]
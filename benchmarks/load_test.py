@@ -0,0 +1,95 @@
+"""
+Load test for the HTTP normalization service.
+
+Starts a NormalizationServer on localhost backed by the offline fixture team
+table (or targets --host/--port of a running server), drives it with
+keep-alive client threads and reports p50/p99 latency and requests/second.
+
+Run with: python benchmarks/load_test.py [--clients 16] [--seconds 10] [--batch 0]
+"""
+
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+
+from common import SAMPLE_INPUTS, load_offline_teams
+
+from ncaa_d1_team_normalizer.server import NormalizationServer
+
+
+def client(host, port, batch, deadline, latencies, seed):
+    """Send requests over one persistent connection until the deadline."""
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port)
+    local = []
+    while time.perf_counter() < deadline:
+        if batch:
+            path = '/normalize/batch'
+            body = {'names': [rng.choice(SAMPLE_INPUTS) for _ in range(batch)]}
+        else:
+            path = '/normalize'
+            body = {'name': rng.choice(SAMPLE_INPUTS)}
+
+        start = time.perf_counter()
+        conn.request('POST', path, json.dumps(body), {'Content-Type': 'application/json'})
+        response = conn.getresponse()
+        response.read()
+        local.append(time.perf_counter() - start)
+    conn.close()
+    latencies.extend(local)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0,
+                        help="Target a running server; 0 starts one in-process")
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--batch', type=int, default=0,
+                        help="Names per request (0 uses the single-name endpoint)")
+    args = parser.parse_args()
+
+    server = None
+    port = args.port
+    if not port:
+        load_offline_teams()
+        server = NormalizationServer((args.host, 0))
+        port = server.server_port
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    latencies = []
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=client, args=(args.host, port, args.batch, deadline, latencies, i))
+        for i in range(args.clients)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(json.dumps({
+        'clients': args.clients,
+        'batch': args.batch,
+        'requests': len(latencies),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(1000 * quantiles[49], 3),
+        'p99_ms': round(1000 * quantiles[98], 3),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,17 @@
 """NCAA D1 Men's Basketball Team Name Normalization Module."""
 
+from typing import Optional
+
 from .team_matcher import TeamNormalizer
+from .async_normalizer import AsyncTeamNormalizer
+from .crosswalk import IdCrosswalk
+from .data_loader import Dataset, ESPNDataLoader, load_datasets
+from .learned_aliases import LearnedAliasStore
+from .matchups import Matchup
 from .exceptions import (
     TeamNormalizerError,
     UnknownTeamError,
+    AmbiguousTeamError,
     DataLoadError,
     InvalidInputError,
 )
@@ -12,11 +20,19 @@ __version__ = "0.1.0"
 
 __all__ = [
     "TeamNormalizer",
+    "AsyncTeamNormalizer",
+    "Matchup",
+    "Dataset",
+    "IdCrosswalk",
+    "LearnedAliasStore",
     "TeamNormalizerError",
     "UnknownTeamError",
+    "AmbiguousTeamError",
     "DataLoadError",
     "InvalidInputError",
     "normalize_team",
+    "warmup",
+    "load_datasets",
 ]
 
 
@@ -38,3 +54,21 @@ def normalize_team(team_name: str, fuzzy_threshold: int = 85, raise_on_no_match:
     """
     normalizer = TeamNormalizer(fuzzy_threshold=fuzzy_threshold, raise_on_no_match=raise_on_no_match)
     return normalizer.normalize(team_name)
+
+
+def warmup(snapshot_path: Optional[str] = None, freeze_gc: bool = True) -> None:
+    """
+    Load and compile team data before forking worker processes.
+
+    Call from a prefork server's master (e.g. gunicorn's `on_starting` hook
+    or at app import with `preload_app = True`) so workers share the index
+    copy-on-write instead of each fetching ESPN data after fork.
+
+    Args:
+        snapshot_path: Load from a snapshot file instead of ESPN
+        freeze_gc: If True, call gc.freeze() after loading
+
+    Raises:
+        DataLoadError: If data cannot be loaded
+    """
+    ESPNDataLoader().warmup(snapshot_path=snapshot_path, freeze_gc=freeze_gc)
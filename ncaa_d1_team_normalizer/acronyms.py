@@ -0,0 +1,65 @@
+"""Generated acronyms and initialisms for team names."""
+
+from typing import Dict, Set
+
+from .text_cleaner import TextCleaner
+
+# Connector words skipped when taking initials
+STOPWORDS = frozenset({'of', 'the', 'and', 'at'})
+
+VOWELS = frozenset('aeiou')
+
+
+def initialisms(text: str) -> Set[str]:
+    """
+    Candidate initialisms of a multi-word name.
+
+    Each word contributes its first letter; short words without vowels
+    ("nc", the "a" and "m" of "a&m") are already abbreviations and are kept
+    whole. Variants with a leading or trailing "u" (for "University") are
+    included, e.g. "Middle Tennessee State" -> {"mts", "mtsu", "umts"}.
+
+    Args:
+        text: Team name, location or full name
+
+    Returns:
+        Set of lowercase candidates (empty for single-word names)
+    """
+    words = [
+        word for word in TextCleaner.remove_punctuation(text.lower()).split()
+        if word not in STOPWORDS
+    ]
+    if len(words) < 2:
+        return set()
+
+    base = ''.join(
+        word if len(word) <= 3 and not VOWELS.intersection(word) else word[0]
+        for word in words
+    )
+    return {base, base + 'u', 'u' + base}
+
+
+def team_acronyms(team_info: Dict) -> Set[str]:
+    """
+    All generated acronyms for one team.
+
+    Args:
+        team_info: Team record built by ESPNDataLoader
+
+    Returns:
+        Set of lowercase acronyms from the display name, location, full name
+        and ESPN abbreviation
+    """
+    acronyms = set()
+    for field in ('display_name', 'location', 'full_name'):
+        value = team_info.get(field)
+        if isinstance(value, str) and value:
+            acronyms |= initialisms(value)
+
+    abbreviation = team_info.get('abbreviation')
+    if isinstance(abbreviation, str) and abbreviation:
+        compact = ''.join(TextCleaner.remove_punctuation(abbreviation.lower()).split())
+        if len(compact) >= 2:
+            acronyms.add(compact)
+
+    return acronyms
@@ -1,5 +1,8 @@
 """Hardcoded team name aliases for common variants."""
 
+from types import MappingProxyType
+from typing import Dict, Mapping
+
 # Keys are lowercase cleaned names (stripped of punctuation), values are ESPN canonical names
 TEAM_ALIASES = {
     # -------------------------------------------------------------------------
@@ -348,3 +351,60 @@ TEAM_ALIASES = {
     'north carolina central': 'North Carolina Central',
     'nccu': 'North Carolina Central',
 }
+
+
+# Per-source alias overlays: {source: {alias: ESPN canonical name}}. Lookups
+# made with source=... check the source's overlay before the global pipeline,
+# so providers can disagree ("miami" is Miami (FL) on one book and Miami (OH)
+# on another). Aliases are cleaned like any input, so raw provider spellings
+# can be registered as they appear in the feed.
+SOURCE_ALIASES: Dict[str, Mapping[str, str]] = {}
+
+
+def register_source_aliases(source: str, aliases: Mapping[str, str]) -> None:
+    """
+    Register (or replace) the alias overlay of a source.
+
+    Normalizers compile the overlay into a hashed layer on their next lookup
+    for the source and start a fresh result cache for it.
+
+    Args:
+        source: Source key, e.g. 'draftkings'
+        aliases: {provider spelling: ESPN canonical name}
+    """
+    SOURCE_ALIASES[source] = MappingProxyType(dict(aliases))
+
+
+# Season-bounded names: (name, ESPN team id, first day, last day), days as
+# ISO dates and None for open-ended. Consulted only when a lookup passes
+# as_of=..., so old box scores resolve by what a name meant at the time;
+# outside its ranges a name goes through the regular pipeline (including
+# TEAM_ALIASES above).
+# Ids are used rather than canonical names because they survive renames.
+# Boundaries fall on July 1 so every game of a season gets that season's
+# name. A team id of None records that no Division I team went by the name
+# then (a program that had not yet moved up). Ranges of one name must not
+# overlap.
+HISTORICAL_NAMES = [
+    # Renamed programs
+    ('Detroit', '2174', None, '2017-06-30'),                    # Detroit Mercy
+    ('UMKC', '140', None, '2019-06-30'),                        # Kansas City
+    ('Missouri-Kansas City', '140', None, '2019-06-30'),
+    ('IPFW', '2870', None, '2016-06-30'),                       # Purdue Fort Wayne
+    ('Fort Wayne', '2870', '2016-07-01', '2018-06-30'),
+    ('Texas-Pan American', '292', None, '2015-06-30'),          # UT Rio Grande Valley
+    ('Texas Pan American', '292', None, '2015-06-30'),
+    ('UTPA', '292', None, '2015-06-30'),
+    ('Arkansas-Little Rock', '2031', None, '2016-06-30'),       # Little Rock
+    ('UALR', '2031', None, '2016-06-30'),
+    ('Southwest Missouri State', '2623', None, '2005-06-30'),   # Missouri State
+    ('Houston Baptist', '2277', None, '2022-06-30'),            # Houston Christian
+    ('Dixie State', '3101', '2020-07-01', '2022-06-30'),        # Utah Tech
+    ('IUPUI', '85', None, '2024-06-30'),                        # IU Indianapolis
+
+    # Programs that moved up to or left Division I
+    ('St. Thomas', None, None, '2021-06-30'),
+    ('Dixie State', None, None, '2020-06-30'),
+    ('Utah Tech', None, None, '2020-06-30'),
+    ('Hartford', '42', None, '2023-06-30'),
+]
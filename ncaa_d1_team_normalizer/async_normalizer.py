@@ -0,0 +1,150 @@
+"""asyncio front-end for team name normalization."""
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, List, Optional
+
+from .team_matcher import TeamNormalizer
+
+
+class AsyncTeamNormalizer:
+    """
+    Awaitable wrapper around TeamNormalizer for asyncio services.
+
+    Team data is loaded off the event loop (see
+    ESPNDataLoader.load_teams_async), so the first call never blocks the loop
+    on the ESPN fetch or retry backoff. Batches of at least
+    `offload_threshold` names run in an executor so long fuzzy scans do not
+    stall other tasks; smaller calls run inline, where they are cheaper than
+    a thread hop.
+    """
+
+    def __init__(
+        self,
+        fuzzy_threshold: int = 85,
+        raise_on_no_match: bool = False,
+        cache_size: int = 10000,
+        phonetic: bool = False,
+        scorer: str = 'ratio',
+        prefilter: Optional[str] = None,
+        prefilter_cutoff: float = 50,
+        learned_aliases: Optional[str] = None,
+        learn_threshold: float = 95,
+        promote_hits: int = 2,
+        dataset=None,
+        offload_threshold: int = 64,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize the normalizer.
+
+        Args:
+            fuzzy_threshold: Minimum fuzzy match score (0-100)
+            raise_on_no_match: If True, raise UnknownTeamError when no match found
+            cache_size: Maximum number of cleaned names whose results are cached
+            phonetic: If True, match sound-alike spellings by phonetic key
+            scorer: Fuzzy scorer name (see TeamNormalizer)
+            prefilter: Optional cheaper scorer that narrows fuzzy candidates
+            prefilter_cutoff: Minimum prefilter score (0-100) to be rescored
+            learned_aliases: Optional learned alias store (SQLite) path
+            learn_threshold: Minimum fuzzy score (0-100) recorded or promoted
+            promote_hits: Times a resolution must be seen before promotion
+            dataset: Team table to match against (see TeamNormalizer)
+            offload_threshold: Minimum batch size run in the executor
+            executor: Executor for offloaded batches (default: loop's default)
+        """
+        self.offload_threshold = offload_threshold
+        self._executor = executor
+        self._normalizer = TeamNormalizer(
+            fuzzy_threshold=fuzzy_threshold,
+            raise_on_no_match=raise_on_no_match,
+            cache_size=cache_size,
+            phonetic=phonetic,
+            scorer=scorer,
+            prefilter=prefilter,
+            prefilter_cutoff=prefilter_cutoff,
+            learned_aliases=learned_aliases,
+            learn_threshold=learn_threshold,
+            promote_hits=promote_hits,
+            dataset=dataset,
+        )
+        self._data_loader = self._normalizer._data_loader
+
+    @property
+    def normalizer(self) -> TeamNormalizer:
+        """The underlying synchronous normalizer."""
+        return self._normalizer
+
+    def close(self) -> None:
+        """Flush and close the learned alias store (see TeamNormalizer.close)."""
+        self._normalizer.close()
+
+    async def load(self, force_refresh: bool = False, max_retries: int = 3) -> None:
+        """
+        Load team data without blocking the event loop.
+
+        Concurrent callers share one in-flight load.
+
+        Args:
+            force_refresh: If True, bypass cache and reload data
+            max_retries: Number of retry attempts on failure
+
+        Raises:
+            DataLoadError: If data cannot be loaded after retries
+        """
+        await self._data_loader.load_teams_async(
+            force_refresh=force_refresh, max_retries=max_retries
+        )
+
+    async def normalize(self, team_name: str, source: Optional[str] = None, as_of=None,
+                        id_space: Optional[str] = None) -> Optional[Dict]:
+        """
+        Normalize a team name to ESPN canonical format.
+
+        Args:
+            team_name: Team name to normalize
+            source: Optional provider key (see TeamNormalizer.normalize)
+            as_of: Optional date the name was used on (see TeamNormalizer.normalize)
+            id_space: Optional crosswalk id space (see TeamNormalizer.normalize)
+
+        Returns:
+            Dictionary with canonical team info and match metadata, or None
+
+        Raises:
+            InvalidInputError: If input validation fails
+            UnknownTeamError: If raise_on_no_match=True and no match found
+        """
+        await self.load()
+        return self._normalizer.normalize(team_name, source, as_of, id_space)
+
+    async def normalize_batch(self, team_names: List[str], source: Optional[str] = None,
+                              as_of=None, id_space: Optional[str] = None) -> List[Optional[Dict]]:
+        """
+        Normalize multiple team names, offloading large batches.
+
+        Args:
+            team_names: List of team names to normalize
+            source: Optional provider key (see TeamNormalizer.normalize)
+            as_of: Optional date(s) the names were used on (see
+                TeamNormalizer.normalize_batch)
+            id_space: Optional crosswalk id space added to every result
+
+        Returns:
+            List of match results (same order as input)
+
+        Raises:
+            InvalidInputError: If any input fails validation
+            UnknownTeamError: If raise_on_no_match=True and a name has no match
+        """
+        await self.load()
+
+        normalize_batch = self._normalizer.normalize_batch
+        if source is not None or as_of is not None or id_space is not None:
+            normalize_batch = partial(normalize_batch, source=source, as_of=as_of, id_space=id_space)
+
+        if len(team_names) < self.offload_threshold:
+            return normalize_batch(team_names)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, normalize_batch, list(team_names))
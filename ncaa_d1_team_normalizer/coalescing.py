@@ -0,0 +1,218 @@
+"""Request coalescing for many concurrent single-name lookups."""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+from .team_matcher import TeamNormalizer
+from .exceptions import TeamNormalizerError
+
+# Queue item: (team_name, future, enqueue time from time.perf_counter())
+_Request = Tuple[str, Future, float]
+
+_STOP = object()
+
+
+class CoalescingNormalizer:
+    """
+    Micro-batching front-end that resolves concurrent lookups together.
+
+    Single-name requests submitted from any thread (or awaited from asyncio)
+    are queued; a background thread collects requests that arrive within
+    `max_delay` seconds of the first one, up to `max_batch_size`, and resolves
+    them through TeamNormalizer's batched path (one dedup pass and one
+    vectorized fuzzy scan per batch). Each caller's future is then fulfilled
+    with its own result or exception.
+
+    Use as a context manager, or call close(), to stop the batching thread.
+    """
+
+    def __init__(
+        self,
+        normalizer: Optional[TeamNormalizer] = None,
+        max_delay: float = 0.002,
+        max_batch_size: int = 256,
+    ):
+        """
+        Initialize the coalescer and start its batching thread.
+
+        Args:
+            normalizer: Normalizer used to resolve batches (default: new TeamNormalizer())
+            max_delay: Maximum seconds a request waits for others to join its batch
+            max_batch_size: Maximum requests resolved per batch
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.normalizer = normalizer if normalizer is not None else TeamNormalizer()
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._stats_lock = threading.Lock()
+        # Held while checking _closed and queueing, so nothing lands after _STOP
+        self._close_lock = threading.Lock()
+        self._closed = False
+        self._reset_stats()
+
+        self._thread = threading.Thread(
+            target=self._run, name='CoalescingNormalizer', daemon=True
+        )
+        self._thread.start()
+
+    def _reset_stats(self) -> None:
+        """Zero the batch and queueing-delay counters."""
+        self._batches = 0
+        self._requests = 0
+        self._largest_batch = 0
+        self._total_delay = 0.0
+        self._max_delay_seen = 0.0
+
+    def submit(self, team_name: str) -> Future:
+        """
+        Queue a team name for normalization.
+
+        Args:
+            team_name: Team name to normalize
+
+        Returns:
+            Future resolving to the match result (or None), or raising
+            InvalidInputError / UnknownTeamError as normalize() would
+        """
+        future: Future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("CoalescingNormalizer is closed")
+            self._queue.put((team_name, future, time.perf_counter()))
+        return future
+
+    def normalize(self, team_name: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Normalize a team name, blocking until its batch is resolved.
+
+        Args:
+            team_name: Team name to normalize
+            timeout: Maximum seconds to wait for the result
+
+        Returns:
+            Dictionary with canonical team info and match metadata, or None
+        """
+        return self.submit(team_name).result(timeout=timeout)
+
+    async def normalize_async(self, team_name: str) -> Optional[Dict]:
+        """
+        Normalize a team name from asyncio without blocking the event loop.
+
+        Args:
+            team_name: Team name to normalize
+
+        Returns:
+            Dictionary with canonical team info and match metadata, or None
+        """
+        return await asyncio.wrap_future(self.submit(team_name))
+
+    def stats(self) -> Dict:
+        """
+        Get batching metrics since creation (or the last reset_stats()).
+
+        Returns:
+            Dictionary with batches, requests, mean/max batch size and
+            mean/max queueing delay in milliseconds
+        """
+        with self._stats_lock:
+            batches = self._batches
+            requests = self._requests
+            return {
+                'batches': batches,
+                'requests': requests,
+                'mean_batch_size': requests / batches if batches else 0.0,
+                'max_batch_size': self._largest_batch,
+                'mean_queue_delay_ms': 1000 * self._total_delay / requests if requests else 0.0,
+                'max_queue_delay_ms': 1000 * self._max_delay_seen,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset batching metrics."""
+        with self._stats_lock:
+            self._reset_stats()
+
+    def close(self) -> None:
+        """Resolve queued requests and stop the batching thread."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    def __enter__(self) -> 'CoalescingNormalizer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Batching thread: collect requests into windows and resolve them."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch: List[_Request] = [item]
+            deadline = item[2] + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 \
+                        else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._resolve(batch)
+
+    def _resolve(self, batch: List[_Request]) -> None:
+        """Resolve one batch and fulfil each caller's future."""
+        started = time.perf_counter()
+        delays = [started - enqueued for _, _, enqueued in batch]
+        with self._stats_lock:
+            self._batches += 1
+            self._requests += len(batch)
+            self._largest_batch = max(self._largest_batch, len(batch))
+            self._total_delay += sum(delays)
+            self._max_delay_seen = max(self._max_delay_seen, max(delays))
+
+        # Invalid inputs fail individually instead of failing the batch
+        valid: List[_Request] = []
+        for request in batch:
+            team_name, future, _ = request
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                self.normalizer._validate_input(team_name)
+            except TeamNormalizerError as e:
+                future.set_exception(e)
+                continue
+            valid.append(request)
+
+        if not valid:
+            return
+
+        try:
+            results = self.normalizer._resolve_batch([name for name, _, _ in valid])
+            for (team_name, future, _), result in zip(valid, results):
+                if result is None and self.normalizer.raise_on_no_match:
+                    future.set_exception(self.normalizer._no_match_error(team_name))
+                else:
+                    future.set_result(dict(result) if result else None)
+        except Exception as e:
+            for _, future, _ in valid:
+                if not future.done():
+                    future.set_exception(e)
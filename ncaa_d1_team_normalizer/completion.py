@@ -0,0 +1,156 @@
+"""Prefix index for team name typeahead."""
+
+import heapq
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .exceptions import InvalidInputError
+from .text_cleaner import TextCleaner
+
+# Match types in ranking order: a prefix of the canonical name beats one of
+# an alias, and so on; 'word' is a prefix of a later word of the name
+# ("carolina" for "North Carolina")
+MATCH_TYPES = ('exact', 'alias', 'abbreviation', 'nickname', 'word')
+
+# Sorts after every other character, bounding a prefix range
+_MAX_CHAR = '\U0010ffff'
+
+
+class PrefixIndex:
+    """
+    Sorted array of completion keys searched by bisection.
+
+    A prefix selects one contiguous range of keys; the teams found there are
+    ranked by whether a key equals the prefix, match type, popularity, and
+    key length.
+    """
+
+    __slots__ = ('_keys', '_entries', '_weights')
+
+    def __init__(self, phrases: Iterable[Tuple[str, str, str]]):
+        """
+        Build the index.
+
+        Args:
+            phrases: (key, cleaned canonical name, match type) triples; match
+                types are from MATCH_TYPES, and a key listed for a team under
+                several types keeps the best one
+        """
+        best: Dict[Tuple[str, str], int] = {}
+        for key, cleaned_name, method in phrases:
+            rank = MATCH_TYPES.index(method)
+            if rank < best.get((key, cleaned_name), len(MATCH_TYPES)):
+                best[(key, cleaned_name)] = rank
+
+        ordered = sorted(best.items())
+        self._keys = tuple(key for (key, _), _ in ordered)
+        self._entries = tuple((cleaned_name, rank) for (_, cleaned_name), rank in ordered)
+
+        # Default popularity: how many spellings of a team the index knows,
+        # since heavily referenced programs collect the most aliases
+        weights: Dict[str, float] = {}
+        for cleaned_name, _ in self._entries:
+            weights[cleaned_name] = weights.get(cleaned_name, 0) + 1
+        self._weights = weights
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def search(
+        self,
+        prefix: str,
+        limit: int = 10,
+        popularity: Optional[Callable[[str], float]] = None,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Best-ranked teams with a key starting with a cleaned prefix.
+
+        Args:
+            prefix: Cleaned prefix
+            limit: Maximum number of teams returned
+            popularity: Optional cleaned name -> score function (higher
+                ranks first); defaults to the number of keys of each team
+
+        Returns:
+            (cleaned canonical name, matched key, match type) per team, best first
+        """
+        keys = self._keys
+        start = bisect_left(keys, prefix)
+        end = bisect_right(keys, prefix + _MAX_CHAR, start)
+
+        best: Dict[str, Tuple[bool, int, int, str]] = {}
+        entries = self._entries
+        for position in range(start, end):
+            key = keys[position]
+            cleaned_name, rank = entries[position]
+            candidate = (key != prefix, rank, len(key), key)
+            current = best.get(cleaned_name)
+            if current is None or candidate < current:
+                best[cleaned_name] = candidate
+
+        weight = popularity or self._weights.__getitem__
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: (
+            item[1][0], item[1][1], -weight(item[0]), item[1][2], item[0],
+        ))
+        return [(cleaned_name, match[3], MATCH_TYPES[match[1]]) for cleaned_name, match in top]
+
+
+def clean_prefix(prefix: str) -> str:
+    """
+    Clean typed text the way completion keys are cleaned.
+
+    Suffixes are kept, so a half-typed mascot still completes.
+
+    Returns:
+        Cleaned prefix, or '' if nothing is left to complete
+
+    Raises:
+        InvalidInputError: If prefix is not a string
+    """
+    if not isinstance(prefix, str):
+        raise InvalidInputError(f"Prefix must be a string, got {type(prefix).__name__}")
+    if not prefix.strip():
+        return ''
+    return TextCleaner.clean(prefix, strip_suffixes=False)
+
+
+def build_prefix_index(
+    by_name: Mapping[str, Mapping],
+    by_alias: Mapping[str, str],
+    by_abbrev: Mapping[str, Mapping],
+    by_nickname: Mapping[str, List[str]],
+) -> PrefixIndex:
+    """
+    Build the typeahead index from the loader's lookup sections.
+
+    Args:
+        by_name: {cleaned name: team_info}
+        by_alias: {alias: cleaned canonical name}
+        by_abbrev: {lowercase abbreviation: team_info}
+        by_nickname: {cleaned nickname: [cleaned canonical name, ...]}
+
+    Returns:
+        PrefixIndex over names, later name words, aliases, abbreviations
+        and nicknames
+    """
+    name_of_id = {team_info['team_id']: cleaned_name for cleaned_name, team_info in by_name.items()}
+    phrases = []
+    for cleaned_name in by_name:
+        phrases.append((cleaned_name, cleaned_name, 'exact'))
+        words = cleaned_name.split()
+        for first in range(1, len(words)):
+            phrases.append((' '.join(words[first:]), cleaned_name, 'word'))
+    for alias, cleaned_name in by_alias.items():
+        phrases.append((alias, cleaned_name, 'alias'))
+    for abbreviation, team_info in by_abbrev.items():
+        canonical = name_of_id.get(team_info['team_id'])
+        if canonical is None:
+            continue
+        try:
+            phrases.append((TextCleaner.clean(abbreviation, strip_suffixes=False), canonical, 'abbreviation'))
+        except InvalidInputError:
+            continue
+    for nickname, cleaned_names in by_nickname.items():
+        for cleaned_name in cleaned_names:
+            phrases.append((nickname, cleaned_name, 'nickname'))
+    return PrefixIndex(phrases)
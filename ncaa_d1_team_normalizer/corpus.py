@@ -0,0 +1,253 @@
+"""Seeded generator of labelled, noisy team names for load and accuracy tests."""
+
+import argparse
+import csv
+import random
+import string
+import sys
+from bisect import bisect_left
+from itertools import accumulate, islice
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from .data_loader import ESPNDataLoader
+
+# Columns of corpus files written by write_corpus()
+CORPUS_COLUMNS = ['text', 'espn_id', 'canonical_name', 'noise']
+
+# Characters inserted or substituted by typo()
+TYPO_ALPHABET = string.ascii_lowercase + ' '
+
+# Word-level spelling swaps applied as punctuation noise
+_SPELLINGS = (
+    ('Saint ', 'St. '),
+    ('St. ', 'Saint '),
+    ('St. ', 'St '),
+    (' State', ' St.'),
+    (' State', ' St'),
+    ('&', ' and '),
+    ('-', ' '),
+    ("'", ''),
+    ('(', ''),
+    (')', ''),
+)
+
+
+class LabelledName(NamedTuple):
+    """A generated input and the team it refers to."""
+
+    text: str
+    espn_id: str
+    canonical_name: str
+    noise: Tuple[str, ...]
+
+
+def typo(text: str, edits: int, rng: random.Random) -> str:
+    """Apply `edits` random insertions, deletions, substitutions or transpositions."""
+    chars = list(text)
+    for _ in range(edits):
+        if not chars:
+            break
+        op = rng.randrange(4)
+        pos = rng.randrange(len(chars))
+        if op == 0:
+            chars.insert(pos, rng.choice(TYPO_ALPHABET))
+        elif op == 1 and len(chars) > 1:
+            del chars[pos]
+        elif op == 2:
+            chars[pos] = rng.choice(TYPO_ALPHABET)
+        elif pos + 1 < len(chars):
+            chars[pos], chars[pos + 1] = chars[pos + 1], chars[pos]
+    return ''.join(chars)
+
+
+class NoisyNameGenerator:
+    """
+    Deterministic stream of noisy team names with known ground truth.
+
+    Teams are drawn from a Zipf distribution over a seeded ordering, so a
+    few teams repeat heavily as in real feeds. Each draw starts from the
+    display name (or an abbreviation/alias) and applies each kind of noise
+    independently at its configured rate.
+    """
+
+    def __init__(
+        self,
+        teams: Optional[Mapping] = None,
+        seed: int = 0,
+        mascot_rate: float = 0.3,
+        university_rate: float = 0.1,
+        punctuation_rate: float = 0.2,
+        case_rate: float = 0.3,
+        typo_rate: float = 0.15,
+        abbreviation_rate: float = 0.1,
+        zipf_exponent: float = 1.1,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            teams: Lookup structure from ESPNDataLoader.get_team_lookup_dict()
+                (loaded on demand if None)
+            seed: Random seed; the same seed and table give the same stream
+            mascot_rate: Share of names with the mascot appended
+            university_rate: Share with "University of" / "University" added
+            punctuation_rate: Share with a spelling swap ("St." for "Saint",
+                "&" spelled out, punctuation dropped)
+            case_rate: Share in upper, lower or random case
+            typo_rate: Share with a one-character insertion, deletion,
+                substitution or transposition (a second typo is applied to
+                a quarter of those)
+            abbreviation_rate: Share starting from the ESPN abbreviation or
+                an alias instead of the display name
+            zipf_exponent: Skew of team frequencies (0 draws uniformly)
+        """
+        data = teams if teams is not None else ESPNDataLoader().get_team_lookup_dict()
+        self.seed = seed
+        self.mascot_rate = mascot_rate
+        self.university_rate = university_rate
+        self.punctuation_rate = punctuation_rate
+        self.case_rate = case_rate
+        self.typo_rate = typo_rate
+        self.abbreviation_rate = abbreviation_rate
+        self.zipf_exponent = zipf_exponent
+
+        by_name = data['by_name']
+        aliases: Dict[str, List[str]] = {}
+        for alias, cleaned_name in sorted(data['by_alias'].items()):
+            aliases.setdefault(cleaned_name, []).append(alias)
+
+        # (team_info, short forms), in a seeded order that fixes popularity
+        self._teams = [
+            (by_name[cleaned_name], [by_name[cleaned_name]['abbreviation']] + aliases.get(cleaned_name, []))
+            for cleaned_name in sorted(by_name)
+        ]
+        random.Random(seed).shuffle(self._teams)
+        self._cum_weights = list(accumulate(
+            1.0 / rank ** zipf_exponent for rank in range(1, len(self._teams) + 1)
+        ))
+
+    def __iter__(self) -> Iterator[LabelledName]:
+        """Endless stream of labelled names (see generate)."""
+        rng = random.Random(self.seed)
+        total = self._cum_weights[-1]
+        while True:
+            team_info, short_forms = self._teams[bisect_left(self._cum_weights, rng.random() * total)]
+            yield self._noisy(team_info, short_forms, rng)
+
+    def generate(self, size: int) -> Iterator[LabelledName]:
+        """
+        The first `size` labelled names of the stream.
+
+        Args:
+            size: Number of names
+
+        Returns:
+            Iterator of LabelledName (nothing is held in memory)
+        """
+        return islice(iter(self), size)
+
+    def _noisy(self, team_info: Mapping, short_forms: List[str], rng: random.Random) -> LabelledName:
+        """Apply each noise type at its rate to one team."""
+        noise = []
+        text = team_info['display_name']
+
+        short_forms = [form for form in short_forms if form]
+        if short_forms and rng.random() < self.abbreviation_rate:
+            text = rng.choice(short_forms)
+            noise.append('abbreviation')
+        else:
+            if rng.random() < self.university_rate:
+                text = f"University of {text}" if rng.random() < 0.5 else f"{text} University"
+                noise.append('university')
+            nickname = team_info.get('nickname')
+            if nickname and rng.random() < self.mascot_rate:
+                text = f"{text} {nickname}"
+                noise.append('mascot')
+
+        if rng.random() < self.punctuation_rate:
+            swaps = [(old, new) for old, new in _SPELLINGS if old in text]
+            if swaps:
+                old, new = rng.choice(swaps)
+                text = ' '.join(text.replace(old, new).split())
+                noise.append('punctuation')
+
+        if rng.random() < self.typo_rate:
+            text = typo(text, 1, rng)
+            if rng.random() < 0.25:
+                text = typo(text, 1, rng)
+            noise.append('typo')
+
+        if rng.random() < self.case_rate:
+            style = rng.randrange(3)
+            if style == 0:
+                text = text.upper()
+            elif style == 1:
+                text = text.lower()
+            else:
+                text = ''.join(c.upper() if rng.random() < 0.5 else c.lower() for c in text)
+            noise.append('case')
+
+        if not text.strip():
+            text = team_info['display_name']
+        return LabelledName(text, team_info['team_id'], team_info['display_name'], tuple(noise))
+
+
+def write_corpus(path: str, names: Iterator[LabelledName]) -> int:
+    """
+    Stream labelled names to a CSV file (columns: CORPUS_COLUMNS).
+
+    Args:
+        path: Output file path ('-' for stdout)
+        names: Labelled names, e.g. NoisyNameGenerator(...).generate(n)
+
+    Returns:
+        Number of rows written
+    """
+    fh = sys.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+    try:
+        writer = csv.writer(fh)
+        writer.writerow(CORPUS_COLUMNS)
+        count = 0
+        for name in names:
+            writer.writerow([name.text, name.espn_id, name.canonical_name, ' '.join(name.noise)])
+            count += 1
+        return count
+    finally:
+        if fh is not sys.stdout:
+            fh.close()
+
+
+def read_corpus(path: str) -> Iterator[LabelledName]:
+    """Stream labelled names back from a file written by write_corpus()."""
+    with open(path, newline='', encoding='utf-8') as fh:
+        for row in csv.DictReader(fh):
+            yield LabelledName(
+                row['text'], row['espn_id'], row['canonical_name'], tuple(row['noise'].split()),
+            )
+
+
+def main(argv=None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Write a labelled noisy team name corpus as CSV.")
+    parser.add_argument('--size', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='-', help="CSV path ('-' for stdout)")
+    parser.add_argument('--snapshot', help="Load the team index from a snapshot instead of ESPN")
+    parser.add_argument('--zipf-exponent', type=float, default=1.1)
+    for noise in ('mascot', 'university', 'punctuation', 'case', 'typo', 'abbreviation'):
+        parser.add_argument(f'--{noise}-rate', type=float)
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        ESPNDataLoader().load_snapshot(args.snapshot)
+    rates = {
+        f'{noise}_rate': getattr(args, f'{noise}_rate')
+        for noise in ('mascot', 'university', 'punctuation', 'case', 'typo', 'abbreviation')
+        if getattr(args, f'{noise}_rate') is not None
+    }
+    generator = NoisyNameGenerator(seed=args.seed, zipf_exponent=args.zipf_exponent, **rates)
+    write_corpus(args.output, generator.generate(args.size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""Crosswalk between ESPN team ids and other providers' ids."""
+
+import csv
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .exceptions import DataLoadError, InvalidInputError
+
+# Returned for ids with no counterpart when the target id space is integer
+MISSING_ID = -1
+
+# Integer id spaces whose largest id is at most this get a dense array
+# indexed by id; larger or non-integer ids are translated by hash lookup
+MAX_DENSE_ID = 10_000_000
+
+
+class IdCrosswalk:
+    """
+    Table of team ids across id spaces ('espn', 'kenpom', 'ncaa', ...).
+
+    Each row is one team; a team may lack an id in some spaces. Id spaces
+    whose ids are all non-negative integers are stored as int64 arrays, so
+    translate_ids() is a single array-indexing operation through a dense
+    from -> to mapping built on first use of each pair.
+    """
+
+    def __init__(self, rows: Iterable[Mapping[str, object]]):
+        """
+        Build a crosswalk from rows of {id space: id}.
+
+        Args:
+            rows: One mapping per team; None or empty values mean the team
+                has no id in that space
+
+        Raises:
+            DataLoadError: If there are no id spaces, or an id appears in
+                more than one row of the same space
+        """
+        columns: Dict[str, List[Optional[str]]] = {}
+        count = 0
+        for row in rows:
+            for space, value in row.items():
+                value = None if value is None else str(value).strip() or None
+                columns.setdefault(space, [None] * count).append(value)
+            count += 1
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(None)
+        if not columns:
+            raise DataLoadError("ID crosswalk has no id spaces")
+
+        self.id_spaces: Tuple[str, ...] = tuple(columns)
+        self._columns = {space: tuple(column) for space, column in columns.items()}
+        self._rows: Dict[str, Dict[str, int]] = {}
+        for space, ids in self._columns.items():
+            index = {}
+            for position, value in enumerate(ids):
+                if value is None:
+                    continue
+                if value in index:
+                    raise DataLoadError(f"Duplicate {space} id in ID crosswalk: {value}")
+                index[value] = position
+            self._rows[space] = index
+
+        # Each column with one trailing slot holding the missing value, so
+        # row -1 (not found) indexes the sentinel
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._integer = set()
+        for space, ids in self._columns.items():
+            if all(value is None or value.isdigit() for value in ids):
+                self._integer.add(space)
+                values = [MISSING_ID if value is None else int(value) for value in ids]
+                self._arrays[space] = np.array(values + [MISSING_ID], dtype=np.int64)
+            else:
+                self._arrays[space] = np.array(list(ids) + [None], dtype=object)
+
+        self._dense: Dict[Tuple[str, str], np.ndarray] = {}
+        self._dense_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._columns[self.id_spaces[0]])
+
+    @classmethod
+    def from_csv(cls, path: str) -> 'IdCrosswalk':
+        """Load a CSV file whose header names the id spaces."""
+        try:
+            with open(path, newline='', encoding='utf-8') as fh:
+                return cls(list(csv.DictReader(fh)))
+        except (OSError, csv.Error, UnicodeDecodeError) as e:
+            raise DataLoadError(f"Failed to load ID crosswalk {path}: {str(e)}")
+
+    @classmethod
+    def from_json(cls, path: str) -> 'IdCrosswalk':
+        """Load a JSON list of {id space: id} objects."""
+        try:
+            with open(path, encoding='utf-8') as fh:
+                rows = json.load(fh)
+        except (OSError, ValueError) as e:
+            raise DataLoadError(f"Failed to load ID crosswalk {path}: {str(e)}")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise DataLoadError(f"ID crosswalk {path} must be a JSON list of objects")
+        return cls(rows)
+
+    @classmethod
+    def load(cls, path: str) -> 'IdCrosswalk':
+        """
+        Load a crosswalk file, by extension (.json, otherwise CSV).
+
+        Raises:
+            DataLoadError: If the file is missing or malformed
+        """
+        if os.path.splitext(path)[1].lower() == '.json':
+            return cls.from_json(path)
+        return cls.from_csv(path)
+
+    def check_id_space(self, space: str) -> None:
+        """
+        Check that an id space is in the crosswalk.
+
+        Raises:
+            InvalidInputError: If it is not
+        """
+        if space not in self._columns:
+            raise InvalidInputError(
+                f"Unknown id space {space!r} (known: {', '.join(self.id_spaces)})"
+            )
+
+    def translate(self, team_id, from_: str = 'espn', to: str = 'kenpom') -> Optional[str]:
+        """
+        Translate one id.
+
+        Args:
+            team_id: Id in the `from_` space
+            from_: Source id space
+            to: Target id space
+
+        Returns:
+            Id in the `to` space as a string, or None if there is none
+
+        Raises:
+            InvalidInputError: If an id space is unknown
+        """
+        self.check_id_space(from_)
+        self.check_id_space(to)
+        row = self._rows[from_].get(str(team_id).strip())
+        return None if row is None else self._columns[to][row]
+
+    def _dense_mapping(self, from_: str, to: str) -> Optional[np.ndarray]:
+        """
+        Array mapping every `from_` id up to the largest one to its `to` id.
+
+        Returns:
+            The mapping, or None if `from_` is not a small-integer id space
+        """
+        key = (from_, to)
+        mapping = self._dense.get(key)
+        if mapping is not None or from_ not in self._integer:
+            return mapping
+
+        source = self._arrays[from_][:-1]
+        present = source != MISSING_ID
+        if not present.any() or source.max() > MAX_DENSE_ID:
+            return None
+        with self._dense_lock:
+            mapping = self._dense.get(key)
+            if mapping is None:
+                row_of = np.full(int(source.max()) + 1, -1, dtype=np.intp)
+                row_of[source[present]] = np.flatnonzero(present)
+                mapping = self._arrays[to][row_of]
+                mapping.flags.writeable = False
+                self._dense[key] = mapping
+        return mapping
+
+    def translate_ids(self, ids, from_: str = 'espn', to: str = 'kenpom') -> np.ndarray:
+        """
+        Translate an array of ids in one vectorized operation.
+
+        Args:
+            ids: Array-like of ids in the `from_` space (integers, or
+                strings of digits for integer spaces)
+            from_: Source id space
+            to: Target id space
+
+        Returns:
+            Array of the same shape: int64 with MISSING_ID for ids without a
+            counterpart if the `to` space is integer, otherwise object with None
+
+        Raises:
+            InvalidInputError: If an id space is unknown
+        """
+        self.check_id_space(from_)
+        self.check_id_space(to)
+        ids = np.asarray(ids)
+
+        mapping = self._dense_mapping(from_, to)
+        if mapping is not None:
+            try:
+                numeric = ids.astype(np.int64) if ids.dtype.kind not in 'iu' else ids
+            except (TypeError, ValueError):
+                numeric = None
+            if numeric is not None:
+                inside = (numeric >= 0) & (numeric < len(mapping))
+                if inside.all():
+                    return mapping[numeric]
+                missing = self._arrays[to][-1]
+                return np.where(inside, mapping[np.where(inside, numeric, 0)], missing)
+
+        # Non-integer (or very large) source ids: one hash lookup per id
+        rows = self._rows[from_]
+        row_index = np.fromiter(
+            (rows.get(str(team_id).strip(), -1) for team_id in ids.ravel()),
+            dtype=np.intp, count=ids.size,
+        )
+        return self._arrays[to][row_index].reshape(ids.shape)
@@ -1,39 +1,204 @@
 """ESPN data loading and caching."""
 
+import asyncio
+import gc
+import importlib
+import os
+import pickle
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from types import MappingProxyType
+from typing import Dict, Iterable, List, NamedTuple, Optional
 from datetime import datetime, timedelta
 
-from .exceptions import DataLoadError
+from .acronyms import team_acronyms
+from .aliases import HISTORICAL_NAMES, TEAM_ALIASES
+from .completion import build_prefix_index
+from .crosswalk import IdCrosswalk
+from .exceptions import DataLoadError, InvalidInputError
+from .history import NameHistory
+from .mentions import build_mention_automaton
+from .phonetic import phonetic_key
+from .scoring import sort_tokens
+from .shared_index import LazyLookup, SharedIndex
 from .text_cleaner import TextCleaner
+from .typo_index import TypoIndex
+
+# Bumped whenever the layout of the compiled lookup structure changes
+SNAPSHOT_FORMAT = 9
+
+# Process-wide, monotonically increasing IndexSnapshot versions
+_snapshot_versions = count(1)
+
+
+class Dataset(NamedTuple):
+    """An ESPN team table: sport, gender and ESPN group id (50 = Division I)."""
+
+    sport: str
+    gender: str
+    group: int
+
+
+DEFAULT_DATASET = Dataset('basketball', 'mens', 50)
+
+# (sport, gender) -> (sportsdataverse module, team table function)
+TEAM_FETCHERS = {
+    ('basketball', 'mens'): ('sportsdataverse.mbb', 'espn_mbb_teams'),
+    ('basketball', 'womens'): ('sportsdataverse.wbb', 'espn_wbb_teams'),
+}
+
+
+def resolve_dataset(dataset) -> Dataset:
+    """
+    Normalize a dataset argument.
+
+    Args:
+        dataset: Dataset, (sport, gender, group) sequence, or None for
+            DEFAULT_DATASET
+
+    Returns:
+        Dataset
+
+    Raises:
+        ValueError: If the dataset is malformed or its sport/gender has no
+            entry in TEAM_FETCHERS
+    """
+    if dataset is None:
+        return DEFAULT_DATASET
+    try:
+        sport, gender, group = dataset
+        dataset = Dataset(sport, gender, int(group))
+    except (TypeError, ValueError):
+        raise ValueError(f"Dataset must be (sport, gender, group), got {dataset!r}")
+    if (dataset.sport, dataset.gender) not in TEAM_FETCHERS:
+        known = ', '.join(f"{sport}/{gender}" for sport, gender in TEAM_FETCHERS)
+        raise ValueError(f"No team fetcher for {dataset.sport}/{dataset.gender} (known: {known})")
+    return dataset
+
+
+class IndexSnapshot:
+    """
+    Immutable, versioned view of the compiled team lookup structure.
+
+    The loader publishes a new snapshot object on every (re)load by swapping
+    a single reference, so a caller that holds one snapshot sees one
+    consistent version for as long as it holds it.
+    """
+
+    __slots__ = ('version', 'created_at', 'data')
+
+    version: int
+    created_at: datetime
+    data: Mapping
+
+    def __init__(self, data: Mapping):
+        object.__setattr__(self, 'version', next(_snapshot_versions))
+        object.__setattr__(self, 'created_at', datetime.now())
+        if isinstance(data, LazyLookup):
+            # Already read-only; copying it would build every lazy entry
+            object.__setattr__(self, 'data', data)
+        else:
+            object.__setattr__(self, 'data', MappingProxyType(dict(data)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("IndexSnapshot is immutable")
+
+    def __repr__(self) -> str:
+        return f"IndexSnapshot(version={self.version}, created_at={self.created_at.isoformat()})"
 
 
 class ESPNDataLoader:
     """
-    Singleton class for loading and caching ESPN team data.
+    Per-dataset singleton for loading and caching ESPN team data.
+
+    ESPNDataLoader() is the men's Division I loader; ESPNDataLoader(dataset)
+    returns the one loader of another dataset (see Dataset). Each loader
+    compiles its own index and has its own load lock and TTL, while the
+    cleaning and matching code is shared.
 
     Implements lazy loading with 24-hour TTL cache.
     """
 
-    _instance: Optional['ESPNDataLoader'] = None
-    _teams_data: Optional[Dict] = None
+    _instances: Dict[Dataset, 'ESPNDataLoader'] = {}
+    _instances_lock = threading.Lock()
+    _load_lock: threading.Lock
+    dataset: Dataset = DEFAULT_DATASET
+    _snapshot: Optional[IndexSnapshot] = None
     _last_load_time: Optional[datetime] = None
-    _cache_ttl_hours: int = 24
+    _cache_ttl_hours: float = 24
+    _async_load_task: Optional['asyncio.Task'] = None
+    _shared_index: Optional[SharedIndex] = None
+    _shared_index_checked: float = 0.0
+    _shared_index_check_seconds: float = 1.0
+    _crosswalk: Optional[IdCrosswalk] = None
+
+    def __new__(cls, dataset=None):
+        """Singleton pattern implementation, one instance per dataset."""
+        dataset = resolve_dataset(dataset)
+        instance = cls._instances.get(dataset)
+        if instance is None:
+            with cls._instances_lock:
+                instance = cls._instances.get(dataset)
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance.dataset = dataset
+                    instance._load_lock = threading.Lock()
+                    cls._instances[dataset] = instance
+        return instance
+
+    def __init__(self, dataset=None):
+        """Initialize loader (only runs once per dataset due to singleton)."""
+        pass
 
-    def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    @classmethod
+    def detached(cls, dataset=None) -> 'ESPNDataLoader':
+        """
+        Create a private loader outside the per-dataset singletons.
 
-    def __init__(self):
-        """Initialize loader (only runs once due to singleton)."""
-        pass
+        Useful to serve a snapshot in one place (see parallel.normalize_file)
+        without replacing the data the process-wide loader holds.
+
+        Args:
+            dataset: Dataset the loader fetches (see resolve_dataset)
+
+        Returns:
+            New, empty ESPNDataLoader that ESPNDataLoader(dataset) never returns
+        """
+        instance = super().__new__(cls)
+        instance.dataset = resolve_dataset(dataset)
+        instance._load_lock = threading.Lock()
+        return instance
+
+    def set_cache_ttl(self, hours: float) -> None:
+        """Set how long this dataset's loaded data stays valid."""
+        self._cache_ttl_hours = hours
+
+    @property
+    def _teams_data(self) -> Optional[Mapping]:
+        """Lookup structure of the current snapshot, or None."""
+        snapshot = self._snapshot
+        return snapshot.data if snapshot is not None else None
+
+    def _publish(self, teams_data: Mapping) -> None:
+        """Atomically swap in a new snapshot of the lookup structure."""
+        self._last_load_time = datetime.now()
+        self._snapshot = IndexSnapshot(teams_data)
 
     def _is_cache_valid(self) -> bool:
-        """Check if cached data is still valid."""
+        """
+        Check if cached data is still valid.
+
+        An attached shared index is always valid: its writer owns freshness
+        and readers remap new versions (see attach_shared_index).
+        """
         if self._last_load_time is None or self._teams_data is None:
             return False
+        if self._shared_index is not None:
+            return True
 
         cache_age = datetime.now() - self._last_load_time
         return cache_age < timedelta(hours=self._cache_ttl_hours)
@@ -53,38 +218,283 @@ class ESPNDataLoader:
         if not force_refresh and self._is_cache_valid():
             return
 
-        # Try loading with retries
-        last_error = None
+        # Serialize loads so concurrent threads share one fetch
+        with self._load_lock:
+            if not force_refresh and self._is_cache_valid():
+                return  # Another thread finished loading while we waited
+            self._load_with_retries(max_retries)
+
+    def _load_with_retries(self, max_retries: int) -> None:
+        """Retry loop behind load_teams()."""
         for attempt in range(max_retries):
             try:
-                # Import here to avoid loading on module import
-                from sportsdataverse.mbb import espn_mbb_teams
+                teams_df = self._fetch_teams()
 
-                # Load Division I teams (groups=50 is D1)
-                teams_df = espn_mbb_teams(groups=50)
+                # Validates the response and builds the lookup structure
+                self.load_from_dataframe(teams_df)
 
-                if teams_df is None or teams_df.empty:
-                    raise DataLoadError("ESPN returned empty team data")
+                return  # Success!
 
-                # Store raw data and timestamp
-                self._raw_data = teams_df
-                self._last_load_time = datetime.now()
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    # Wait before retry (exponential backoff)
+                    time.sleep(2 ** attempt)
+                    continue
+                else:
+                    # Final attempt failed
+                    raise DataLoadError(f"Failed to load ESPN data after {max_retries} attempts: {str(e)}")
+
+    def warmup(self, snapshot_path: Optional[str] = None, freeze_gc: bool = True) -> None:
+        """
+        Load and compile team data up front, e.g. in a prefork master process.
+
+        Call before forking workers (gunicorn/uwsgi): children inherit the
+        loaded index and never fetch it themselves while it is within its TTL.
+        With freeze_gc, the index is moved to the GC's permanent generation
+        (gc.freeze) so collections in the children do not touch, and thereby
+        copy, the shared pages.
 
-                # Build optimized lookup structure
-                self._teams_data = self._build_lookup_dict(teams_df)
+        Args:
+            snapshot_path: Load from a snapshot file instead of ESPN
+            freeze_gc: If True, call gc.freeze() after loading
+
+        Raises:
+            DataLoadError: If data cannot be loaded
+        """
+        if snapshot_path is not None:
+            self.load_snapshot(snapshot_path)
+        else:
+            self.load_teams()
 
+        if freeze_gc:
+            gc.freeze()
+
+    def is_loaded(self) -> bool:
+        """
+        Check whether team data is loaded and within its TTL (or served
+        from an attached shared index).
+
+        Never triggers a load, so it is safe for health checks.
+        """
+        return self._is_cache_valid()
+
+    @property
+    def last_load_time(self) -> Optional[datetime]:
+        """When the current team data was loaded, or None."""
+        return self._last_load_time
+
+    async def load_teams_async(self, force_refresh: bool = False, max_retries: int = 3) -> None:
+        """
+        Load team data without blocking the running event loop.
+
+        The ESPN fetch and index build run in the loop's default executor and
+        retries back off with asyncio.sleep. Concurrent callers on the same
+        loop share a single in-flight load, which also holds the lock of
+        load_teams() so it never races a synchronous load.
+
+        Args:
+            force_refresh: If True, bypass cache and reload data
+            max_retries: Number of retry attempts on failure
+
+        Raises:
+            DataLoadError: If data cannot be loaded after retries
+        """
+        if not force_refresh and self._is_cache_valid():
+            return
+
+        loop = asyncio.get_running_loop()
+        task = self._async_load_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._load_teams_async(force_refresh, max_retries))
+            self._async_load_task = task
+
+        # Shield so one cancelled caller does not cancel the shared load
+        await asyncio.shield(task)
+
+    async def _load_teams_async(self, force_refresh: bool, max_retries: int) -> None:
+        """Retry loop behind load_teams_async()."""
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(max_retries):
+            try:
+                await loop.run_in_executor(None, self._load_once_locked, force_refresh)
                 return  # Success!
 
             except Exception as e:
-                last_error = e
                 if attempt < max_retries - 1:
                     # Wait before retry (exponential backoff)
-                    time.sleep(2 ** attempt)
+                    await asyncio.sleep(2 ** attempt)
                     continue
                 else:
-                    # Final attempt failed
                     raise DataLoadError(f"Failed to load ESPN data after {max_retries} attempts: {str(e)}")
 
+    def _load_once_locked(self, force_refresh: bool) -> None:
+        """One fetch-and-publish attempt under the load lock (executor side of load_teams_async)."""
+        with self._load_lock:
+            if not force_refresh and self._is_cache_valid():
+                return  # Another load finished while we waited
+            self.load_from_dataframe(self._fetch_teams())
+
+    def _fetch_teams(self):
+        """Fetch the raw team table of this loader's dataset from ESPN (single attempt)."""
+        # Import here to avoid loading on module import
+        module_name, function_name = TEAM_FETCHERS[self.dataset.sport, self.dataset.gender]
+        fetch = getattr(importlib.import_module(module_name), function_name)
+
+        # groups=50 is Division I
+        return fetch(groups=self.dataset.group)
+
+    def load_from_dataframe(self, teams_df) -> None:
+        """
+        Build the lookup structure from an already-fetched team table.
+
+        Useful for offline use (tests, benchmarks, snapshot creation) where
+        the ESPN-shaped DataFrame is obtained some other way.
+
+        Args:
+            teams_df: DataFrame with ESPN team columns (display_name, id, ...)
+
+        Raises:
+            DataLoadError: If the DataFrame is empty
+        """
+        if teams_df is None or teams_df.empty:
+            raise DataLoadError("ESPN returned empty team data")
+
+        # Build optimized lookup structure and publish it with the raw data
+        teams_data = self._build_lookup_dict(teams_df)
+        self._raw_data = teams_df
+        self._publish(teams_data)
+
+    def dump_snapshot(self, snapshot: Optional[IndexSnapshot] = None) -> bytes:
+        """
+        Serialize the compiled lookup structure.
+
+        Args:
+            snapshot: Snapshot to serialize (defaults to the current one)
+
+        Returns:
+            Snapshot bytes accepted by restore_snapshot()
+
+        Raises:
+            DataLoadError: If data cannot be loaded
+        """
+        data = (snapshot or self.get_snapshot()).data
+        payload = {
+            'format': SNAPSHOT_FORMAT,
+            'created_at': datetime.now().isoformat(),
+            # Materialize mapped views (shared index) into plain dicts
+            'teams_data': {
+                key: dict(value) if isinstance(value, Mapping) else value
+                for key, value in data.items()
+            },
+        }
+        return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore_snapshot(self, data: bytes) -> None:
+        """
+        Replace the cached lookup structure with one from dump_snapshot().
+
+        No network access is performed. Snapshots are pickles, so only
+        restore data produced by a trusted process.
+
+        Args:
+            data: Snapshot bytes
+
+        Raises:
+            DataLoadError: If the snapshot cannot be decoded
+        """
+        try:
+            payload = pickle.loads(data)
+        except (pickle.UnpicklingError, EOFError, ValueError) as e:
+            raise DataLoadError(f"Failed to decode team snapshot: {str(e)}")
+
+        if not isinstance(payload, dict) or payload.get('format') != SNAPSHOT_FORMAT:
+            raise DataLoadError("Unsupported team snapshot format")
+
+        self._raw_data = None
+        self._publish(payload['teams_data'])
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Write the compiled lookup structure to a snapshot file.
+
+        The file is written to a temporary path and renamed into place, so
+        readers never observe a partially written snapshot.
+
+        Args:
+            path: Destination file path
+
+        Raises:
+            DataLoadError: If data cannot be loaded
+        """
+        data = self.dump_snapshot()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def load_snapshot(self, path: str) -> None:
+        """
+        Load a compiled lookup structure written by save_snapshot().
+
+        Args:
+            path: Snapshot file path
+
+        Raises:
+            DataLoadError: If the snapshot is missing or unreadable
+        """
+        try:
+            with open(path, 'rb') as fh:
+                data = fh.read()
+        except OSError as e:
+            raise DataLoadError(f"Failed to load team snapshot {path}: {str(e)}")
+
+        self.restore_snapshot(data)
+
+    def attach_shared_index(self, path: str, check_seconds: float = 1.0) -> None:
+        """
+        Serve team data from a memory-mapped index file (see shared_index).
+
+        While attached, the file replaces ESPN as the data source: the TTL is
+        ignored, and get_team_lookup_dict() remaps the file when a writer
+        publishes a new version (checked at most every `check_seconds`).
+
+        Args:
+            path: Index file written by shared_index.publish_index()
+            check_seconds: Minimum interval between checks for a new version
+
+        Raises:
+            DataLoadError: If the file cannot be mapped
+        """
+        shared = SharedIndex(path)
+        self._shared_index = shared
+        self._shared_index_check_seconds = check_seconds
+        self._shared_index_checked = time.monotonic()
+        self._raw_data = None
+        self._publish(shared.lookup_dict())
+
+    def _refresh_shared_index(self) -> None:
+        """Pick up a newly published shared index file, if any."""
+        shared = self._shared_index
+        now = time.monotonic()
+        if shared is None or now - self._shared_index_checked < self._shared_index_check_seconds:
+            return
+        self._shared_index_checked = now
+
+        try:
+            refreshed = shared.refresh()
+        except DataLoadError:
+            return  # Keep serving the current version
+        if refreshed:
+            self._publish(shared.lookup_dict())
+
     def _build_lookup_dict(self, teams_df) -> Dict:
         """
         Build optimized lookup structure from raw ESPN data.
@@ -94,7 +504,17 @@ class ESPNDataLoader:
                 'by_name': {cleaned_name: team_info},
                 'by_abbrev': {abbreviation: team_info},
                 'by_id': {espn_id: team_info},
-                'all_names': [list of cleaned names for fuzzy matching]
+                'all_names': (tuple of cleaned names for fuzzy matching),
+                'typo_index': TypoIndex over all_names (typo fast path),
+                'sorted_names': all_names with words sorted (token_sort_ratio),
+                'by_alias': {alias: cleaned_name} from TEAM_ALIASES,
+                'by_acronym': {generated acronym: cleaned_name},
+                'ambiguous_acronyms': {acronym: [cleaned_name, ...]},
+                'by_phonetic': {phonetic_key: cleaned_name},
+                'by_nickname': {cleaned nickname: [cleaned_name, ...]},
+                'mentions': MentionAutomaton for extract_teams,
+                'by_history': NameHistory of HISTORICAL_NAMES (as_of lookups),
+                'completions': PrefixIndex for complete() typeahead
             }
         """
         by_name = {}
@@ -136,33 +556,251 @@ class ESPNDataLoader:
                 # Skip teams that fail cleaning
                 continue
 
+        by_alias = self._build_alias_index(by_name)
+        by_acronym, ambiguous_acronyms = self._build_acronym_index(by_name)
+        by_nickname = self._build_nickname_index(by_name)
+
         return {
             'by_name': by_name,
             'by_abbrev': by_abbrev,
             'by_id': by_id,
-            'all_names': all_names,
+            # Immutable so the whole index can be shared copy-on-write
+            'all_names': tuple(all_names),
+            'typo_index': TypoIndex(all_names),
+            'sorted_names': tuple(sort_tokens(name) for name in all_names),
+            'by_alias': by_alias,
+            'by_acronym': by_acronym,
+            'ambiguous_acronyms': ambiguous_acronyms,
+            'by_phonetic': self._build_phonetic_index(by_name, by_alias),
+            'by_nickname': by_nickname,
+            'mentions': build_mention_automaton(by_name, by_alias, by_abbrev, by_nickname),
+            'by_history': NameHistory(HISTORICAL_NAMES),
+            'completions': build_prefix_index(by_name, by_alias, by_abbrev, by_nickname),
         }
 
-    def get_team_lookup_dict(self) -> Dict:
+    @staticmethod
+    def _build_nickname_index(by_name: Dict) -> Dict:
         """
-        Get the optimized team lookup dictionary.
+        Map cleaned ESPN nicknames (mascots) to the teams that use them.
 
-        Lazy loads data on first call.
+        Used both to strip mascots the static suffix list does not know and
+        to resolve mascot-only input; nicknames shared by several teams
+        (e.g. "wildcats") list all of them so callers can flag ambiguity.
+
+        Args:
+            by_name: {cleaned_name: team_info} lookup
+
+        Returns:
+            {cleaned nickname: sorted list of cleaned canonical names}
+        """
+        owners: Dict[str, set] = {}
+        for cleaned_name, team_info in by_name.items():
+            nickname = team_info.get('nickname')
+            if not isinstance(nickname, str) or not nickname.strip():
+                continue
+            try:
+                cleaned_nickname = TextCleaner.clean(nickname, strip_suffixes=False)
+            except InvalidInputError:
+                continue
+            if cleaned_nickname:
+                owners.setdefault(cleaned_nickname, set()).add(cleaned_name)
+
+        return {nickname: sorted(names) for nickname, names in owners.items()}
+
+    @staticmethod
+    def _build_alias_index(by_name: Dict) -> Dict:
+        """
+        Resolve TEAM_ALIASES to cleaned canonical names once per load.
+
+        Aliases whose canonical name is not in the loaded data are skipped.
+
+        Args:
+            by_name: {cleaned_name: team_info} lookup
+
+        Returns:
+            {alias: cleaned canonical name}
+        """
+        index = {}
+        for alias, canonical_name in TEAM_ALIASES.items():
+            try:
+                cleaned_canonical = TextCleaner.clean(canonical_name)
+            except InvalidInputError:
+                continue
+            if cleaned_canonical in by_name:
+                index[alias] = cleaned_canonical
+        return index
+
+    @staticmethod
+    def _build_acronym_index(by_name: Dict):
+        """
+        Generate acronyms for every team (see acronyms.team_acronyms).
+
+        Acronyms generated for more than one team are dropped and recorded
+        as ambiguous. Hand-written aliases are matched first, so they
+        override generated acronyms.
+
+        Args:
+            by_name: {cleaned_name: team_info} lookup
 
         Returns:
-            Dictionary with by_name, by_abbrev, by_id, and all_names keys
+            ({acronym: cleaned canonical name},
+             {ambiguous acronym: sorted cleaned names of the colliding teams})
+        """
+        owners: Dict[str, set] = {}
+        for cleaned_name, team_info in by_name.items():
+            for acronym in team_acronyms(team_info):
+                owners.setdefault(acronym, set()).add(cleaned_name)
+
+        index = {}
+        ambiguous = {}
+        for acronym, names in owners.items():
+            if len(names) == 1:
+                index[acronym] = next(iter(names))
+            else:
+                ambiguous[acronym] = sorted(names)
+        return index, ambiguous
+
+    @staticmethod
+    def _build_phonetic_index(by_name: Dict, by_alias: Dict) -> Dict:
+        """
+        Map phonetic keys of canonical names and aliases to cleaned names.
+
+        Keys shared by more than one team are dropped rather than guessed.
+
+        Args:
+            by_name: {cleaned_name: team_info} lookup
+            by_alias: {alias: cleaned canonical name} lookup
+
+        Returns:
+            {phonetic_key: cleaned canonical name}
+        """
+        sources = [(name, name) for name in by_name]
+        sources.extend(by_alias.items())
+
+        index: Dict[str, str] = {}
+        ambiguous = set()
+        for name, cleaned_canonical in sources:
+            key = phonetic_key(name)
+            if not key or key in ambiguous:
+                continue
+            if index.setdefault(key, cleaned_canonical) != cleaned_canonical:
+                del index[key]
+                ambiguous.add(key)
+
+        return index
+
+    def get_snapshot(self) -> IndexSnapshot:
+        """
+        Get the current index snapshot.
+
+        Lazy loads data on first call (and after the TTL expires). Hold on to
+        the returned snapshot to see one consistent version across lookups.
+
+        Returns:
+            Current IndexSnapshot
 
         Raises:
             DataLoadError: If data cannot be loaded
         """
-        # Lazy load on first access
-        if self._teams_data is None or not self._is_cache_valid():
+        if self._shared_index is not None:
+            self._refresh_shared_index()
+        elif self._snapshot is None or not self._is_cache_valid():
+            # Lazy load on first access
             self.load_teams()
 
-        return self._teams_data
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise DataLoadError("No team data is loaded")
+        return snapshot
+
+    def get_team_lookup_dict(self) -> Mapping:
+        """
+        Get the optimized team lookup dictionary of the current snapshot.
+
+        Lazy loads data on first call.
+
+        Returns:
+            Read-only mapping with by_name, by_abbrev, by_id, and all_names keys
+
+        Raises:
+            DataLoadError: If data cannot be loaded
+        """
+        return self.get_snapshot().data
+
+    def load_crosswalk(self, source) -> None:
+        """
+        Load the ID crosswalk used for id_space= lookups and translate_ids.
+
+        The crosswalk is a local file, so it is kept across team data
+        reloads and only replaced by another call.
+
+        Args:
+            source: IdCrosswalk, or path of a CSV/JSON file (see IdCrosswalk.load)
+
+        Raises:
+            DataLoadError: If the file is missing or malformed
+        """
+        self._crosswalk = source if isinstance(source, IdCrosswalk) else IdCrosswalk.load(source)
+
+    @property
+    def crosswalk(self) -> Optional[IdCrosswalk]:
+        """The loaded ID crosswalk, or None."""
+        return self._crosswalk
 
     def clear_cache(self) -> None:
         """Clear cached data (useful for testing)."""
-        self._teams_data = None
+        self._snapshot = None
         self._last_load_time = None
         self._raw_data = None
+        self._shared_index = None
+        self._crosswalk = None
+
+
+def load_datasets(
+    datasets: Iterable,
+    force_refresh: bool = False,
+    max_retries: int = 3,
+    max_workers: Optional[int] = None,
+) -> Dict[Dataset, ESPNDataLoader]:
+    """
+    Load several datasets concurrently, one thread per dataset.
+
+    Each dataset's loader fetches and compiles independently, so a slow or
+    failing table does not hold up the others.
+
+    Args:
+        datasets: Datasets (see resolve_dataset)
+        force_refresh: If True, bypass each loader's cache and reload
+        max_retries: Number of retry attempts per dataset
+        max_workers: Thread pool size (defaults to one thread per dataset)
+
+    Returns:
+        {Dataset: loader}, in the order given
+
+    Raises:
+        ValueError: If a dataset is malformed or unsupported
+        DataLoadError: If any dataset cannot be loaded (after the others
+            have finished)
+    """
+    loaders = {}
+    for dataset in datasets:
+        loader = ESPNDataLoader(dataset)
+        loaders[loader.dataset] = loader
+    if not loaders:
+        return loaders
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(loaders)) as executor:
+        futures = {
+            dataset: executor.submit(loader.load_teams, force_refresh, max_retries)
+            for dataset, loader in loaders.items()
+        }
+        errors = []
+        for dataset, future in futures.items():
+            try:
+                future.result()
+            except DataLoadError as e:
+                errors.append(f"{'/'.join(map(str, dataset))}: {str(e)}")
+
+    if errors:
+        raise DataLoadError("Failed to load datasets: " + '; '.join(errors))
+    return loaders
@@ -14,6 +14,17 @@ class UnknownTeamError(TeamNormalizerError):
         super().__init__(f"No match found for team: {team_name}")
 
 
+class AmbiguousTeamError(UnknownTeamError):
+    """Raised when a team name (e.g. a shared mascot) fits several teams."""
+
+    def __init__(self, team_name: str, candidates):
+        self.team_name = team_name
+        self.candidates = list(candidates)
+        TeamNormalizerError.__init__(
+            self, f"Ambiguous team name: {team_name} (could be {', '.join(self.candidates)})"
+        )
+
+
 class DataLoadError(TeamNormalizerError):
     """Raised when ESPN data cannot be loaded."""
     pass
@@ -0,0 +1,139 @@
+"""Season-aware index of team names that changed meaning over time."""
+
+from bisect import bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .exceptions import InvalidInputError
+from .text_cleaner import TextCleaner
+
+# (first day, last day, ESPN team id or None), days as date ordinals
+Span = Tuple[int, int, Optional[str]]
+
+_OPEN_START = date.min.toordinal()
+_OPEN_END = date.max.toordinal()
+
+
+def as_of_ordinal(as_of) -> int:
+    """
+    Convert an as_of argument to a date ordinal.
+
+    Args:
+        as_of: date, datetime or ISO date string ('2016-03-17')
+
+    Returns:
+        Proleptic Gregorian ordinal of the day
+
+    Raises:
+        InvalidInputError: If the value is not a date or ISO date string
+    """
+    if isinstance(as_of, date):
+        return as_of.toordinal()
+    if isinstance(as_of, str):
+        try:
+            return date.fromisoformat(as_of.strip()[:10]).toordinal()
+        except ValueError:
+            pass
+    raise InvalidInputError(f"as_of must be a date or ISO date string, got {as_of!r}")
+
+
+class NameHistory:
+    """
+    Time-indexed name table: cleaned name -> ESPN team id over date ranges.
+
+    Each name keeps its ranges sorted by first day. Single lookups bisect
+    those; batches are sorted by date once and swept, so every name's
+    ranges are walked at most once per batch.
+    """
+
+    __slots__ = ('_starts', '_spans')
+
+    def __init__(self, entries: Iterable[Tuple[str, Optional[str], Optional[str], Optional[str]]]):
+        """
+        Compile a table of season-bounded names (see aliases.HISTORICAL_NAMES).
+
+        Args:
+            entries: (name, ESPN team id or None, first day, last day) tuples;
+                days are ISO date strings, None for open-ended
+
+        Raises:
+            ValueError: If an entry has a bad date or two ranges of the same
+                name overlap
+        """
+        spans: Dict[str, List[Span]] = {}
+        for name, team_id, start, end in entries:
+            try:
+                first = _OPEN_START if start is None else as_of_ordinal(start)
+                last = _OPEN_END if end is None else as_of_ordinal(end)
+            except InvalidInputError as e:
+                raise ValueError(f"Bad date range for {name!r}: {e}")
+            if first > last:
+                raise ValueError(f"Date range of {name!r} ends before it starts")
+            spans.setdefault(TextCleaner.clean(name), []).append(
+                (first, last, None if team_id is None else str(team_id))
+            )
+
+        for cleaned_name, name_spans in spans.items():
+            name_spans.sort()
+            for previous, current in zip(name_spans, name_spans[1:]):
+                if current[0] <= previous[1]:
+                    raise ValueError(f"Overlapping date ranges for {cleaned_name!r}")
+
+        self._spans = {name: tuple(name_spans) for name, name_spans in spans.items()}
+        self._starts = {name: tuple(span[0] for span in name_spans) for name, name_spans in spans.items()}
+
+    def __contains__(self, cleaned_name: str) -> bool:
+        return cleaned_name in self._spans
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def lookup(self, cleaned_name: str, day: int) -> Optional[Span]:
+        """
+        Range of a name covering a day.
+
+        Args:
+            cleaned_name: Cleaned team name
+            day: Date ordinal (see as_of_ordinal)
+
+        Returns:
+            (first day, last day, team id or None), or None if no range of
+            the name covers the day
+        """
+        starts = self._starts.get(cleaned_name)
+        if starts is None:
+            return None
+        position = bisect_right(starts, day) - 1
+        if position < 0:
+            return None
+        span = self._spans[cleaned_name][position]
+        return span if day <= span[1] else None
+
+    def sweep(self, queries: Sequence[Tuple[str, int]]) -> List[Optional[Span]]:
+        """
+        Look up many (cleaned name, day) pairs.
+
+        Queries are visited in date order while each name keeps a cursor
+        into its ranges; since the ranges of a name are disjoint and sorted,
+        a cursor only ever moves forward.
+
+        Args:
+            queries: (cleaned name, date ordinal) pairs in any order
+
+        Returns:
+            Covering range or None per query, in input order
+        """
+        results: List[Optional[Span]] = [None] * len(queries)
+        cursors: Dict[str, int] = {}
+        for index in sorted(range(len(queries)), key=lambda i: queries[i][1]):
+            cleaned_name, day = queries[index]
+            spans = self._spans.get(cleaned_name)
+            if spans is None:
+                continue
+            position = cursors.get(cleaned_name, 0)
+            while position < len(spans) and spans[position][1] < day:
+                position += 1
+            cursors[cleaned_name] = position
+            if position < len(spans) and spans[position][0] <= day:
+                results[index] = spans[position]
+        return results
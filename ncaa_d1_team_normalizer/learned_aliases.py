@@ -0,0 +1,184 @@
+"""SQLite store of fuzzy resolutions promoted to alias lookups."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Mapping, Tuple
+
+from .exceptions import DataLoadError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learned_aliases (
+    cleaned_name TEXT PRIMARY KEY,
+    team_id TEXT NOT NULL,
+    score REAL NOT NULL,
+    hits INTEGER NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+)
+"""
+
+# A name seen again for the same team counts another hit; a name resolved
+# to a different team (e.g. after a data reload) starts over. SQLite
+# evaluates every SET expression against the row as it was before the update.
+_UPSERT = """
+INSERT INTO learned_aliases (cleaned_name, team_id, score, hits, first_seen, last_seen)
+VALUES (?, ?, ?, 1, ?, ?)
+ON CONFLICT (cleaned_name) DO UPDATE SET
+    hits = CASE WHEN team_id = excluded.team_id THEN hits + 1 ELSE 1 END,
+    first_seen = CASE WHEN team_id = excluded.team_id THEN first_seen ELSE excluded.first_seen END,
+    score = excluded.score,
+    team_id = excluded.team_id,
+    last_seen = excluded.last_seen
+"""
+
+
+class LearnedAliasStore:
+    """
+    Local SQLite store of confirmed fuzzy resolutions.
+
+    Records cleaned name -> team id with the fuzzy score, how often the
+    resolution was seen, and when it was first and last seen. Names seen
+    often enough at a high enough score are promoted to a hashed index that
+    TeamNormalizer consults before fuzzy matching.
+
+    Safe to share between threads; separate processes may open the same
+    file (SQLite serializes the writes).
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) a store.
+
+        Args:
+            path: SQLite database file
+
+        Raises:
+            DataLoadError: If the database cannot be opened
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(path, check_same_thread=False, timeout=30)
+            with self._connection:
+                self._connection.execute(_SCHEMA)
+        except sqlite3.Error as e:
+            raise DataLoadError(f"Failed to open learned alias store {path}: {str(e)}")
+
+    def __enter__(self) -> 'LearnedAliasStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def record(self, cleaned_name: str, team_id: str, score: float) -> None:
+        """Record one fuzzy resolution (see record_many)."""
+        self.record_many([(cleaned_name, team_id, score)])
+
+    def record_many(self, resolutions: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        Record fuzzy resolutions in one transaction.
+
+        Args:
+            resolutions: (cleaned name, ESPN team id, fuzzy score) tuples
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (cleaned_name, str(team_id), float(score), now, now)
+            for cleaned_name, team_id, score in resolutions
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+
+    def promoted(self, min_score: float = 0.0, min_hits: int = 1) -> Dict[str, Tuple[str, float]]:
+        """
+        Resolutions that qualify for the hashed index.
+
+        Args:
+            min_score: Minimum recorded fuzzy score (0-100)
+            min_hits: Minimum number of times the resolution was seen
+
+        Returns:
+            {cleaned name: (ESPN team id, score)}
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT cleaned_name, team_id, score FROM learned_aliases"
+                " WHERE score >= ? AND hits >= ?",
+                (min_score, min_hits),
+            ).fetchall()
+        return {cleaned_name: (team_id, score) for cleaned_name, team_id, score in rows}
+
+    def entries(self) -> Dict[str, Dict]:
+        """
+        All recorded resolutions.
+
+        Returns:
+            {cleaned name: {'team_id', 'score', 'hits', 'first_seen', 'last_seen'}}
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT cleaned_name, team_id, score, hits, first_seen, last_seen"
+                " FROM learned_aliases ORDER BY cleaned_name"
+            ).fetchall()
+        return {
+            row[0]: dict(zip(('team_id', 'score', 'hits', 'first_seen', 'last_seen'), row[1:]))
+            for row in rows
+        }
+
+    def to_team_aliases(
+        self,
+        canonical_names: Mapping[str, str],
+        min_score: float = 0.0,
+        min_hits: int = 1,
+    ) -> Dict[str, str]:
+        """
+        Promoted resolutions in TEAM_ALIASES form, for review.
+
+        Args:
+            canonical_names: {ESPN team id: ESPN canonical name}; resolutions
+                to ids not listed are skipped
+            min_score: Minimum recorded fuzzy score (0-100)
+            min_hits: Minimum number of times the resolution was seen
+
+        Returns:
+            {cleaned name: ESPN canonical name}, sorted by name
+        """
+        promoted = self.promoted(min_score, min_hits)
+        return {
+            cleaned_name: canonical_names[team_id]
+            for cleaned_name, (team_id, _) in sorted(promoted.items())
+            if team_id in canonical_names
+        }
+
+    def export_json(self, canonical_names: Mapping[str, str], min_score: float = 0.0,
+                    min_hits: int = 1) -> str:
+        """Promoted resolutions as a JSON object (see to_team_aliases)."""
+        return json.dumps(self.to_team_aliases(canonical_names, min_score, min_hits), indent=4)
+
+    def export_python(self, canonical_names: Mapping[str, str], min_score: float = 0.0,
+                      min_hits: int = 1) -> str:
+        """
+        Promoted resolutions as TEAM_ALIASES entries to paste into aliases.py.
+
+        Each entry carries its score and hit count as a comment.
+        """
+        entries = self.entries()
+        lines = []
+        for cleaned_name, canonical_name in self.to_team_aliases(
+            canonical_names, min_score, min_hits
+        ).items():
+            entry = entries[cleaned_name]
+            lines.append(
+                f"    {cleaned_name!r}: {canonical_name!r},"
+                f"  # learned: score {entry['score']:.1f}, seen {entry['hits']}x"
+            )
+        return '\n'.join(lines) + '\n' if lines else ''
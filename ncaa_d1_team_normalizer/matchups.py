@@ -0,0 +1,82 @@
+"""Parsing of sportsbook matchup strings ("Duke @ North Carolina")."""
+
+import re
+from typing import NamedTuple, Tuple
+
+from .exceptions import InvalidInputError
+
+
+class Matchup(NamedTuple):
+    """A normalized game: ESPN ids of both teams and whether the site is neutral."""
+
+    away_id: str
+    home_id: str
+    neutral: bool
+
+
+# "A @ B" / "A at B": B is at home. "A vs. B", "A v B", "A - B": listed
+# away first, as US feeds do. Hyphens and "at"/"vs" must be separate words,
+# so hyphenated names such as "Bethune-Cookman" are never split.
+_SEPARATOR = re.compile(
+    r'\s*@\s*|\s+(?:at|vs\.?|v\.?|versus)\s+|\s+[-–—]\s+',
+    re.IGNORECASE,
+)
+
+# Site markers written next to a team or the whole line: (N) neutral,
+# (H) home, (A) away; "neutral site" / "neutral" anywhere also marks neutral
+_MARKER = re.compile(r'[(\[]\s*([nha])\s*[)\]]', re.IGNORECASE)
+_NEUTRAL_WORDS = re.compile(r'[(\[]?\bneutral(?:\s+site)?\b[)\]]?', re.IGNORECASE)
+
+# Left over around a side once markers are removed ("Baylor - Neutral Site")
+_SIDE_STRIP = ' \t-–—,;:'
+
+
+def parse_matchup(text: str) -> Tuple[str, str, bool]:
+    """
+    Split a matchup string into its away side, home side and neutral flag.
+
+    Examples:
+        "Duke @ North Carolina" -> ("Duke", "North Carolina", False)
+        "UConn vs. Marquette (N)" -> ("UConn", "Marquette", True)
+        "Miami (OH) - Kent St" -> ("Miami (OH)", "Kent St", False)
+        "Kansas (H) vs Duke" -> ("Duke", "Kansas", False)
+
+    Args:
+        text: Matchup string
+
+    Returns:
+        (away team text, home team text, neutral) with markers removed
+
+    Raises:
+        InvalidInputError: If the text is not a string or has no recognized
+            separator between two non-empty sides
+    """
+    if not isinstance(text, str):
+        raise InvalidInputError(f"Matchup must be a string, got {type(text).__name__}")
+
+    neutral = False
+    if _NEUTRAL_WORDS.search(text):
+        neutral = True
+        text = _NEUTRAL_WORDS.sub(' ', text)
+
+    parts = _SEPARATOR.split(text.strip(), maxsplit=1)
+    if len(parts) != 2:
+        raise InvalidInputError(f"Unrecognized matchup: {text!r}")
+
+    sides = []
+    markers = []
+    for part in parts:
+        found = {marker.lower() for marker in _MARKER.findall(part)}
+        neutral = neutral or 'n' in found
+        markers.append(found)
+        side = _MARKER.sub(' ', part).strip(_SIDE_STRIP)
+        if not side:
+            raise InvalidInputError(f"Unrecognized matchup: {text!r}")
+        sides.append(side)
+
+    away, home = sides
+    # An explicit marker overrides the order the teams are listed in
+    if 'h' in markers[0] or 'a' in markers[1]:
+        away, home = home, away
+
+    return away, home, neutral
@@ -0,0 +1,183 @@
+"""Aho-Corasick automaton for extracting team mentions from free text."""
+
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .exceptions import InvalidInputError
+from .text_cleaner import TextCleaner
+
+# Pattern sources, highest priority first; a higher-priority source wins a
+# phrase claimed by several (the method is reported as match_method)
+SOURCES = ('exact', 'alias', 'abbreviation', 'nickname')
+
+# (first word index, last word index, cleaned team name, match method)
+Mention = Tuple[int, int, str, str]
+
+
+class MentionAutomaton:
+    """
+    Word-level Aho-Corasick automaton over team name phrases.
+
+    Phrases are sequences of cleaned words (see TextCleaner.tokenize), so
+    matches always fall on word boundaries and one pass over a document's
+    words finds every phrase occurrence, however many phrases are indexed.
+    """
+
+    __slots__ = ('_goto', '_fail', '_output')
+
+    def __init__(self, phrases: Mapping[Tuple[str, ...], Tuple[str, str]]):
+        """
+        Build the automaton.
+
+        Args:
+            phrases: {tuple of cleaned words: (cleaned team name, match method)}
+        """
+        # State 0 is the root; _output[state] lists (phrase length, payload)
+        # for every phrase ending at the state, including via failure links
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[Tuple[int, Tuple[str, str]]]] = [[]]
+
+        for words, payload in phrases.items():
+            state = 0
+            for word in words:
+                next_state = goto[state].get(word)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][word] = next_state
+                    goto.append({})
+                    output.append([])
+                state = next_state
+            output[state].append((len(words), payload))
+
+        # Breadth-first failure links
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for word, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and word not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(word, 0)
+                output[child].extend(output[fail[child]])
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def find(
+        self,
+        words: Iterable[str],
+        accept: Optional[Callable[[int, int, str], bool]] = None,
+    ) -> List[Mention]:
+        """
+        Find non-overlapping phrase occurrences, leftmost-longest first.
+
+        Args:
+            words: Cleaned words of a document
+            accept: Optional filter called with (first word index, last word
+                index, match method); rejected occurrences do not block
+                overlapping ones
+
+        Returns:
+            List of (first word index, last word index, cleaned team name,
+            match method) ordered by position
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        found = []
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for length, payload in output[state]:
+                first = position - length + 1
+                if accept is None or accept(first, position, payload[1]):
+                    found.append((first, position, payload))
+
+        if not found:
+            return []
+
+        # Leftmost start wins, then the longest phrase starting there
+        found.sort(key=lambda match: (match[0], -match[1]))
+        mentions = []
+        covered = -1
+        for first, last, (cleaned_name, method) in found:
+            if first > covered:
+                mentions.append((first, last, cleaned_name, method))
+                covered = last
+        return mentions
+
+
+def _phrase(text: str) -> Optional[Tuple[str, ...]]:
+    """Cleaned words of a name, or None if nothing is left after cleaning."""
+    try:
+        words = tuple(TextCleaner.clean(text, strip_suffixes=False).split())
+    except InvalidInputError:
+        return None
+    return words or None
+
+
+def build_mention_automaton(
+    by_name: Mapping,
+    by_alias: Mapping,
+    by_abbrev: Mapping,
+    by_nickname: Mapping,
+) -> MentionAutomaton:
+    """
+    Build the mention automaton from a snapshot's lookup sections.
+
+    Indexes display names (cleaned, as written, and followed by the ESPN
+    nickname, e.g. "duke blue devils"), aliases, ESPN abbreviations and mascots used
+    by a single team. A phrase claimed by several teams from the same source
+    is left out rather than guessed.
+
+    Args:
+        by_name: {cleaned_name: team_info}
+        by_alias: {alias: cleaned canonical name}
+        by_abbrev: {lowercase abbreviation: team_info}
+        by_nickname: {cleaned nickname: [cleaned_name, ...]}
+
+    Returns:
+        MentionAutomaton whose payloads are (cleaned team name, match method)
+    """
+    claims: Dict[Tuple[str, ...], Tuple[int, Optional[str]]] = {}
+
+    def claim(words: Optional[Tuple[str, ...]], cleaned_name: str, source: str) -> None:
+        if not words:
+            return
+        rank = SOURCES.index(source)
+        previous = claims.get(words)
+        if previous is None or rank < previous[0]:
+            claims[words] = (rank, cleaned_name)
+        elif rank == previous[0] and previous[1] != cleaned_name:
+            claims[words] = (rank, None)  # Ambiguous within its source
+
+    name_by_id = {}
+    for cleaned_name, team_info in by_name.items():
+        name_by_id[team_info['team_id']] = cleaned_name
+        claim(tuple(cleaned_name.split()), cleaned_name, 'exact')
+        claim(_phrase(team_info['display_name']), cleaned_name, 'exact')
+        nickname = team_info.get('nickname')
+        if isinstance(nickname, str) and nickname.strip():
+            claim(_phrase(f"{team_info['display_name']} {nickname}"), cleaned_name, 'exact')
+
+    for alias, cleaned_name in by_alias.items():
+        claim(_phrase(alias), cleaned_name, 'alias')
+
+    for abbreviation, team_info in by_abbrev.items():
+        cleaned_name = name_by_id.get(team_info['team_id'])
+        if cleaned_name is not None:
+            claim(_phrase(abbreviation), cleaned_name, 'abbreviation')
+
+    for nickname, cleaned_names in by_nickname.items():
+        if len(cleaned_names) == 1:
+            claim(_phrase(nickname), cleaned_names[0], 'nickname')
+
+    return MentionAutomaton({
+        words: (cleaned_name, SOURCES[rank])
+        for words, (rank, cleaned_name) in claims.items()
+        if cleaned_name is not None
+    })
@@ -0,0 +1,356 @@
+"""Multi-process normalization of large inputs."""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .aliases import SOURCE_ALIASES, register_source_aliases
+from .data_loader import ESPNDataLoader, IndexSnapshot
+from .team_matcher import TeamNormalizer
+from .exceptions import InvalidInputError
+
+# Columns written for every input row by normalize_file()
+OUTPUT_COLUMNS = ['input', 'canonical_name', 'espn_id', 'confidence', 'match_method']
+
+# Per-process normalizer created by _init_worker() or _init_batch_worker()
+_worker_normalizer: Optional[TeamNormalizer] = None
+
+
+def _snapshot_normalizer(snapshot_path: str, fuzzy_threshold: int) -> TeamNormalizer:
+    """Normalizer serving a snapshot file through its own detached loader."""
+    loader = ESPNDataLoader.detached()
+    loader.load_snapshot(snapshot_path)
+    normalizer = TeamNormalizer(fuzzy_threshold=fuzzy_threshold)
+    normalizer._data_loader = loader
+    return normalizer
+
+
+def _init_worker(snapshot_path: str, fuzzy_threshold: int) -> None:
+    """Load the compiled team index from a snapshot once per worker process."""
+    global _worker_normalizer
+    _worker_normalizer = _snapshot_normalizer(snapshot_path, fuzzy_threshold)
+
+
+def _init_batch_worker(snapshot: bytes, match_config: Dict, cache_size: int) -> None:
+    """Restore the serialized team index once per worker process."""
+    global _worker_normalizer
+    ESPNDataLoader(match_config['dataset']).restore_snapshot(snapshot)
+    _worker_normalizer = TeamNormalizer(cache_size=cache_size, **match_config)
+
+
+def _current_worker_normalizer() -> TeamNormalizer:
+    """The normalizer set up by this worker's initializer."""
+    if _worker_normalizer is None:
+        raise RuntimeError("Worker process was not initialized")
+    return _worker_normalizer
+
+
+def _normalize_chunk(
+    team_names: List[str],
+    source: Optional[str] = None,
+    source_aliases: Optional[Mapping[str, str]] = None,
+) -> List[Optional[dict]]:
+    """
+    Normalize a shard of distinct team names inside a worker process.
+
+    The parent's overlay for `source` is shipped with every chunk, since
+    overlays registered after the pool started are not in the worker.
+    """
+    if source is not None and source_aliases is not None and SOURCE_ALIASES.get(source) != source_aliases:
+        register_source_aliases(source, source_aliases)
+    return _current_worker_normalizer()._resolve_batch(team_names, source)
+
+
+def _format_row(normalizer: TeamNormalizer, line: str) -> str:
+    """Normalize one input line and format it as a tab-separated output row."""
+    name = line.strip()
+    try:
+        result = normalizer.normalize(name)
+    except InvalidInputError:
+        result = None
+
+    if result is None:
+        return f"{name}\t\t\t\t"
+
+    return '\t'.join([
+        name,
+        result['canonical_name'],
+        result['espn_id'],
+        f"{result['confidence']:.1f}",
+        result['match_method'],
+    ])
+
+
+def _process_range(input_path: str, start: int, end: int,
+                   normalizer: Optional[TeamNormalizer] = None) -> bytes:
+    """
+    Normalize every line in the byte range [start, end) of the input file.
+
+    Runs inside a worker process (with the worker's normalizer) unless a
+    normalizer is given; returns the encoded output rows for the range so
+    the parent only has to write them out in order.
+    """
+    normalizer = normalizer or _current_worker_normalizer()
+    with open(input_path, 'rb') as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunk = mm[start:end]
+
+    # Split on '\n' only, as split_ranges does (splitlines() would also
+    # split on form feeds, U+2028 and the like and add output rows)
+    lines = chunk.decode('utf-8').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    rows = [_format_row(normalizer, line.rstrip('\r')) for line in lines]
+    if not rows:
+        return b''
+    return ('\n'.join(rows) + '\n').encode('utf-8')
+
+
+def split_ranges(mm, n_chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split a mapped file into byte ranges that end on newline boundaries.
+
+    Args:
+        mm: Memory-mapped (or bytes-like) file contents
+        n_chunks: Desired number of ranges
+
+    Returns:
+        List of (start, end) offsets covering the whole file, in order
+    """
+    size = len(mm)
+    if size == 0:
+        return []
+
+    n_chunks = max(1, n_chunks)
+    target = max(1, size // n_chunks)
+
+    ranges = []
+    start = 0
+    while start < size:
+        end = min(start + target, size)
+        if end < size:
+            newline = mm.find(b'\n', end - 1)
+            end = size if newline == -1 else newline + 1
+        ranges.append((start, end))
+        start = end
+
+    return ranges
+
+
+def normalize_file(
+    input_path: str,
+    output_path: str,
+    snapshot_path: str,
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    fuzzy_threshold: int = 85,
+) -> int:
+    """
+    Normalize a file with one team name per line using a process pool.
+
+    The input is memory-mapped and split at newline boundaries; each byte
+    range is normalized in a worker that loads the compiled team index from
+    `snapshot_path` (see ESPNDataLoader.save_snapshot) instead of ESPN.
+    Output rows are tab-separated (see OUTPUT_COLUMNS) and written in input
+    order. Unmatched or blank lines produce a row with empty match columns.
+
+    Args:
+        input_path: UTF-8 text file, one team name per line
+        output_path: Destination for tab-separated results
+        snapshot_path: Team index snapshot to load in each worker
+        workers: Number of worker processes (defaults to os.cpu_count())
+        chunks_per_worker: Byte ranges per worker, for load balancing
+        fuzzy_threshold: Minimum fuzzy match score (0-100)
+
+    Returns:
+        Number of rows written
+    """
+    workers = workers or os.cpu_count() or 1
+
+    with open(input_path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            ranges = []
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                ranges = split_ranges(mm, workers * chunks_per_worker)
+
+    rows = 0
+    with open(output_path, 'wb') as out:
+        if workers == 1:
+            # Same code path as the workers, without process start-up cost,
+            # and leaving the caller's ESPNDataLoader() untouched
+            normalizer = _snapshot_normalizer(snapshot_path, fuzzy_threshold)
+            blobs = (_process_range(input_path, start, end, normalizer) for start, end in ranges)
+            for blob in blobs:
+                out.write(blob)
+                rows += blob.count(b'\n')
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(snapshot_path, fuzzy_threshold),
+            ) as executor:
+                starts = [start for start, _ in ranges]
+                ends = [end for _, end in ranges]
+                # map() yields results in submission order
+                for blob in executor.map(_process_range, [input_path] * len(ranges), starts, ends):
+                    out.write(blob)
+                    rows += blob.count(b'\n')
+
+    return rows
+
+
+class ParallelTeamNormalizer(TeamNormalizer):
+    """
+    TeamNormalizer whose normalize_batch shards distinct names across processes.
+
+    Workers are started lazily on the first large batch. Each restores the
+    compiled team index from a serialized snapshot (no ESPN refetch) and keeps
+    its own result cache for the lifetime of the pool; the pool is restarted
+    when the parent's index moves to a new snapshot version. Batches with
+    fewer than `min_parallel_size` distinct names run in-process.
+
+    Use as a context manager, or call close(), to shut the pool down.
+    """
+
+    def __init__(
+        self,
+        fuzzy_threshold: int = 85,
+        raise_on_no_match: bool = False,
+        cache_size: int = 10000,
+        phonetic: bool = False,
+        scorer: str = 'ratio',
+        prefilter: Optional[str] = None,
+        prefilter_cutoff: float = 50,
+        learned_aliases: Optional[str] = None,
+        learn_threshold: float = 95,
+        promote_hits: int = 2,
+        dataset=None,
+        workers: Optional[int] = None,
+        min_parallel_size: int = 5000,
+        chunk_size: int = 2000,
+    ):
+        """
+        Initialize the normalizer.
+
+        Args:
+            fuzzy_threshold: Minimum fuzzy match score (0-100)
+            raise_on_no_match: If True, raise UnknownTeamError when no match found
+            cache_size: Result cache size, in-process and per worker
+            phonetic: If True, match sound-alike spellings by phonetic key
+            scorer: Fuzzy scorer name (see TeamNormalizer)
+            prefilter: Optional cheaper scorer that narrows fuzzy candidates
+            prefilter_cutoff: Minimum prefilter score (0-100) to be rescored
+            learned_aliases: Optional learned alias store (SQLite) path
+            learn_threshold: Minimum fuzzy score (0-100) recorded or promoted
+            promote_hits: Times a resolution must be seen before promotion
+            dataset: Team table to match against (see TeamNormalizer)
+            workers: Number of worker processes (defaults to os.cpu_count())
+            min_parallel_size: Minimum distinct names before using the pool
+            chunk_size: Distinct names sent to a worker per task
+        """
+        super().__init__(
+            fuzzy_threshold=fuzzy_threshold,
+            raise_on_no_match=raise_on_no_match,
+            cache_size=cache_size,
+            phonetic=phonetic,
+            scorer=scorer,
+            prefilter=prefilter,
+            prefilter_cutoff=prefilter_cutoff,
+            learned_aliases=learned_aliases,
+            learn_threshold=learn_threshold,
+            promote_hits=promote_hits,
+            dataset=dataset,
+        )
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_size = min_parallel_size
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Version of the snapshot the running pool was started with
+        self._executor_version: Optional[int] = None
+
+    def _get_executor(self, snapshot: IndexSnapshot) -> ProcessPoolExecutor:
+        """
+        Get a worker pool serving `snapshot`.
+
+        The pool is (re)started, shipping the snapshot to every worker, when
+        none is running or the running one was started with an older version.
+        """
+        if self._executor is not None and self._executor_version != snapshot.version:
+            self._shutdown_pool()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_batch_worker,
+                initargs=(self._data_loader.dump_snapshot(snapshot), self._match_config(), self.cache_size),
+            )
+            self._executor_version = snapshot.version
+        return self._executor
+
+    def normalize_batch(self, team_names: List[str], source: Optional[str] = None,
+                        as_of=None, id_space: Optional[str] = None) -> List[Optional[Dict]]:
+        """
+        Normalize multiple team names, in parallel when the batch is large.
+
+        Source hit counters only cover batches resolved in this process.
+        Dated batches (as_of) always run in-process.
+
+        Args:
+            team_names: List of team names to normalize
+            source: Optional provider key (see TeamNormalizer.normalize)
+            as_of: Optional date(s) the names were used on (see
+                TeamNormalizer.normalize_batch)
+            id_space: Optional crosswalk id space added to every result
+
+        Returns:
+            List of match results (same order as input)
+
+        Raises:
+            InvalidInputError: If any input fails validation
+            UnknownTeamError: If raise_on_no_match=True and a name has no match
+        """
+        for name in team_names:
+            self._validate_input(name)
+
+        unique_names = list(dict.fromkeys(team_names))
+        if self.workers <= 1 or len(unique_names) < self.min_parallel_size or as_of is not None:
+            return super().normalize_batch(team_names, source, as_of, id_space)
+        crosswalk = None if id_space is None else self._crosswalk(id_space)
+
+        executor = self._get_executor(self._data_loader.get_snapshot())
+        chunks = [unique_names[i:i + self.chunk_size]
+                  for i in range(0, len(unique_names), self.chunk_size)]
+
+        resolved: Dict[str, Optional[Dict]] = {}
+        source_aliases = dict(SOURCE_ALIASES[source]) if source in SOURCE_ALIASES else None
+        outputs = executor.map(_normalize_chunk, chunks, repeat(source), repeat(source_aliases))
+        for chunk, chunk_results in zip(chunks, outputs):
+            resolved.update(zip(chunk, chunk_results))
+
+        results = []
+        for name in team_names:
+            result = resolved[name]
+            if result is None and self.raise_on_no_match:
+                raise self._no_match_error(name)
+            results.append(dict(result) if result else None)
+
+        if crosswalk is not None and id_space is not None:
+            self._add_space_ids(results, crosswalk, id_space)
+        return results
+
+    def _shutdown_pool(self) -> None:
+        """Shut down the worker pool, if started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_version = None
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the learned alias store."""
+        self._shutdown_pool()
+        super().close()
+
+    def __enter__(self) -> 'ParallelTeamNormalizer':
+        return self
@@ -0,0 +1,132 @@
+"""Metaphone phonetic keys for sound-alike team name matching."""
+
+VOWELS = frozenset('AEIOU')
+FRONT_VOWELS = frozenset('EIY')
+
+# Initial letter pairs whose first letter is silent
+SILENT_INITIALS = ('AE', 'GN', 'KN', 'PN', 'WR')
+
+# Keys shorter than this (spaces excluded) are too unspecific to index
+MIN_KEY_LENGTH = 3
+
+
+def metaphone(word: str) -> str:
+    """
+    Metaphone key of a single word (Lawrence Philips' original rules).
+
+    Examples:
+        "gonzaga" -> "KNSK", "gonzoga" -> "KNSK"
+        "xavier" -> "SFR", "zavier" -> "SFR"
+
+    Args:
+        word: Word to encode (non-letters are ignored)
+
+    Returns:
+        Uppercase key; '0' stands for "th"
+    """
+    w = ''.join(ch for ch in word.upper() if 'A' <= ch <= 'Z')
+    if not w:
+        return ''
+
+    if w[:2] in SILENT_INITIALS:
+        w = w[1:]
+    elif w[0] == 'X':
+        w = 'S' + w[1:]
+    elif w[:2] == 'WH':
+        w = 'W' + w[2:]
+
+    def at(i: int) -> str:
+        return w[i] if 0 <= i < len(w) else ''
+
+    key = []
+    for i, ch in enumerate(w):
+        prev, nxt = at(i - 1), at(i + 1)
+
+        # Doubled letters encode once (except C, e.g. "accent")
+        if ch == prev and ch != 'C':
+            continue
+
+        if ch in VOWELS:
+            if i == 0:
+                key.append(ch)
+        elif ch == 'B':
+            if not (prev == 'M' and i == len(w) - 1):
+                key.append('B')
+        elif ch == 'C':
+            if nxt == 'I' and at(i + 2) == 'A':
+                key.append('X')
+            elif nxt == 'H':
+                key.append('K' if prev == 'S' else 'X')
+            elif nxt in FRONT_VOWELS:
+                if prev != 'S':
+                    key.append('S')
+            else:
+                key.append('K')
+        elif ch == 'D':
+            if nxt == 'G' and at(i + 2) in FRONT_VOWELS:
+                key.append('J')
+            else:
+                key.append('T')
+        elif ch == 'G':
+            if nxt == 'H' and at(i + 2) and at(i + 2) not in VOWELS:
+                continue  # "night"
+            if nxt == 'N' and (i + 2 == len(w) or w[i + 2:] == 'ED'):
+                continue  # "sign", "signed"
+            if nxt in FRONT_VOWELS and prev != 'G':
+                key.append('J')
+            else:
+                key.append('K')
+        elif ch == 'H':
+            if prev in 'CSPTG' and prev:
+                continue  # Part of a digraph handled by the previous letter
+            if prev in VOWELS and nxt not in VOWELS:
+                continue
+            key.append('H')
+        elif ch == 'K':
+            if prev != 'C':
+                key.append('K')
+        elif ch == 'P':
+            key.append('F' if nxt == 'H' else 'P')
+        elif ch == 'Q':
+            key.append('K')
+        elif ch == 'S':
+            if nxt == 'H' or (nxt == 'I' and at(i + 2) in ('O', 'A')):
+                key.append('X')
+            else:
+                key.append('S')
+        elif ch == 'T':
+            if nxt == 'I' and at(i + 2) in ('O', 'A'):
+                key.append('X')
+            elif nxt == 'H':
+                key.append('0')
+            elif not (nxt == 'C' and at(i + 2) == 'H'):
+                key.append('T')
+        elif ch == 'V':
+            key.append('F')
+        elif ch in 'WY':
+            if nxt in VOWELS:
+                key.append(ch)
+        elif ch == 'X':
+            key.append('KS')
+        elif ch == 'Z':
+            key.append('S')
+        else:
+            key.append(ch)  # F, J, L, M, N, R
+
+    return ''.join(key)
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Phonetic key of a cleaned multi-word name (word keys joined by spaces).
+
+    Args:
+        text: Cleaned team name
+
+    Returns:
+        Key string, or '' if the name is too short to key reliably
+    """
+    key = ' '.join(filter(None, (metaphone(word) for word in text.split())))
+    if len(key.replace(' ', '')) < MIN_KEY_LENGTH:
+        return ''
+    return key
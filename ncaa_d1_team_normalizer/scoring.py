@@ -0,0 +1,53 @@
+"""Fuzzy scorers available to TeamNormalizer's fuzzy stage."""
+
+from typing import Callable, NamedTuple
+
+from rapidfuzz import fuzz
+
+
+def sort_tokens(text: str) -> str:
+    """Sort the words of a cleaned name ("state michigan" -> "michigan state")."""
+    return ' '.join(sorted(text.split()))
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+class Scorer(NamedTuple):
+    """
+    How to score a query against the snapshot's choices.
+
+    Attributes:
+        choices: Key of the precomputed choice tuple in the lookup structure
+        prepare: Applied to the query so it matches the choices' form
+        score: rapidfuzz scorer run on the prepared query and choices
+    """
+
+    choices: str
+    prepare: Callable[[str], str]
+    score: Callable
+
+
+# token_sort_ratio is fuzz.ratio over token-sorted strings, so its choices are
+# sorted once when the index is built instead of on every comparison
+SCORERS = {
+    'ratio': Scorer('all_names', _identity, fuzz.ratio),
+    'token_sort_ratio': Scorer('sorted_names', sort_tokens, fuzz.ratio),
+    'token_set_ratio': Scorer('all_names', _identity, fuzz.token_set_ratio),
+    'partial_ratio': Scorer('all_names', _identity, fuzz.partial_ratio),
+    'WRatio': Scorer('all_names', _identity, fuzz.WRatio),
+}
+
+
+def get_scorer(name: str) -> Scorer:
+    """
+    Look up a scorer by name.
+
+    Raises:
+        ValueError: If the name is not in SCORERS
+    """
+    try:
+        return SCORERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown scorer {name!r}; expected one of {', '.join(SCORERS)}")
@@ -0,0 +1,236 @@
+"""
+Local HTTP normalization service (standard library only).
+
+Run with: python -m ncaa_d1_team_normalizer.server --port 8080
+
+Endpoints (JSON in, JSON out):
+    POST /normalize         {"name": "UConn"}       -> {"result": {...} | null}
+    POST /normalize/batch   {"names": ["UConn"]}    -> {"results": [...]}
+    GET  /health            200 when team data is loaded, 503 otherwise
+    GET  /metrics           request counters, latency and cache size
+"""
+
+import argparse
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from .data_loader import ESPNDataLoader
+from .team_matcher import TeamNormalizer
+from .exceptions import DataLoadError, InvalidInputError
+
+# Reject request bodies larger than this many bytes
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class ServerMetrics:
+    """Thread-safe request counters for the /metrics endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._requests: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._latency: Dict[str, float] = {}
+        self._names = 0
+
+    def record(self, endpoint: str, seconds: float, names: int = 0, error: bool = False) -> None:
+        """Record one handled request."""
+        with self._lock:
+            self._requests[endpoint] = self._requests.get(endpoint, 0) + 1
+            self._latency[endpoint] = self._latency.get(endpoint, 0.0) + seconds
+            self._names += names
+            if error:
+                self._errors[endpoint] = self._errors.get(endpoint, 0) + 1
+
+    def snapshot(self) -> Dict:
+        """Return a JSON-serializable view of the counters."""
+        with self._lock:
+            return {
+                'uptime_seconds': round(time.time() - self._started, 3),
+                'names_normalized': self._names,
+                'requests': dict(self._requests),
+                'errors': dict(self._errors),
+                'mean_latency_ms': {
+                    endpoint: round(1000 * total / self._requests[endpoint], 4)
+                    for endpoint, total in self._latency.items()
+                },
+            }
+
+
+class NormalizationServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server sharing one TeamNormalizer across all requests.
+
+    All handler threads use the same in-memory team index and result cache.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, server_address: Tuple[str, int], normalizer: Optional[TeamNormalizer] = None):
+        """
+        Initialize the server.
+
+        Args:
+            server_address: (host, port) to bind; port 0 picks a free port
+            normalizer: Shared normalizer (default: TeamNormalizer()); misses
+                are reported as null results, so raise_on_no_match is ignored
+        """
+        super().__init__(server_address, NormalizationRequestHandler)
+        self.normalizer = normalizer if normalizer is not None else TeamNormalizer()
+        # The normalizer's own loader, so /health and warm() follow its dataset
+        self.data_loader = self.normalizer._data_loader
+        self.metrics = ServerMetrics()
+
+    def warm(self) -> None:
+        """Load team data in a background thread so /health turns ready."""
+        def load():
+            try:
+                self.data_loader.load_teams()
+            except DataLoadError:
+                pass  # /health stays 503; the next request retries the load
+
+        threading.Thread(target=load, name='NormalizationServer-warm', daemon=True).start()
+
+
+class NormalizationRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for NormalizationServer (HTTP/1.1 keep-alive)."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+    server: NormalizationServer
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+        pass
+
+    def _send_json(self, status: HTTPStatus, payload: Dict) -> None:
+        """Write a JSON response with an explicit Content-Length."""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        """Read and decode the JSON request body."""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be delimited, so the connection cannot be reused
+            self.close_connection = True
+            raise InvalidInputError("Invalid Content-Length header")
+        if length > MAX_BODY_BYTES:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            raise InvalidInputError("Request body too large")
+        try:
+            return json.loads(self.rfile.read(length) or b'null')
+        except (ValueError, UnicodeDecodeError):
+            raise InvalidInputError("Request body must be valid JSON")
+
+    def _matches(self, names):
+        """Normalize names without raising on misses."""
+        normalizer = self.server.normalizer
+        for name in names:
+            normalizer._validate_input(name)
+        return [dict(r) if r else None for r in normalizer._resolve_batch(names)]
+
+    def do_GET(self):
+        """Handle /health and /metrics."""
+        started = time.perf_counter()
+
+        if self.path == '/health':
+            loader = self.server.data_loader
+            ready = loader.is_loaded()
+            last_load = loader.last_load_time
+            self._send_json(
+                HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE,
+                {
+                    'status': 'ok' if ready else 'loading',
+                    'ready': ready,
+                    'last_load_time': last_load.isoformat() if ready and last_load else None,
+                },
+            )
+        elif self.path == '/metrics':
+            metrics = self.server.metrics.snapshot()
+            metrics['result_cache_size'] = len(self.server.normalizer._result_cache)
+            self._send_json(HTTPStatus.OK, metrics)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {self.path}"})
+            return
+
+        self.server.metrics.record(self.path, time.perf_counter() - started)
+
+    def do_POST(self):
+        """Handle /normalize and /normalize/batch."""
+        started = time.perf_counter()
+        endpoint = self.path
+        names = 0
+
+        try:
+            payload = self._read_json()
+            if endpoint == '/normalize':
+                name = payload.get('name') if isinstance(payload, dict) else None
+                response = {'result': self._matches([name])[0]}
+                names = 1
+            elif endpoint == '/normalize/batch':
+                batch = payload.get('names') if isinstance(payload, dict) else None
+                if not isinstance(batch, list):
+                    raise InvalidInputError("'names' must be a list")
+                response = {'results': self._matches(batch)}
+                names = len(batch)
+            else:
+                self._send_json(HTTPStatus.NOT_FOUND, {'error': f"Unknown path: {endpoint}"})
+                return
+        except InvalidInputError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {'error': str(e)})
+            self.server.metrics.record(endpoint, time.perf_counter() - started, error=True)
+            return
+        except DataLoadError as e:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {'error': str(e)})
+            self.server.metrics.record(endpoint, time.perf_counter() - started, error=True)
+            return
+
+        self._send_json(HTTPStatus.OK, response)
+        self.server.metrics.record(endpoint, time.perf_counter() - started, names=names)
+
+
+def main(argv=None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Serve team name normalization over HTTP.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--fuzzy-threshold', type=int, default=85)
+    parser.add_argument('--cache-size', type=int, default=100000)
+    parser.add_argument('--snapshot', help="Load the team index from a snapshot instead of ESPN")
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        ESPNDataLoader().load_snapshot(args.snapshot)
+
+    server = NormalizationServer(
+        (args.host, args.port),
+        TeamNormalizer(fuzzy_threshold=args.fuzzy_threshold, cache_size=args.cache_size),
+    )
+    server.warm()
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
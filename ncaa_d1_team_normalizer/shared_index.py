@@ -0,0 +1,307 @@
+"""Read-only memory-mapped team index shared by processes on one host."""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator
+
+from .aliases import HISTORICAL_NAMES
+from .completion import build_prefix_index
+from .history import NameHistory
+from .mentions import build_mention_automaton
+from .scoring import sort_tokens
+from .typo_index import TypoIndex
+from .exceptions import DataLoadError
+
+MAGIC = b'NCAAIDX3'
+
+# magic, version (publish time in ns), section count
+_HEADER = struct.Struct('<8sQI')
+# section name, offset of its record table, record count
+_SECTION = struct.Struct('<16sQI')
+# key offset, key length, value offset, value length
+_RECORD = struct.Struct('<QIQI')
+
+# Sections mirroring ESPNDataLoader's lookup dict, plus an optional result cache
+LOOKUP_SECTIONS = (
+    'by_name', 'by_abbrev', 'by_id', 'by_alias', 'by_acronym', 'by_phonetic', 'by_nickname',
+)
+RESULTS_SECTION = 'results'
+META_SECTION = 'meta'
+
+
+def publish_index(path: str, teams_data: Dict, normalizer=None) -> int:
+    """
+    Atomically publish a compiled team index (and optional results) to `path`.
+
+    The file is written next to `path` and renamed over it, so readers either
+    see the previous version or the complete new one.
+
+    Args:
+        path: Destination file path
+        teams_data: Lookup dict from ESPNDataLoader.get_team_lookup_dict()
+        normalizer: Optional warmed TeamNormalizer whose result cache is
+            persisted; readers only use it if their matching configuration
+            is the same
+
+    Returns:
+        Version number written to the file header
+    """
+    sections = {name: teams_data[name] for name in LOOKUP_SECTIONS}
+    sections[META_SECTION] = {
+        'all_names': list(teams_data['all_names']),
+        'ambiguous_acronyms': dict(teams_data['ambiguous_acronyms']),
+    }
+    if normalizer is not None:
+        sections[META_SECTION]['results_config'] = normalizer._match_config()
+        sections[RESULTS_SECTION] = dict(normalizer._result_cache)
+
+    version = time.time_ns()
+    directory_size = _HEADER.size + _SECTION.size * len(sections)
+
+    # Lay out record tables first, then one blob with every key and value
+    tables = []
+    blob = bytearray()
+    blob_start = directory_size + sum(_RECORD.size * len(entries) for entries in sections.values())
+    for name, entries in sections.items():
+        records = []
+        for key in sorted(entries, key=lambda k: k.encode('utf-8')):
+            key_bytes = key.encode('utf-8')
+            value_bytes = json.dumps(entries[key], separators=(',', ':')).encode('utf-8')
+            key_offset = blob_start + len(blob)
+            blob += key_bytes
+            value_offset = blob_start + len(blob)
+            blob += value_bytes
+            records.append(_RECORD.pack(key_offset, len(key_bytes), value_offset, len(value_bytes)))
+        tables.append((name, records))
+
+    directory = bytearray(_HEADER.pack(MAGIC, version, len(sections)))
+    offset = directory_size
+    for name, records in tables:
+        directory += _SECTION.pack(name.encode('ascii'), offset, len(records))
+        offset += _RECORD.size * len(records)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(directory)
+            for _, records in tables:
+                fh.write(b''.join(records))
+            fh.write(blob)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    return version
+
+
+class _MappedFile:
+    """One immutable, mapped version of an index file."""
+
+    def __init__(self, path: str):
+        try:
+            with open(path, 'rb') as fh:
+                stat = os.fstat(fh.fileno())
+                self.mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise DataLoadError(f"Failed to map shared index {path}: {str(e)}")
+
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        if len(self.mm) < _HEADER.size:
+            raise DataLoadError(f"Shared index {path} is truncated")
+        magic, self.version, n_sections = _HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise DataLoadError(f"Unsupported shared index format: {path}")
+
+        self.sections = {}
+        for i in range(n_sections):
+            raw_name, offset, count = _SECTION.unpack_from(self.mm, _HEADER.size + i * _SECTION.size)
+            self.sections[raw_name.rstrip(b'\0').decode('ascii')] = (offset, count)
+
+    def key_at(self, table_offset: int, index: int) -> bytes:
+        key_offset, key_len, _, _ = _RECORD.unpack_from(self.mm, table_offset + index * _RECORD.size)
+        return self.mm[key_offset:key_offset + key_len]
+
+    def find(self, section: str, key: str):
+        """Binary search a section; returns the decoded value or raises KeyError."""
+        if section not in self.sections:
+            raise KeyError(key)
+        table_offset, count = self.sections[section]
+        target = key.encode('utf-8')
+
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key_at(table_offset, mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo < count:
+            key_offset, key_len, value_offset, value_len = _RECORD.unpack_from(
+                self.mm, table_offset + lo * _RECORD.size
+            )
+            if self.mm[key_offset:key_offset + key_len] == target:
+                return json.loads(self.mm[value_offset:value_offset + value_len])
+        raise KeyError(key)
+
+
+class SharedSection(Mapping):
+    """Read-only Mapping view of one section of a mapped index version."""
+
+    def __init__(self, mapped: _MappedFile, name: str):
+        self._mapped = mapped
+        self._name = name
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        return self._mapped.find(self._name, key)
+
+    def __contains__(self, key) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return self._mapped.sections.get(self._name, (0, 0))[1]
+
+    def __iter__(self) -> Iterator[str]:
+        table_offset, count = self._mapped.sections.get(self._name, (0, 0))
+        for i in range(count):
+            yield self._mapped.key_at(table_offset, i).decode('utf-8')
+
+
+class LazyLookup(Mapping):
+    """
+    Read-only lookup dict whose entries are built on first access.
+
+    Each entry is produced by a builder called at most once, so a process
+    only pays for the derived structures (typo index, mention automaton,
+    prefix index, ...) of the features it actually uses.
+    """
+
+    def __init__(self, builders: Dict[str, Callable[['LazyLookup'], object]]):
+        """
+        Args:
+            builders: {key: function of this mapping returning the value}
+        """
+        self._builders = builders
+        self._values: Dict[str, object] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        builder = self._builders[key]
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = builder(self)
+            return self._values[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._builders
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+
+class SharedIndex:
+    """
+    Reader for an index file written by publish_index().
+
+    Lookups binary-search the mapped file directly, so attaching parses
+    nothing and every process on the host shares the same page cache. The
+    fuzzy name list and the structures derived from it or from whole
+    sections are built per process on first use of the feature that needs
+    them. refresh() remaps when a writer has published a new file; lookup
+    dicts handed out earlier keep their own version alive.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map the index file at `path`.
+
+        Raises:
+            DataLoadError: If the file is missing or not a shared index
+        """
+        self.path = path
+        self._mapped = _MappedFile(path)
+
+    @property
+    def version(self) -> int:
+        """Version number of the currently mapped file."""
+        return self._mapped.version
+
+    def refresh(self) -> bool:
+        """
+        Remap the file if a new version has been published.
+
+        Returns:
+            True if a new version was mapped
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False  # Keep serving the current version
+
+        if (stat.st_ino, stat.st_mtime_ns, stat.st_size) == self._mapped.identity:
+            return False
+
+        self._mapped = _MappedFile(self.path)
+        return True
+
+    def section(self, name: str) -> SharedSection:
+        """Mapping view of a section of the current version."""
+        return SharedSection(self._mapped, name)
+
+    def lookup_dict(self) -> LazyLookup:
+        """
+        Lookup structure compatible with ESPNDataLoader.get_team_lookup_dict().
+
+        Sections are views of the mapped file; every other entry is decoded
+        or built when first accessed. Includes 'results' and
+        'results_config' when the file carries a persisted result cache.
+        """
+        mapped = self._mapped
+
+        def section(name: str) -> Callable[[LazyLookup], object]:
+            return lambda lookup: SharedSection(mapped, name)
+
+        builders: Dict[str, Callable[[LazyLookup], object]] = {
+            name: section(name) for name in LOOKUP_SECTIONS
+        }
+        builders.update({
+            'all_names': lambda lookup: tuple(mapped.find(META_SECTION, 'all_names')),
+            'typo_index': lambda lookup: TypoIndex(lookup['all_names']),
+            'sorted_names': lambda lookup: tuple(sort_tokens(name) for name in lookup['all_names']),
+            'ambiguous_acronyms': lambda lookup: mapped.find(META_SECTION, 'ambiguous_acronyms'),
+            'mentions': lambda lookup: build_mention_automaton(
+                lookup['by_name'], lookup['by_alias'], lookup['by_abbrev'], lookup['by_nickname'],
+            ),
+            'by_history': lambda lookup: NameHistory(HISTORICAL_NAMES),
+            'completions': lambda lookup: build_prefix_index(
+                lookup['by_name'], lookup['by_alias'], lookup['by_abbrev'], lookup['by_nickname'],
+            ),
+        })
+        if RESULTS_SECTION in mapped.sections:
+            builders['results'] = section(RESULTS_SECTION)
+            builders['results_config'] = lambda lookup: mapped.find(META_SECTION, 'results_config')
+        return LazyLookup(builders)
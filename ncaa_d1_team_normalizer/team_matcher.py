@@ -1,13 +1,47 @@
 """Core team name matching logic."""
 
-from typing import Dict, List, Optional
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 from rapidfuzz import process, fuzz
 
-from .data_loader import ESPNDataLoader
+from .aliases import SOURCE_ALIASES
+from .completion import clean_prefix
+from .crosswalk import IdCrosswalk
+from .data_loader import ESPNDataLoader, IndexSnapshot
 from .text_cleaner import TextCleaner
-from .aliases import TEAM_ALIASES
-from .exceptions import UnknownTeamError, InvalidInputError
+from .history import as_of_ordinal
+from .learned_aliases import LearnedAliasStore
+from .matchups import Matchup, parse_matchup
+from .phonetic import phonetic_key
+from .scoring import get_scorer
+from .exceptions import AmbiguousTeamError, DataLoadError, UnknownTeamError, InvalidInputError
+
+# Rows scored per cdist call in batched fuzzy matching (bounds memory use)
+FUZZY_BATCH_BLOCK_SIZE = 1024
+
+# Longest nickname (in words) stripped from the end of a name
+MAX_NICKNAME_WORDS = 4
+
+# Learned resolutions from single lookups buffered before one store write
+LEARN_FLUSH_SIZE = 100
+
+
+class _SourceLayer:
+    """Compiled alias overlay and result cache of one source for one snapshot."""
+
+    __slots__ = ('version', 'aliases', 'overlay', 'cache')
+
+    def __init__(self, version: int, aliases: Optional[Mapping], overlay: Dict[str, str]):
+        self.version = version
+        # The registered SOURCE_ALIASES mapping this layer was compiled from
+        self.aliases = aliases
+        # {cleaned alias: cleaned canonical name}
+        self.overlay = overlay
+        self.cache: OrderedDict = OrderedDict()
 
 
 class TeamNormalizer:
@@ -19,44 +53,273 @@ class TeamNormalizer:
     2. Text cleaning
     3. Exact match
     4. Alias lookup
-    5. Fuzzy match
+    5. Generated acronym lookup
+    6. Mascot-only (nickname) lookup
+    7. Phonetic key lookup (optional)
+    8. Learned alias lookup (optional)
+    9. Fuzzy match
     """
 
-    def __init__(self, fuzzy_threshold: int = 85, raise_on_no_match: bool = False):
+    def __init__(
+        self,
+        fuzzy_threshold: int = 85,
+        raise_on_no_match: bool = False,
+        cache_size: int = 10000,
+        phonetic: bool = False,
+        scorer: str = 'ratio',
+        prefilter: Optional[str] = None,
+        prefilter_cutoff: float = 50,
+        learned_aliases: Optional[str] = None,
+        learn_threshold: float = 95,
+        promote_hits: int = 2,
+        dataset=None,
+    ):
         """
         Initialize the normalizer.
 
         Args:
             fuzzy_threshold: Minimum fuzzy match score (0-100)
             raise_on_no_match: If True, raise UnknownTeamError when no match found
+            cache_size: Maximum number of cleaned names whose results are cached
+                (0 disables the result cache)
+            phonetic: If True, match sound-alike spellings ("Gonzoga",
+                "Zavier") by phonetic key before fuzzy matching
+            scorer: Fuzzy scorer whose score must reach fuzzy_threshold (a
+                key of scoring.SCORERS, e.g. 'token_set_ratio' or 'WRatio'
+                for reordered names such as "State Michigan")
+            prefilter: Optional cheaper scorer run over all teams first; only
+                teams scoring at least prefilter_cutoff are rescored with
+                `scorer`
+            prefilter_cutoff: Minimum prefilter score (0-100) to be rescored
+            learned_aliases: Optional path of a LearnedAliasStore (SQLite)
+                file. Fuzzy matches scoring at least learn_threshold are
+                recorded there (single lookups in buffered batches, see
+                flush_learned_aliases), and names recorded at least
+                promote_hits times are matched by hash lookup before fuzzy
+                matching
+            learn_threshold: Minimum fuzzy score (0-100) recorded or promoted
+            promote_hits: Times a resolution must be seen before promotion
+            dataset: Team table to match against, as (sport, gender, ESPN
+                group), e.g. ('basketball', 'womens', 50); defaults to men's
+                Division I (see data_loader.Dataset)
+
+        Raises:
+            ValueError: If scorer or prefilter is not a known scorer name,
+                or the dataset is not supported
+            DataLoadError: If the learned alias store cannot be opened
         """
         self.fuzzy_threshold = fuzzy_threshold
         self.raise_on_no_match = raise_on_no_match
+        self.cache_size = cache_size
+        self.phonetic = phonetic
+        self.scorer = scorer
+        self.prefilter = prefilter
+        self.prefilter_cutoff = prefilter_cutoff
+        self.learned_aliases = learned_aliases
+        self.learn_threshold = learn_threshold
+        self.promote_hits = promote_hits
+
+        self._scorer = get_scorer(scorer)
+        self._prefilter = get_scorer(prefilter) if prefilter is not None else None
+        # The typo index reproduces a single-tier fuzz.ratio scan exactly
+        self._use_typo_index = scorer == 'ratio' and prefilter is None
+
+        # Load ESPN data (lazy loaded by the dataset's data loader)
+        self._data_loader = ESPNDataLoader(dataset)
+        self.dataset = self._data_loader.dataset
+
+        # (snapshot version, LRU cache of cleaned name -> match result or None);
+        # replaced whenever a newer index snapshot is pinned
+        self._cache_state: Tuple[Optional[int], OrderedDict] = (None, OrderedDict())
+
+        # Per-source overlays/caches and hit counters (see source_stats)
+        self._source_layers: Dict[str, _SourceLayer] = {}
+        self._source_stats: Dict[str, Counter] = {}
+        self._stats_lock = threading.Lock()
+
+        # {ESPN team id: score} ranking complete() results (see set_popularity)
+        self._popularity: Optional[Dict[str, float]] = None
+
+        # {cleaned name: (team id, score)} promoted from the learned store
+        self._learned_store = None
+        self._learned_index: Dict[str, Tuple[str, float]] = {}
+        # (cleaned name, team id, score) not yet written to the store
+        self._learn_buffer: List[Tuple[str, str, float]] = []
+        self._learn_lock = threading.Lock()
+        if learned_aliases is not None:
+            self._learned_store = LearnedAliasStore(learned_aliases)
+            self.reload_learned_aliases()
+
+    def _pin(self, source: Optional[str] = None) -> Tuple[IndexSnapshot, OrderedDict, Optional[Dict]]:
+        """
+        Pin the current index snapshot and its result cache for one call.
+
+        Every lookup in a normalize/normalize_batch call goes through the
+        pinned snapshot, so a call never mixes index versions. A new snapshot
+        version gets a fresh result cache; calls still running on an older
+        version keep writing to that version's (now detached) cache.
+
+        Lookups for a source use that source's own result cache and alias
+        overlay, recompiled when the snapshot or the registered overlay
+        changes.
+
+        Args:
+            source: Optional source key (see aliases.SOURCE_ALIASES)
+
+        Returns:
+            (snapshot, result cache, overlay) where overlay is None without
+            a source
+
+        Raises:
+            DataLoadError: If data cannot be loaded
+        """
+        snapshot = self._data_loader.get_snapshot()
 
-        # Load ESPN data (lazy loaded by data loader)
-        self._data_loader = ESPNDataLoader()
-        self._team_data = None
+        if source is not None:
+            aliases = SOURCE_ALIASES.get(source)
+            layer = self._source_layers.get(source)
+            if layer is None or layer.version != snapshot.version or layer.aliases is not aliases:
+                overlay = self._compile_overlay(aliases or {}, snapshot.data)
+                layer = _SourceLayer(snapshot.version, aliases, overlay)
+                self._source_layers[source] = layer
+            return snapshot, layer.cache, layer.overlay
 
-    def _ensure_data_loaded(self):
-        """Ensure team data is loaded."""
-        if self._team_data is None:
-            self._team_data = self._data_loader.get_team_lookup_dict()
+        version, cache = self._cache_state
+        if version != snapshot.version:
+            cache = OrderedDict()
+            self._cache_state = (snapshot.version, cache)
+        return snapshot, cache, None
 
-    def normalize(self, team_name: str) -> Optional[Dict]:
+    @classmethod
+    def _compile_overlay(cls, aliases: Mapping, data: Mapping) -> Dict[str, str]:
+        """
+        Compile a source's aliases into {cleaned alias: cleaned canonical name}.
+
+        Aliases are cleaned exactly like input names; aliases whose canonical
+        name is not in the loaded data are skipped.
+        """
+        overlay = {}
+        for alias, canonical_name in aliases.items():
+            try:
+                cleaned_alias = cls._prepare(alias, data)
+                cleaned_canonical = TextCleaner.clean(canonical_name)
+            except InvalidInputError:
+                continue
+            if cleaned_canonical in data['by_name']:
+                overlay[cleaned_alias] = cleaned_canonical
+        return overlay
+
+    @property
+    def _result_cache(self) -> OrderedDict:
+        """Result cache for the most recently pinned snapshot."""
+        return self._cache_state[1]
+
+    def normalize(self, team_name: str, source: Optional[str] = None, as_of=None,
+                  id_space: Optional[str] = None) -> Optional[Dict]:
         """
         Normalize a team name to ESPN canonical format.
 
         Args:
             team_name: Team name to normalize
+            source: Optional provider key; its alias overlay (see
+                aliases.register_source_aliases) is checked first, and its
+                results are cached and counted separately
+            as_of: Optional date (date, datetime or ISO string) the name was
+                used on; names in aliases.HISTORICAL_NAMES resolve to the
+                team they referred to that day, ahead of every other stage
+            id_space: Optional crosswalk id space (e.g. 'kenpom'); the
+                result gets the team's id there as '<id_space>_id' (None
+                if the crosswalk has no id for the team)
 
         Returns:
             Dictionary with canonical team info and match metadata, or None
 
         Raises:
-            InvalidInputError: If input validation fails
+            InvalidInputError: If input validation fails or id_space is unknown
+            DataLoadError: If id_space is given and no crosswalk is loaded
             UnknownTeamError: If raise_on_no_match=True and no match found
+                (AmbiguousTeamError if the name is a mascot shared by several teams)
         """
         # Step 1: Validate input
+        self._validate_input(team_name)
+        day = None if as_of is None else as_of_ordinal(as_of)
+        crosswalk = None if id_space is None else self._crosswalk(id_space)
+
+        # Ensure data is loaded and pin one snapshot for the whole call
+        snapshot, cache, overlay = self._pin(source)
+
+        # Step 2: Clean input
+        try:
+            cleaned_name = self._prepare(team_name, snapshot.data)
+        except InvalidInputError:
+            raise  # Re-raise validation errors
+
+        # Dated names bypass the result cache, which is keyed by name only
+        span = None if day is None else snapshot.data['by_history'].lookup(cleaned_name, day)
+        if span is not None:
+            hit, result = False, self._historical_result(span, snapshot.data)
+        else:
+            # Steps 3-9: Match (served from the result cache when possible)
+            hit, result = self._cache_get(cleaned_name, snapshot.data, cache, overlay)
+            if not hit:
+                result = self._match_uncached(cleaned_name, snapshot.data, cache, overlay)
+        if source is not None:
+            self._count(source, [(result, hit)])
+        if result:
+            result = dict(result)
+            if crosswalk is not None and id_space is not None:
+                self._add_space_ids([result], crosswalk, id_space)
+            return result
+
+        # Step 10: No match found
+        if self.raise_on_no_match:
+            raise self._no_match_error(team_name)
+        return None
+
+    def _crosswalk(self, id_space: str) -> IdCrosswalk:
+        """
+        The loaded crosswalk, checked to map ESPN ids to id_space.
+
+        Raises:
+            DataLoadError: If no crosswalk is loaded
+            InvalidInputError: If 'espn' or id_space is not a crosswalk id space
+        """
+        crosswalk = self._data_loader.crosswalk
+        if crosswalk is None:
+            raise DataLoadError("No ID crosswalk loaded (see ESPNDataLoader.load_crosswalk)")
+        crosswalk.check_id_space('espn')
+        crosswalk.check_id_space(id_space)
+        return crosswalk
+
+    def translate_ids(self, ids, from_: str = 'espn', to: str = 'kenpom') -> np.ndarray:
+        """
+        Translate an array of ids between id spaces of the loaded crosswalk.
+
+        Args:
+            ids: Array-like of ids in the `from_` space
+            from_: Source id space
+            to: Target id space
+
+        Returns:
+            Array of translated ids (see IdCrosswalk.translate_ids)
+
+        Raises:
+            DataLoadError: If no crosswalk is loaded
+            InvalidInputError: If an id space is unknown
+        """
+        crosswalk = self._data_loader.crosswalk
+        if crosswalk is None:
+            raise DataLoadError("No ID crosswalk loaded (see ESPNDataLoader.load_crosswalk)")
+        return crosswalk.translate_ids(ids, from_, to)
+
+    @staticmethod
+    def _validate_input(team_name) -> None:
+        """
+        Validate a raw team name.
+
+        Raises:
+            InvalidInputError: If input is None, not a string, or empty
+        """
         if team_name is None:
             raise InvalidInputError("Team name cannot be None")
         if not isinstance(team_name, str):
@@ -64,46 +327,381 @@ class TeamNormalizer:
         if not team_name.strip():
             raise InvalidInputError("Team name cannot be empty")
 
-        # Ensure data is loaded
-        self._ensure_data_loaded()
+    @staticmethod
+    def _prepare(team_name: str, data: Mapping) -> str:
+        """
+        Clean a team name into the key used by the matching stages.
+
+        Mascot-only input ("Blue Devils") keeps its mascot so the nickname
+        stage can see it; otherwise the longest trailing mascot from the ESPN
+        data is stripped before TextCleaner's static suffix list, which could
+        otherwise take only part of it ("Texas Tech Red Raiders" ->
+        "texas tech", "Akron Zips" -> "akron").
 
-        # Step 2: Clean input
+        Raises:
+            InvalidInputError: If the name is empty after cleaning starts
+        """
+        unstripped = TextCleaner.clean(team_name, strip_suffixes=False)
+        by_name = data['by_name']
+        by_alias = data['by_alias']
+        by_nickname = data['by_nickname']
+        if unstripped in by_name or unstripped in by_alias:
+            return unstripped
+        if unstripped in by_nickname:
+            return unstripped
+
+        words = unstripped.split()
+        for size in range(min(len(words) - 1, MAX_NICKNAME_WORDS), 0, -1):
+            if ' '.join(words[-size:]) in by_nickname:
+                remainder = ' '.join(words[:-size])
+                if remainder in by_name or remainder in by_alias:
+                    return remainder
+                return TextCleaner.normalize_whitespace(TextCleaner.remove_suffixes(remainder))
+
+        cleaned_name = TextCleaner.normalize_whitespace(TextCleaner.remove_suffixes(unstripped))
+        if cleaned_name in by_name or cleaned_name in by_alias:
+            return cleaned_name
+
+        words = cleaned_name.split()
+        for size in range(min(len(words) - 1, MAX_NICKNAME_WORDS), 0, -1):
+            if ' '.join(words[-size:]) in by_nickname:
+                return ' '.join(words[:-size])
+        return cleaned_name
+
+    def _no_match_error(self, team_name: str) -> UnknownTeamError:
+        """
+        Build the error raised for an unmatched name.
+
+        Returns:
+            AmbiguousTeamError if the name is a mascot shared by several
+            teams, otherwise UnknownTeamError
+        """
+        data = self._pin()[0].data
         try:
-            cleaned_name = TextCleaner.clean(team_name)
+            cleaned_name = self._prepare(team_name, data)
         except InvalidInputError:
-            raise  # Re-raise validation errors
+            return UnknownTeamError(team_name)
+
+        candidates = data['by_nickname'].get(cleaned_name)
+        if candidates and len(candidates) > 1:
+            by_name = data['by_name']
+            return AmbiguousTeamError(team_name, [by_name[name]['display_name'] for name in candidates])
+        return UnknownTeamError(team_name)
+
+    def _cache_get(self, cleaned_name: str, data: Mapping, cache: OrderedDict,
+                   overlay: Optional[Dict] = None):
+        """
+        Look up a cleaned name in the result cache.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+            cache: Result cache of the pinned snapshot
+            overlay: Source alias overlay, if any
+
+        Returns:
+            (hit, result) tuple; result may be None for a cached miss
+        """
+        # KeyError guards tolerate concurrent eviction from another thread
+        try:
+            result = cache[cleaned_name]
+            cache.move_to_end(cleaned_name)
+            return True, result
+        except KeyError:
+            pass
+
+        # Fall back to a result cache persisted with the index (shared_index),
+        # valid only if it was produced with the same matching configuration
+        # and no source overlay can override it
+        persisted = data.get('results')
+        if (persisted is not None and not overlay
+                and data.get('results_config') == self._match_config()):
+            try:
+                result = persisted[cleaned_name]
+            except KeyError:
+                return False, None
+            self._cache_put(cleaned_name, result, cache)
+            return True, result
+
+        return False, None
+
+    def _cache_put(self, cleaned_name: str, result: Optional[Dict], cache: OrderedDict) -> None:
+        """Store a match result, evicting least recently used entries."""
+        if self.cache_size <= 0:
+            return
+
+        cache[cleaned_name] = result
+        while len(cache) > self.cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+
+    def _match_uncached(self, cleaned_name: str, data: Mapping, cache: OrderedDict,
+                        overlay: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Run the matching pipeline for a cleaned name missing from the result cache.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+            cache: Result cache of the pinned snapshot (receives the result)
+            overlay: Source alias overlay, checked first if given
 
+        Returns:
+            Match result or None (callers must copy before handing it out)
+        """
+        result = self._source_alias_match(cleaned_name, data, overlay) if overlay else None
+        if not result:
+            result = self._match_cleaned(cleaned_name, data)
+        self._cache_put(cleaned_name, result, cache)
+        return result
+
+    def _source_alias_match(self, cleaned_name: str, data: Mapping, overlay: Dict) -> Optional[Dict]:
+        """
+        Try a source's alias overlay.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+            overlay: {cleaned alias: cleaned canonical name} of the source
+
+        Returns:
+            Match result or None
+        """
+        cleaned_canonical = overlay.get(cleaned_name)
+        if cleaned_canonical is None:
+            return None
+
+        team_info = data['by_name'][cleaned_canonical]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': 100.0,
+            'match_method': 'source_alias',
+        }
+
+    def _count(self, source: str, outcomes: Iterable[Tuple[Optional[Dict], bool]]) -> None:
+        """
+        Update a source's hit counters.
+
+        Args:
+            source: Source key
+            outcomes: (result or None, served from cache) per lookup
+        """
+        with self._stats_lock:
+            stats = self._source_stats.setdefault(source, Counter())
+            for result, cached in outcomes:
+                stats['lookups'] += 1
+                if cached:
+                    stats['cache_hits'] += 1
+                stats[result['match_method'] if result else 'unmatched'] += 1
+
+    def source_stats(self, source: str) -> Dict:
+        """
+        Get lookup counters for a source since creation (or reset_source_stats()).
+
+        Args:
+            source: Source key
+
+        Returns:
+            Dictionary with lookups, cache_hits, the source's current
+            cache_size, and 'match_methods': {match_method or 'unmatched': count}
+        """
+        with self._stats_lock:
+            counts = dict(self._source_stats.get(source, {}))
+        layer = self._source_layers.get(source)
+        return {
+            'lookups': counts.pop('lookups', 0),
+            'cache_hits': counts.pop('cache_hits', 0),
+            'cache_size': len(layer.cache) if layer is not None else 0,
+            'match_methods': counts,
+        }
+
+    def reset_source_stats(self, source: Optional[str] = None) -> None:
+        """Reset the counters of one source, or of all sources."""
+        with self._stats_lock:
+            if source is None:
+                self._source_stats.clear()
+            else:
+                self._source_stats.pop(source, None)
+
+    def _match_config(self) -> Dict:
+        """Settings that affect match results (persisted result caches must agree)."""
+        return {
+            'fuzzy_threshold': self.fuzzy_threshold,
+            'phonetic': self.phonetic,
+            'scorer': self.scorer,
+            'prefilter': self.prefilter,
+            'prefilter_cutoff': self.prefilter_cutoff,
+            'learned_aliases': self.learned_aliases,
+            'learn_threshold': self.learn_threshold,
+            'promote_hits': self.promote_hits,
+            # A list, so configs persisted as JSON compare equal
+            'dataset': list(self.dataset),
+        }
+
+    def clear_cache(self) -> None:
+        """Clear cached match results, including per-source caches."""
+        self._result_cache.clear()
+        for layer in list(self._source_layers.values()):
+            layer.cache.clear()
+
+    def reload_learned_aliases(self) -> None:
+        """
+        Re-read promoted resolutions from the learned alias store.
+
+        Resolutions recorded since the last load (by this or any other
+        process) become hash lookups once they qualify.
+        """
+        if self._learned_store is None:
+            return
+        self.flush_learned_aliases()
+        self._learned_index = self._learned_store.promoted(self.learn_threshold, self.promote_hits)
+        self.clear_cache()
+
+    def flush_learned_aliases(self) -> None:
+        """Write buffered fuzzy resolutions to the learned alias store."""
+        if self._learned_store is None:
+            return
+        with self._learn_lock:
+            rows, self._learn_buffer = self._learn_buffer, []
+        self._learned_store.record_many(rows)
+
+    def close(self) -> None:
+        """Flush buffered learned resolutions and close the learned alias store."""
+        if self._learned_store is not None:
+            self.flush_learned_aliases()
+            self._learned_store.close()
+            self._learned_store = None
+
+    def __enter__(self) -> 'TeamNormalizer':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _learn(self, resolutions: List[Tuple[str, Optional[Dict]]], flush: bool = False) -> None:
+        """
+        Buffer high-confidence fuzzy results for the learned alias store.
+
+        The buffer is written in one transaction once it holds
+        LEARN_FLUSH_SIZE resolutions, or right away with flush=True (batches).
+        """
+        if self._learned_store is None:
+            return
+        rows = [
+            (cleaned_name, result['espn_id'], result['confidence'])
+            for cleaned_name, result in resolutions
+            if result and result['match_method'] == 'fuzzy'
+            and result['confidence'] >= self.learn_threshold
+        ]
+        with self._learn_lock:
+            self._learn_buffer.extend(rows)
+            flush = flush or len(self._learn_buffer) >= LEARN_FLUSH_SIZE
+        if flush:
+            self.flush_learned_aliases()
+
+    def _match_cleaned(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Run the full matching pipeline for a cleaned name.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
+        result = self._match_hashed(cleaned_name, data)
+        if result:
+            return result
+
+        # Step 9: Try fuzzy match
+        result = self._fuzzy_match(cleaned_name, data)
+        self._learn([(cleaned_name, result)])
+        return result
+
+    def _match_hashed(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Run the hash-lookup stages that precede fuzzy matching.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
         # Step 3: Try exact match
-        result = self._exact_match(cleaned_name)
+        result = self._exact_match(cleaned_name, data)
         if result:
             return result
 
         # Step 4: Try alias lookup
-        result = self._alias_match(cleaned_name)
+        result = self._alias_match(cleaned_name, data)
         if result:
             return result
 
-        # Step 5: Try fuzzy match
-        result = self._fuzzy_match(cleaned_name)
+        # Step 5: Try generated acronym lookup
+        result = self._acronym_match(cleaned_name, data)
         if result:
             return result
 
-        # Step 6: No match found
-        if self.raise_on_no_match:
-            raise UnknownTeamError(team_name)
-        return None
+        # Step 6: Try mascot-only lookup
+        result = self._nickname_match(cleaned_name, data)
+        if result:
+            return result
+
+        # Step 7: Try phonetic key lookup
+        if self.phonetic:
+            result = self._phonetic_match(cleaned_name, data)
+            if result:
+                return result
+
+        # Step 8: Try fuzzy resolutions promoted from the learned store
+        return self._learned_match(cleaned_name, data)
+
+    def _learned_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Try the learned alias index (see LearnedAliasStore).
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result (confidence is the recorded fuzzy score) or None
+        """
+        learned = self._learned_index.get(cleaned_name)
+        if learned is None:
+            return None
+
+        team_id, score = learned
+        team_info = data['by_id'].get(team_id)
+        if team_info is None:
+            return None  # Team no longer in the loaded data
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': float(score),
+            'match_method': 'learned',
+        }
 
-    def _exact_match(self, cleaned_name: str) -> Optional[Dict]:
+    def _exact_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
         """
         Try exact match against canonical names.
 
         Args:
             cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
 
         Returns:
             Match result or None
         """
-        by_name = self._team_data['by_name']
+        by_name = data['by_name']
 
         if cleaned_name in by_name:
             team_info = by_name[cleaned_name]
@@ -117,86 +715,796 @@ class TeamNormalizer:
 
         return None
 
-    def _alias_match(self, cleaned_name: str) -> Optional[Dict]:
+    @staticmethod
+    def _historical_result(span: Tuple[int, int, Optional[str]], data: Mapping) -> Optional[Dict]:
+        """
+        Build the result for a season-bounded name.
+
+        Args:
+            span: Range covering the requested day (see NameHistory.lookup)
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result, or None if the name referred to no Division I
+            team that day or the team is not in the loaded data
+        """
+        team_id = span[2]
+        team_info = data['by_id'].get(team_id) if team_id is not None else None
+        if team_info is None:
+            return None
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': 100.0,
+            'match_method': 'historical',
+        }
+
+    def _alias_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
         """
         Try alias dictionary lookup.
 
         Args:
             cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
 
         Returns:
             Match result or None
         """
-        if cleaned_name in TEAM_ALIASES:
-            canonical_name = TEAM_ALIASES[cleaned_name]
+        # TEAM_ALIASES precompiled to cleaned canonical names at load time
+        cleaned_canonical = data['by_alias'].get(cleaned_name)
+        if cleaned_canonical is None:
+            return None
 
-            # Look up the canonical name in our data
-            by_name = self._team_data['by_name']
+        team_info = data['by_name'][cleaned_canonical]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': 100.0,
+            'match_method': 'alias',
+        }
 
-            # Clean the canonical name for lookup
-            try:
-                cleaned_canonical = TextCleaner.clean(canonical_name)
-            except InvalidInputError:
-                return None
-
-            if cleaned_canonical in by_name:
-                team_info = by_name[cleaned_canonical]
-                return {
-                    'canonical_name': team_info['display_name'],
-                    'espn_id': team_info['team_id'],
-                    'abbreviation': team_info['abbreviation'],
-                    'confidence': 100.0,
-                    'match_method': 'alias',
-                }
+    def _acronym_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Try the acronym index generated from ESPN names and abbreviations.
 
-        return None
+        Spelled-out initials ("m t s u", from "M.T.S.U.") are joined first.
+        Acronyms shared by several teams are not indexed.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
+        words = cleaned_name.split()
+        key = ''.join(words) if all(len(word) == 1 for word in words) else cleaned_name
+
+        cleaned_canonical = data['by_acronym'].get(key)
+        if cleaned_canonical is None:
+            return None
 
-    def _fuzzy_match(self, cleaned_name: str) -> Optional[Dict]:
+        team_info = data['by_name'][cleaned_canonical]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': 100.0,
+            'match_method': 'acronym',
+        }
+
+    def _nickname_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Try mascot-only lookup ("Blue Devils" -> Duke).
+
+        Mascots shared by several teams are not guessed; see _no_match_error.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
+        candidates = data['by_nickname'].get(cleaned_name)
+        if not candidates or len(candidates) > 1:
+            return None
+
+        team_info = data['by_name'][candidates[0]]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': 100.0,
+            'match_method': 'nickname',
+        }
+
+    def _phonetic_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
+        """
+        Try phonetic key lookup against canonical names and aliases.
+
+        Confidence is the fuzz.ratio between the input and the matched name,
+        so it stays on the fuzzy scale.
+
+        Args:
+            cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
+        key = phonetic_key(cleaned_name)
+        if not key:
+            return None
+
+        by_phonetic = data.get('by_phonetic')
+        matched_name = by_phonetic.get(key) if by_phonetic is not None else None
+        if matched_name is None:
+            return None
+
+        team_info = data['by_name'][matched_name]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': float(fuzz.ratio(cleaned_name, matched_name)),
+            'match_method': 'phonetic',
+        }
+
+    def _fuzzy_match(self, cleaned_name: str, data: Mapping) -> Optional[Dict]:
         """
         Try fuzzy matching with rapidfuzz.
 
+        With the default single-tier fuzz.ratio scorer, typos are usually
+        resolved by the snapshot's typo index, which only scores names
+        within a small edit distance; the full extractOne scan runs when the
+        index cannot rule out a better match further away. With a prefilter,
+        the configured scorer only rescores the prefilter's survivors.
+
         Args:
             cleaned_name: Cleaned team name
+            data: Lookup structure of the pinned snapshot
 
         Returns:
             Match result or None
         """
-        all_names = self._team_data['all_names']
-        by_name = self._team_data['by_name']
+        all_names = data['all_names']
+
+        typo_index = data.get('typo_index') if self._use_typo_index else None
+        if typo_index is not None:
+            conclusive, match = typo_index.best_match(cleaned_name, self.fuzzy_threshold)
+            if conclusive:
+                if match is None:
+                    return None
+                index, score = match
+                return self._fuzzy_result(all_names[index], score, data)
+
+        scorer = self._scorer
+        query = scorer.prepare(cleaned_name)
+        choices = data[scorer.choices]
+
+        prefilter = self._prefilter
+        if prefilter is not None:
+            survivors = process.extract(
+                prefilter.prepare(cleaned_name),
+                data[prefilter.choices],
+                scorer=prefilter.score,
+                score_cutoff=self.prefilter_cutoff,
+                limit=None,
+            )
+            return self._rescore(query, sorted(index for _, _, index in survivors), choices, data)
 
         # Use rapidfuzz to find best match
         result = process.extractOne(
-            cleaned_name,
-            all_names,
-            scorer=fuzz.ratio,
+            query,
+            choices,
+            scorer=scorer.score,
             score_cutoff=self.fuzzy_threshold
         )
 
         if result:
-            matched_name, score, _ = result
-            team_info = by_name[matched_name]
+            _, score, index = result
+            return self._fuzzy_result(all_names[index], score, data)
 
-            return {
-                'canonical_name': team_info['display_name'],
-                'espn_id': team_info['team_id'],
-                'abbreviation': team_info['abbreviation'],
-                'confidence': float(score),
-                'match_method': 'fuzzy',
-            }
+        return None
+
+    def _rescore(self, query: str, indices, choices, data: Mapping) -> Optional[Dict]:
+        """
+        Score prefilter survivors with the configured scorer.
+
+        Args:
+            query: Query prepared for the configured scorer
+            indices: Ascending positions of the survivors (ties go to the first)
+            choices: The configured scorer's choices
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match result or None
+        """
+        if len(indices) == 0:
+            return None
+
+        result = process.extractOne(
+            query,
+            {index: choices[index] for index in indices},
+            scorer=self._scorer.score,
+            score_cutoff=self.fuzzy_threshold,
+        )
+        if result:
+            _, score, index = result
+            return self._fuzzy_result(data['all_names'][index], score, data)
 
         return None
 
-    def normalize_batch(self, team_names: List[str]) -> List[Optional[Dict]]:
+    @staticmethod
+    def _fuzzy_result(matched_name: str, score: float, data: Mapping) -> Dict:
+        """Build a fuzzy match result for a matched cleaned name."""
+        team_info = data['by_name'][matched_name]
+        return {
+            'canonical_name': team_info['display_name'],
+            'espn_id': team_info['team_id'],
+            'abbreviation': team_info['abbreviation'],
+            'confidence': float(score),
+            'match_method': 'fuzzy',
+        }
+
+    def _fuzzy_match_batch(self, cleaned_names: List[str], data: Mapping) -> List[Optional[Dict]]:
+        """
+        Fuzzy match many cleaned names with one vectorized scoring pass.
+
+        Equivalent to calling _fuzzy_match for each name (ties resolve to the
+        first candidate, as with extractOne): names the typo index resolves
+        are answered directly, and the rest are scored in blocks with
+        rapidfuzz's cdist instead of one extractOne call per name.
+
+        Args:
+            cleaned_names: Cleaned team names
+            data: Lookup structure of the pinned snapshot
+
+        Returns:
+            Match results or None, in input order
+        """
+        all_names = data['all_names']
+
+        if not all_names:
+            return [None] * len(cleaned_names)
+
+        results: List[Optional[Dict]] = [None] * len(cleaned_names)
+        unresolved = []
+        typo_index = data.get('typo_index') if self._use_typo_index else None
+        for position, cleaned_name in enumerate(cleaned_names):
+            if typo_index is not None:
+                conclusive, match = typo_index.best_match(cleaned_name, self.fuzzy_threshold)
+                if conclusive:
+                    if match is not None:
+                        index, score = match
+                        results[position] = self._fuzzy_result(all_names[index], score, data)
+                    continue
+            unresolved.append(position)
+
+        scorer = self._scorer
+        prefilter = self._prefilter
+        choices = data[scorer.choices]
+
+        for start in range(0, len(unresolved), FUZZY_BATCH_BLOCK_SIZE):
+            positions = unresolved[start:start + FUZZY_BATCH_BLOCK_SIZE]
+
+            if prefilter is not None:
+                scores = process.cdist(
+                    [prefilter.prepare(cleaned_names[position]) for position in positions],
+                    data[prefilter.choices],
+                    scorer=prefilter.score,
+                    score_cutoff=self.prefilter_cutoff,
+                    dtype=np.float64,
+                )
+                for row, position in enumerate(positions):
+                    survivors = np.flatnonzero(scores[row] >= self.prefilter_cutoff)
+                    results[position] = self._rescore(
+                        scorer.prepare(cleaned_names[position]), survivors, choices, data
+                    )
+                continue
+
+            scores = process.cdist(
+                [scorer.prepare(cleaned_names[position]) for position in positions],
+                choices,
+                scorer=scorer.score,
+                score_cutoff=self.fuzzy_threshold,
+                dtype=np.float64,
+            )
+            best_indices = scores.argmax(axis=1)
+
+            for row, best_index in enumerate(best_indices):
+                score = scores[row, best_index]
+                if score >= self.fuzzy_threshold:
+                    results[positions[row]] = self._fuzzy_result(all_names[best_index], score, data)
+
+        return results
+
+    def _resolve_batch(self, team_names: List[str], source: Optional[str] = None,
+                       days: Optional[List[Optional[int]]] = None) -> List[Optional[Dict]]:
+        """
+        Match already-validated names without raising on misses.
+
+        Each distinct cleaned name is resolved once: cache hits and hash
+        stages first, then all remaining names in one batched fuzzy pass.
+        With days, season-bounded names are first resolved in one sweep
+        over the batch sorted by date.
+
+        Args:
+            team_names: Validated team names
+            source: Optional provider key (see normalize)
+            days: Optional date ordinal (or None) per name (see history.as_of_ordinal)
+
+        Returns:
+            Match results (shared per cleaned name; callers copy) in input order
+        """
+        # One snapshot for the whole batch, so it never mixes index versions
+        snapshot, cache, overlay = self._pin(source)
+        data = snapshot.data
+
+        cleaned_by_name = {}
+        for name in team_names:
+            if name not in cleaned_by_name:
+                cleaned_by_name[name] = self._prepare(name, data)
+
+        historical = {}
+        if days is not None:
+            dated = [position for position, day in enumerate(days) if day is not None]
+            spans = data['by_history'].sweep([
+                (cleaned_by_name[team_names[position]], days[position]) for position in dated
+            ])
+            historical = {
+                position: self._historical_result(span, data)
+                for position, span in zip(dated, spans) if span is not None
+            }
+
+        resolved = {}
+        cached = set()
+        pending = []
+        undated = (
+            cleaned_by_name[name] for position, name in enumerate(team_names)
+            if position not in historical
+        )
+        for cleaned_name in dict.fromkeys(undated):
+            hit, result = self._cache_get(cleaned_name, data, cache, overlay)
+            if hit:
+                cached.add(cleaned_name)
+            else:
+                result = self._source_alias_match(cleaned_name, data, overlay) if overlay else None
+                result = result or self._match_hashed(cleaned_name, data)
+                if not result:
+                    pending.append(cleaned_name)
+                    continue
+                self._cache_put(cleaned_name, result, cache)
+            resolved[cleaned_name] = result
+
+        if pending:
+            fuzzy_results = list(zip(pending, self._fuzzy_match_batch(pending, data)))
+            for cleaned_name, result in fuzzy_results:
+                self._cache_put(cleaned_name, result, cache)
+                resolved[cleaned_name] = result
+            self._learn(fuzzy_results, flush=True)
+
+        results = [
+            historical[position] if position in historical else resolved[cleaned_by_name[name]]
+            for position, name in enumerate(team_names)
+        ]
+        if source is not None:
+            self._count(source, (
+                (result, position not in historical and cleaned_by_name[name] in cached)
+                for position, (name, result) in enumerate(zip(team_names, results))
+            ))
+        return results
+
+    def normalize_batch(self, team_names: List[str], source: Optional[str] = None,
+                        as_of=None, id_space: Optional[str] = None) -> List[Optional[Dict]]:
         """
         Normalize multiple team names efficiently.
 
+        Each distinct input is matched once, and names that need fuzzy
+        matching are scored together in a single vectorized pass. Repeated
+        names still receive their own result dictionary.
+
         Args:
             team_names: List of team names to normalize
+            source: Optional provider key (see normalize)
+            as_of: Optional date for every name, or a list with one date
+                (or None) per name, e.g. the game dates of a backfill
+                (see normalize)
+            id_space: Optional crosswalk id space added to every result
+                (see normalize)
 
         Returns:
             List of match results (same order as input)
+
+        Raises:
+            InvalidInputError: If any input fails validation, as_of is a
+                list of a different length than team_names, or id_space is
+                unknown
+            DataLoadError: If id_space is given and no crosswalk is loaded
+            UnknownTeamError: If raise_on_no_match=True and a name has no match
+        """
+        for name in team_names:
+            self._validate_input(name)
+        days = self._batch_days(as_of, len(team_names))
+        crosswalk = None if id_space is None else self._crosswalk(id_space)
+
+        results = []
+        for name, result in zip(team_names, self._resolve_batch(team_names, source, days)):
+            if result is None and self.raise_on_no_match:
+                raise self._no_match_error(name)
+            results.append(dict(result) if result else None)
+
+        if crosswalk is not None and id_space is not None:
+            self._add_space_ids(results, crosswalk, id_space)
+        return results
+
+    @staticmethod
+    def _add_space_ids(results: List[Optional[Dict]], crosswalk: IdCrosswalk, id_space: str) -> None:
+        """Add '<id_space>_id' to every result (see normalize)."""
+        for result in results:
+            if result:
+                result[f'{id_space}_id'] = crosswalk.translate(result['espn_id'], 'espn', id_space)
+
+    @staticmethod
+    def _batch_days(as_of, count: int) -> Optional[List[Optional[int]]]:
+        """
+        Date ordinals for normalize_batch's as_of argument.
+
+        Returns:
+            One ordinal per name (None for undated names), or None if
+            as_of is None
+
+        Raises:
+            InvalidInputError: If a date is invalid or the list length is wrong
+        """
+        if as_of is None:
+            return None
+        if isinstance(as_of, (list, tuple)):
+            if len(as_of) != count:
+                raise InvalidInputError(f"as_of has {len(as_of)} dates for {count} team names")
+            return [None if day is None else as_of_ordinal(day) for day in as_of]
+        return [as_of_ordinal(as_of)] * count
+
+    def normalize_matchup(self, matchup: str, source: Optional[str] = None) -> Optional[Matchup]:
+        """
+        Normalize both teams of a matchup string ("Duke @ North Carolina").
+
+        See matchups.parse_matchup for the recognized separators and
+        home/away/neutral markers.
+
+        Args:
+            matchup: Matchup string
+            source: Optional provider key (see normalize)
+
+        Returns:
+            Matchup(away_id, home_id, neutral), or None if either team has
+            no match
+
+        Raises:
+            InvalidInputError: If the string is not a recognizable matchup
+            UnknownTeamError: If raise_on_no_match=True and a team has no match
+        """
+        return self.normalize_matchups([matchup], source)[0]
+
+    def normalize_matchups(self, matchups: List[str], source: Optional[str] = None) -> List[Optional[Matchup]]:
         """
-        return [self.normalize(name) for name in team_names]
+        Normalize many matchup strings, e.g. a whole sportsbook feed.
+
+        Each distinct string is parsed once, and all team names are resolved
+        together through the batched engine.
+
+        Args:
+            matchups: Matchup strings
+            source: Optional provider key (see normalize)
+
+        Returns:
+            Matchup records or None, in input order
+
+        Raises:
+            InvalidInputError: If any string is not a recognizable matchup
+            UnknownTeamError: If raise_on_no_match=True and a team has no match
+        """
+        parsed = {}
+        for matchup in matchups:
+            if matchup not in parsed:
+                parsed[matchup] = parse_matchup(matchup)
+
+        team_names = [name for away, home, _ in parsed.values() for name in (away, home)]
+        resolved = dict(zip(team_names, self._resolve_batch(team_names, source)))
+
+        records: Dict[str, Optional[Matchup]] = {}
+        for matchup, (away, home, neutral) in parsed.items():
+            away_result, home_result = resolved[away], resolved[home]
+            if away_result is None or home_result is None:
+                if self.raise_on_no_match:
+                    raise self._no_match_error(home if away_result else away)
+                records[matchup] = None
+            else:
+                records[matchup] = Matchup(away_result['espn_id'], home_result['espn_id'], neutral)
+
+        return [records[matchup] for matchup in matchups]
+
+    def candidates(self, team_name: str, k: int = 5, score_cutoff: float = 0.0) -> List[Dict]:
+        """
+        Get the top-k candidate teams for a name, for manual review.
+
+        Exact, alias, acronym and mascot hits short-circuit to that team
+        (a mascot shared by several teams lists each of them); otherwise all
+        teams are scored once with the configured scorer (no prefilter),
+        regardless of fuzzy_threshold.
+
+        Args:
+            team_name: Team name to look up
+            k: Maximum number of candidates
+            score_cutoff: Minimum fuzzy score (0-100) of a candidate
+
+        Returns:
+            Match dictionaries (as returned by normalize) ordered by
+            descending confidence
+
+        Raises:
+            InvalidInputError: If input validation fails
+        """
+        self._validate_input(team_name)
+        data = self._pin()[0].data
+        cleaned_name = self._prepare(team_name, data)
+
+        hits = self._certain_candidates(cleaned_name, data)
+        if hits is not None:
+            return hits[:k]
+
+        scorer = self._scorer
+        all_names = data['all_names']
+        return [
+            self._fuzzy_result(all_names[index], score, data)
+            for _, score, index in process.extract(
+                scorer.prepare(cleaned_name),
+                data[scorer.choices],
+                scorer=scorer.score,
+                limit=k,
+                score_cutoff=score_cutoff,
+            )
+        ]
+
+    def candidates_batch(
+        self,
+        team_names: List[str],
+        k: int = 5,
+        score_cutoff: float = 0.0,
+    ) -> List[List[Dict]]:
+        """
+        Get the top-k candidate teams for many names (e.g. a review queue).
+
+        Equivalent to calling candidates() for each name, but each distinct
+        name is handled once and fuzzy scores come from blocked cdist calls.
+
+        Args:
+            team_names: Team names to look up
+            k: Maximum number of candidates per name
+            score_cutoff: Minimum fuzzy score (0-100) of a candidate
+
+        Returns:
+            One candidate list per input name, in input order
+
+        Raises:
+            InvalidInputError: If any input fails validation
+        """
+        for name in team_names:
+            self._validate_input(name)
+        data = self._pin()[0].data
+        all_names = data['all_names']
+
+        cleaned_by_name = {}
+        for name in team_names:
+            if name not in cleaned_by_name:
+                cleaned_by_name[name] = self._prepare(name, data)
+
+        resolved = {}
+        pending = []
+        for cleaned_name in dict.fromkeys(cleaned_by_name.values()):
+            hits = self._certain_candidates(cleaned_name, data)
+            if hits is None:
+                pending.append(cleaned_name)
+            else:
+                resolved[cleaned_name] = hits[:k]
+
+        scorer = self._scorer
+        for start in range(0, len(pending), FUZZY_BATCH_BLOCK_SIZE):
+            block = pending[start:start + FUZZY_BATCH_BLOCK_SIZE]
+            scores = process.cdist(
+                [scorer.prepare(cleaned_name) for cleaned_name in block],
+                data[scorer.choices],
+                scorer=scorer.score,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+            )
+            for row, cleaned_name in enumerate(block):
+                row_scores = scores[row]
+                eligible = np.flatnonzero(row_scores >= score_cutoff)
+                # Highest score first, ties by position, as process.extract orders them
+                ranked = eligible[np.lexsort((eligible, -row_scores[eligible]))][:k]
+                resolved[cleaned_name] = [
+                    self._fuzzy_result(all_names[index], row_scores[index], data)
+                    for index in ranked
+                ]
+
+        return [
+            [dict(candidate) for candidate in resolved.get(cleaned_by_name[name], [])]
+            for name in team_names
+        ]
+
+    def _certain_candidates(self, cleaned_name: str, data: Mapping) -> Optional[List[Dict]]:
+        """
+        Candidates from the hash stages that need no scoring.
+
+        Returns:
+            List of matches, or None if the fuzzy scan is needed
+        """
+        for stage in (self._exact_match, self._alias_match, self._acronym_match):
+            result = stage(cleaned_name, data)
+            if result:
+                return [result]
+
+        # Mascot-only input: every team that uses the mascot
+        shared = data['by_nickname'].get(cleaned_name)
+        if shared:
+            by_name = data['by_name']
+            return [
+                {
+                    'canonical_name': by_name[name]['display_name'],
+                    'espn_id': by_name[name]['team_id'],
+                    'abbreviation': by_name[name]['abbreviation'],
+                    'confidence': 100.0,
+                    'match_method': 'nickname',
+                }
+                for name in shared
+            ]
+
+        return None
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """
+        Typeahead: teams whose name, alias, abbreviation or mascot starts
+        with what has been typed so far.
+
+        Teams are ranked by exact key matches first, then by match type
+        (see completion.MATCH_TYPES), popularity (see set_popularity) and
+        key length. Each team is listed once, under its best match.
+
+        Args:
+            prefix: Text typed so far, e.g. "mich" or "st j"
+            limit: Maximum number of teams returned
+
+        Returns:
+            Dictionaries with canonical_name, espn_id, abbreviation,
+            match_method and matched (the completed key), best first;
+            empty for blank input
+
+        Raises:
+            InvalidInputError: If prefix is not a string
+        """
+        cleaned_prefix = clean_prefix(prefix)
+        if not cleaned_prefix or limit <= 0:
+            return []
+
+        data = self._pin()[0].data
+        by_name = data['by_name']
+        popularity = None
+        if self._popularity is not None:
+            scores = self._popularity
+
+            def popularity_fn(cleaned_name: str) -> float:
+                return scores.get(by_name[cleaned_name]['team_id'], 0.0)
+
+            popularity = popularity_fn
+
+        results = []
+        for cleaned_name, key, method in data['completions'].search(cleaned_prefix, limit, popularity):
+            team_info = by_name[cleaned_name]
+            results.append({
+                'canonical_name': team_info['display_name'],
+                'espn_id': team_info['team_id'],
+                'abbreviation': team_info['abbreviation'],
+                'match_method': method,
+                'matched': key,
+            })
+        return results
+
+    def set_popularity(self, scores: Optional[Mapping[str, float]]) -> None:
+        """
+        Rank complete() results within a match type by popularity.
+
+        Args:
+            scores: {ESPN team id: score}, higher first (e.g. lookup or
+                handle counts); teams not listed score 0. None restores the
+                default, the number of spellings the index knows per team
+        """
+        self._popularity = None if scores is None else {str(k): float(v) for k, v in scores.items()}
+
+    def extract_teams(self, text: str) -> List[Dict]:
+        """
+        Find team mentions in free text ("Duke vs UNC 1H Spread").
+
+        Display names, aliases, ESPN abbreviations and single-team mascots
+        are found in one pass over the text's words; overlapping mentions
+        resolve to the leftmost, then longest, phrase. Abbreviations only
+        count when written in capitals, so "BUT" is Butler but "but" is not;
+        mascots and one-word aliases only when capitalized, so "the Orange"
+        is Syracuse but "orange county" is not.
+
+        Args:
+            text: Headline, bet description, injury report, ...
+
+        Returns:
+            Match dictionaries (as returned by normalize) in text order, each
+            with 'start' and 'end' offsets into `text` and the matched 'text'
+
+        Raises:
+            InvalidInputError: If text is not a string
+        """
+        if not isinstance(text, str):
+            raise InvalidInputError(f"Text must be a string, got {type(text).__name__}")
+        return self._extract(text, self._pin()[0].data)
+
+    def extract_teams_batch(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Find team mentions in many documents against one index snapshot.
+
+        Args:
+            texts: Documents to scan
+
+        Returns:
+            One list of mentions (see extract_teams) per document, in input order
+
+        Raises:
+            InvalidInputError: If any document is not a string
+        """
+        for text in texts:
+            if not isinstance(text, str):
+                raise InvalidInputError(f"Text must be a string, got {type(text).__name__}")
+        data = self._pin()[0].data
+        return [self._extract(text, data) for text in texts]
+
+    @staticmethod
+    def _extract(text: str, data: Mapping) -> List[Dict]:
+        """Scan one document with the snapshot's mention automaton."""
+        tokens = TextCleaner.tokenize(text)
+        if not tokens:
+            return []
+
+        def accept(first: int, last: int, method: str) -> bool:
+            if method == 'abbreviation':
+                written = text[tokens[first][1]:tokens[last][2]]
+                return written == written.upper()
+            if method == 'nickname' or (method == 'alias' and first == last):
+                # Mascots and short aliases double as ordinary words
+                return all(text[tokens[i][1]].isupper() for i in range(first, last + 1))
+            return True
+
+        by_name = data['by_name']
+        mentions = []
+        for first, last, cleaned_name, method in data['mentions'].find(
+            [word for word, _, _ in tokens], accept
+        ):
+            team_info = by_name[cleaned_name]
+            start, end = tokens[first][1], tokens[last][2]
+            # Close a parenthesis opened inside the mention ("Miami (OH)")
+            while text.count('(', start, end) > text.count(')', start, end) and text[end:end + 1] == ')':
+                end += 1
+            mentions.append({
+                'canonical_name': team_info['display_name'],
+                'espn_id': team_info['team_id'],
+                'abbreviation': team_info['abbreviation'],
+                'confidence': 100.0,
+                'match_method': method,
+                'start': start,
+                'end': end,
+                'text': text[start:end],
+            })
+        return mentions
 
     def get_all_teams(self) -> List[Dict]:
         """
@@ -205,8 +1513,8 @@ class TeamNormalizer:
         Returns:
             List of all team info dictionaries
         """
-        self._ensure_data_loaded()
-        by_name = self._team_data['by_name']
+        snapshot = self._pin()[0]
+        by_name = snapshot.data['by_name']
 
         teams = []
         for team_info in by_name.values():
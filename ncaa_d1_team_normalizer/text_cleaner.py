@@ -1,7 +1,7 @@
 """Text cleaning utilities for team name normalization."""
 
 import re
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from .exceptions import InvalidInputError
 
@@ -88,13 +88,21 @@ class TextCleaner:
         'redmen',
     ]
 
+    # (suffix list it was built from, compiled patterns); see _suffix_patterns
+    _compiled_suffixes = None
+
+    # A word as remove_punctuation leaves it: letters, digits, _, ' and -
+    _WORD_PATTERN = re.compile(r"[\w'-]+")
+
     @staticmethod
-    def clean(text: str) -> str:
+    def clean(text: str, strip_suffixes: bool = True) -> str:
         """
         Full cleaning pipeline for team names.
 
         Args:
             text: Raw team name string
+            strip_suffixes: If False, keep suffixes and mascots (used to
+                recognize mascot-only input such as "Blue Devils")
 
         Returns:
             Cleaned string ready for matching
@@ -114,7 +122,8 @@ class TextCleaner:
         cleaned = text.strip()
         cleaned = cleaned.lower()
         cleaned = TextCleaner.remove_punctuation(cleaned)
-        cleaned = TextCleaner.remove_suffixes(cleaned)
+        if strip_suffixes:
+            cleaned = TextCleaner.remove_suffixes(cleaned)
         cleaned = TextCleaner.normalize_whitespace(cleaned)
 
         return cleaned
@@ -161,19 +170,59 @@ class TextCleaner:
             except ValueError:
                 pass
 
-        # Remove suffixes from the end
-        # Sort suffixes by length (longest first) to handle multi-word suffixes
-        sorted_suffixes = sorted(TextCleaner.SUFFIXES_TO_REMOVE, key=len, reverse=True)
-
         text = ' '.join(words)
 
-        for suffix in sorted_suffixes:
-            # Remove suffix if it appears at the end
-            pattern = r'\b' + re.escape(suffix) + r'\b\s*$'
-            text = re.sub(pattern, '', text)
+        # Remove suffixes from the end, longest first (multi-word suffixes
+        # before their last word); each is tried once, in order
+        for suffix, pattern in TextCleaner._suffix_patterns():
+            if suffix in text:
+                text = pattern.sub('', text)
 
         return text.strip()
 
+    @staticmethod
+    def _suffix_patterns():
+        """
+        Compiled end-of-string patterns for SUFFIXES_TO_REMOVE.
+
+        Compiled once and rebuilt only if the suffix list is changed.
+        """
+        suffixes = tuple(TextCleaner.SUFFIXES_TO_REMOVE)
+        cached = TextCleaner._compiled_suffixes
+        if cached is None or cached[0] != suffixes:
+            patterns = tuple(
+                (suffix, re.compile(r'\b' + re.escape(suffix) + r'\b\s*$'))
+                for suffix in sorted(suffixes, key=len, reverse=True)
+            )
+            cached = (suffixes, patterns)
+            TextCleaner._compiled_suffixes = cached
+        return cached[1]
+
+    @staticmethod
+    def tokenize(text: str) -> List[Tuple[str, int, int]]:
+        """
+        Split free text into cleaned words with their offsets.
+
+        Words are cleaned exactly as clean(text, strip_suffixes=False) would
+        clean them, so joining the words with spaces gives the same string.
+
+        Examples:
+            "St. John's vs A&M" -> [("st", 0, 2), ("johns", 4, 10),
+                                     ("vs", 11, 13), ("a", 14, 15), ("m", 16, 17)]
+
+        Args:
+            text: Free text (headline, bet description, ...)
+
+        Returns:
+            List of (cleaned word, start, end) with offsets into `text`
+        """
+        tokens = []
+        for word in TextCleaner._WORD_PATTERN.finditer(text):
+            cleaned = word.group().lower().replace("'", "")
+            if cleaned:
+                tokens.append((cleaned, word.start(), word.end()))
+        return tokens
+
     @staticmethod
     def normalize_whitespace(text: str) -> str:
         """
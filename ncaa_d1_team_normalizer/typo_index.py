@@ -0,0 +1,122 @@
+"""Symmetric-deletion index for fast typo lookups."""
+
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+from rapidfuzz import fuzz
+
+# Characters deleted from indexed names at build time (queries delete one)
+INDEX_DELETIONS = 2
+
+
+class TypoIndex:
+    """
+    Symmetric-deletion index over a fixed list of names.
+
+    Every name is stored under all strings reachable by deleting up to
+    INDEX_DELETIONS characters; a query is looked up under itself and its
+    single-character deletions. That finds, with a handful of dict lookups,
+    every name whose Indel distance (the distance behind fuzz.ratio) to the
+    query splits into at most one deletion from the query and
+    INDEX_DELETIONS deletions from the name, which covers any single
+    insertion, deletion, substitution or transposition.
+
+    Names outside that neighbourhood have a provable upper bound on their
+    fuzz.ratio, so best_match() can tell when its answer is exactly what a
+    full extractOne scan would return.
+    """
+
+    __slots__ = ('names', '_deletions')
+
+    def __init__(self, names: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            names: Names to index; matches refer to positions in this sequence
+        """
+        self.names = tuple(names)
+        # Deletion variant -> positions of the names that produce it (ascending)
+        self._deletions: Dict[str, Tuple[int, ...]] = {}
+
+        positions: Dict[str, list] = {}
+        for index, name in enumerate(self.names):
+            for variant in _deletion_variants(name, INDEX_DELETIONS):
+                positions.setdefault(variant, []).append(index)
+        self._deletions = {variant: tuple(found) for variant, found in positions.items()}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def best_match(self, query: str, score_cutoff: float) -> Tuple[bool, Optional[Tuple[int, float]]]:
+        """
+        Find the best fuzz.ratio match among the query's typo neighbourhood.
+
+        Results agree with process.extractOne(query, names, scorer=fuzz.ratio,
+        score_cutoff=score_cutoff): the highest score wins and ties go to the
+        earliest position. The answer is conclusive when no name outside the
+        neighbourhood could reach the cutoff, or tie or beat the best match.
+
+        Args:
+            query: Cleaned name to look up
+            score_cutoff: Minimum fuzz.ratio score (0-100)
+
+        Returns:
+            (conclusive, match) where match is (position, score) or None;
+            when conclusive is False the caller must fall back to a full scan
+        """
+        deletions = self._deletions
+        candidates: Set[int] = set(deletions.get(query, ()))
+        for i in range(len(query)):
+            found = deletions.get(query[:i] + query[i + 1:])
+            if found:
+                candidates.update(found)
+
+        best = None
+        for index in candidates:
+            score = fuzz.ratio(query, self.names[index])
+            if score < score_cutoff:
+                continue
+            if best is None or score > best[1] or (score == best[1] and index < best[0]):
+                best = (index, score)
+
+        beyond = _outside_bound(len(query))
+        if beyond < score_cutoff:
+            return True, best  # Nothing outside the neighbourhood reaches the cutoff
+        if best is not None and best[1] > beyond:
+            return True, best  # Nothing outside the neighbourhood can tie or beat it
+        return False, None
+
+
+def _deletion_variants(text: str, depth: int) -> Set[str]:
+    """All strings reachable from `text` by deleting up to `depth` characters."""
+    variants = {text}
+    frontier = {text}
+    for _ in range(depth):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        variants |= frontier
+    return variants
+
+
+def _split_score(length: int, query_deletions: int, name_deletions: int) -> float:
+    """
+    fuzz.ratio of a query and a name that share a common subsequence after
+    deleting the given numbers of characters from each.
+    """
+    total = 2 * length - query_deletions + name_deletions
+    if query_deletions > length or total <= 0:
+        return 0.0
+    return 100.0 * (1 - (query_deletions + name_deletions) / total)
+
+
+def _outside_bound(length: int) -> float:
+    """
+    Highest fuzz.ratio any name outside a query's neighbourhood can score.
+
+    Such a name needs more than one deletion from the query or more than
+    INDEX_DELETIONS from itself, and the score only falls as either count
+    grows.
+    """
+    return max(
+        _split_score(length, 2, 0),
+        _split_score(length, 0, INDEX_DELETIONS + 1),
+    )
@@ -0,0 +1,29 @@
+"""Unit tests for generated acronyms."""
+
+from ncaa_d1_team_normalizer.acronyms import initialisms, team_acronyms
+
+
+class TestAcronyms:
+    """Tests for acronym generation."""
+
+    def test_initialisms(self):
+        assert initialisms('Middle Tennessee State') == {'mts', 'mtsu', 'umts'}
+
+    def test_short_consonant_words_kept_whole(self):
+        assert 'ncsu' in initialisms('NC State')
+        assert 'tamu' in initialisms('Texas A&M')
+
+    def test_stopwords_skipped(self):
+        assert 'uab' in initialisms('University of Alabama at Birmingham')
+
+    def test_single_word_has_no_initialism(self):
+        assert initialisms('Duke') == set()
+
+    def test_team_acronyms(self):
+        acronyms = team_acronyms({
+            'display_name': 'Bowling Green',
+            'location': 'Bowling Green',
+            'full_name': 'Bowling Green Falcons',
+            'abbreviation': 'BGSU',
+        })
+        assert {'bg', 'bgu', 'bgf', 'bgsu'} <= acronyms
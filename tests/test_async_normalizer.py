@@ -0,0 +1,170 @@
+"""Unit tests for AsyncTeamNormalizer."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from ncaa_d1_team_normalizer import AsyncTeamNormalizer
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.exceptions import DataLoadError, UnknownTeamError
+
+
+@pytest.fixture
+def mock_espn_data():
+    """Fixture providing mock ESPN data."""
+    return pd.DataFrame([
+        {
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        },
+        {
+            'display_name': 'Connecticut',
+            'id': 41,
+            'abbreviation': 'CONN',
+            'location': 'Storrs',
+            'nickname': 'Huskies',
+            'name': 'Connecticut Huskies',
+        },
+    ])
+
+
+class TestAsyncTeamNormalizer:
+    """Tests for AsyncTeamNormalizer."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        ESPNDataLoader().clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_normalize(self, mock_espn, mock_espn_data):
+        """Test awaitable single normalization."""
+        mock_espn.return_value = mock_espn_data
+
+        async def run():
+            normalizer = AsyncTeamNormalizer()
+            return await normalizer.normalize('UConn')
+
+        result = asyncio.run(run())
+        assert result['canonical_name'] == 'Connecticut'
+        assert result['match_method'] == 'alias'
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_concurrent_loads_share_one_fetch(self, mock_espn, mock_espn_data):
+        """Test concurrent first calls trigger a single off-loop fetch."""
+        loop_threads = []
+
+        def slow_fetch(groups):
+            loop_threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return mock_espn_data
+
+        mock_espn.side_effect = slow_fetch
+
+        async def run():
+            normalizer = AsyncTeamNormalizer()
+            return await asyncio.gather(*(normalizer.normalize('Duke') for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        assert mock_espn.call_count == 1
+        assert loop_threads[0] is not threading.main_thread()
+        assert all(r['canonical_name'] == 'Duke' for r in results)
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_async_load_waits_for_sync_load(self, mock_espn, mock_espn_data):
+        """Test an async load started during a sync load reuses its result."""
+        started = threading.Event()
+
+        def slow_fetch(groups):
+            started.set()
+            time.sleep(0.1)
+            return mock_espn_data
+
+        mock_espn.side_effect = slow_fetch
+        loader = ESPNDataLoader()
+        thread = threading.Thread(target=loader.load_teams)
+        thread.start()
+        started.wait()
+
+        asyncio.run(loader.load_teams_async())
+        thread.join()
+
+        assert mock_espn.call_count == 1
+        assert loader.is_loaded()
+
+    @patch('ncaa_d1_team_normalizer.data_loader.time.sleep')
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_retry_backoff_does_not_block(self, mock_espn, mock_sleep, mock_espn_data):
+        """Test retries back off with asyncio.sleep, not time.sleep."""
+        mock_espn.side_effect = [Exception("Network error"), mock_espn_data]
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.1)
+
+        async def run():
+            task = asyncio.create_task(ticker())
+            await AsyncTeamNormalizer().load(max_retries=2)
+            task.cancel()
+
+        asyncio.run(run())
+
+        mock_sleep.assert_not_called()
+        # The loop kept running during the one second backoff
+        assert len(ticks) >= 5
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_load_failure(self, mock_espn):
+        """Test DataLoadError surfaces from await load()."""
+        mock_espn.side_effect = Exception("Network error")
+
+        with pytest.raises(DataLoadError, match="Failed to load ESPN data"):
+            asyncio.run(AsyncTeamNormalizer().load(max_retries=1))
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_large_batch_offloaded(self, mock_espn, mock_espn_data):
+        """Test batches at the offload threshold run in the executor."""
+        mock_espn.return_value = mock_espn_data
+        threads = []
+
+        async def run():
+            normalizer = AsyncTeamNormalizer(offload_threshold=3)
+            original = normalizer.normalizer.normalize_batch
+
+            def spy(names):
+                threads.append(threading.current_thread())
+                return original(names)
+
+            normalizer.normalizer.normalize_batch = spy
+            small = await normalizer.normalize_batch(['Duke'])
+            large = await normalizer.normalize_batch(['Duke', 'UConn', 'Duke'])
+            return small, large
+
+        small, large = asyncio.run(run())
+
+        assert threads[0] is threading.main_thread()
+        assert threads[1] is not threading.main_thread()
+        assert small[0]['canonical_name'] == 'Duke'
+        assert [r['canonical_name'] for r in large] == ['Duke', 'Connecticut', 'Duke']
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_raise_on_no_match(self, mock_espn, mock_espn_data):
+        """Test UnknownTeamError propagates through await."""
+        mock_espn.return_value = mock_espn_data
+
+        async def run():
+            normalizer = AsyncTeamNormalizer(raise_on_no_match=True)
+            await normalizer.normalize('Fake University')
+
+        with pytest.raises(UnknownTeamError):
+            asyncio.run(run())
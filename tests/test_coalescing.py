@@ -0,0 +1,154 @@
+"""Unit tests for CoalescingNormalizer."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from ncaa_d1_team_normalizer.coalescing import CoalescingNormalizer
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.exceptions import InvalidInputError, UnknownTeamError
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+@pytest.fixture
+def mock_espn_data():
+    """Fixture providing mock ESPN data."""
+    return pd.DataFrame([
+        {
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        },
+        {
+            'display_name': 'Connecticut',
+            'id': 41,
+            'abbreviation': 'CONN',
+            'location': 'Storrs',
+            'nickname': 'Huskies',
+            'name': 'Connecticut Huskies',
+        },
+    ])
+
+
+class TestCoalescingNormalizer:
+    """Tests for CoalescingNormalizer."""
+
+    def setup_method(self):
+        """Clear cache before each test."""
+        ESPNDataLoader().clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_concurrent_threads_are_batched(self, mock_espn, mock_espn_data):
+        """Test lookups from many threads are coalesced into few batches."""
+        mock_espn.return_value = mock_espn_data
+        names = ['Duke', 'UConn', 'Dukee', 'Fake University'] * 25
+
+        with CoalescingNormalizer(max_delay=0.05, max_batch_size=64) as coalescer:
+            futures = [coalescer.submit(name) for name in names]
+            results = [f.result(timeout=5) for f in futures]
+            stats = coalescer.stats()
+
+        assert [r['canonical_name'] if r else None for r in results[:4]] == \
+            ['Duke', 'Connecticut', 'Duke', None]
+        assert results[0] is not results[4]
+        assert stats['requests'] == len(names)
+        assert stats['batches'] < len(names)
+        assert stats['max_batch_size'] <= 64
+        assert stats['mean_queue_delay_ms'] >= 0.0
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_blocking_normalize_from_threads(self, mock_espn, mock_espn_data):
+        """Test the blocking API from a thread pool."""
+        mock_espn.return_value = mock_espn_data
+
+        with CoalescingNormalizer() as coalescer:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(coalescer.normalize, ['Duke', 'UConn'] * 20))
+
+        assert {r['espn_id'] for r in results} == {'150', '41'}
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_asyncio_callers(self, mock_espn, mock_espn_data):
+        """Test awaiting lookups from asyncio."""
+        mock_espn.return_value = mock_espn_data
+
+        async def run(coalescer):
+            return await asyncio.gather(*(coalescer.normalize_async(n) for n in ['Duke', 'UConn']))
+
+        with CoalescingNormalizer() as coalescer:
+            results = asyncio.run(run(coalescer))
+
+        assert [r['canonical_name'] for r in results] == ['Duke', 'Connecticut']
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_errors_are_per_request(self, mock_espn, mock_espn_data):
+        """Test bad inputs and misses fail only their own future."""
+        mock_espn.return_value = mock_espn_data
+        normalizer = TeamNormalizer(raise_on_no_match=True)
+
+        with CoalescingNormalizer(normalizer, max_delay=0.05) as coalescer:
+            good = coalescer.submit('Duke')
+            empty = coalescer.submit('')
+            missing = coalescer.submit('Fake University')
+
+            assert good.result(timeout=5)['canonical_name'] == 'Duke'
+            with pytest.raises(InvalidInputError):
+                empty.result(timeout=5)
+            with pytest.raises(UnknownTeamError, match="Fake University"):
+                missing.result(timeout=5)
+
+    def test_submit_after_close(self):
+        """Test submitting to a closed coalescer fails."""
+        coalescer = CoalescingNormalizer(TeamNormalizer())
+        coalescer.close()
+        with pytest.raises(RuntimeError):
+            coalescer.submit('Duke')
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_close_resolves_racing_submits(self, mock_espn, mock_espn_data):
+        """Test every accepted request is resolved when close() races submit()."""
+        mock_espn.return_value = mock_espn_data
+        coalescer = CoalescingNormalizer(max_delay=0)
+        futures = []
+        submitting = threading.Event()
+
+        def submit_until_closed():
+            while True:
+                try:
+                    futures.append(coalescer.submit('Duke'))
+                    submitting.set()
+                except RuntimeError:
+                    return
+
+        threads = [threading.Thread(target=submit_until_closed) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        assert submitting.wait(timeout=5)
+        coalescer.close()
+        for thread in threads:
+            thread.join()
+
+        assert all(future.done() for future in futures)
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_failed_fulfilment_fails_the_batch(self, mock_espn, mock_espn_data):
+        """Test an error while fulfilling results fails the futures, not the thread."""
+        mock_espn.return_value = mock_espn_data
+        normalizer = TeamNormalizer(raise_on_no_match=True)
+
+        with CoalescingNormalizer(normalizer, max_delay=0.05) as coalescer:
+            with patch.object(normalizer, '_no_match_error', side_effect=KeyError('boom')):
+                good = coalescer.submit('Duke')
+                missing = coalescer.submit('Fake University')
+                with pytest.raises(KeyError):
+                    missing.result(timeout=5)
+                assert good.result(timeout=5)['canonical_name'] == 'Duke'
+
+            assert coalescer.normalize('UConn', timeout=5)['canonical_name'] == 'Connecticut'
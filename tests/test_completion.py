@@ -0,0 +1,52 @@
+"""Unit tests for the typeahead prefix index."""
+
+import pytest
+
+from ncaa_d1_team_normalizer.completion import PrefixIndex, clean_prefix
+from ncaa_d1_team_normalizer.exceptions import InvalidInputError
+
+PHRASES = [
+    ('michigan', 'michigan', 'exact'),
+    ('michigan state', 'michigan state', 'exact'),
+    ('state', 'michigan state', 'word'),
+    ('msu', 'michigan state', 'alias'),
+    ('mich', 'michigan', 'abbreviation'),
+    ('penn', 'pennsylvania', 'alias'),
+    ('penn state', 'penn state', 'exact'),
+    ('pennsylvania', 'pennsylvania', 'exact'),
+]
+
+
+class TestPrefixIndex:
+    """Tests for PrefixIndex class."""
+
+    def test_ranking(self):
+        """Test exact keys, then match type, then popularity rank first."""
+        index = PrefixIndex(PHRASES)
+
+        assert index.search('mich') == [
+            ('michigan', 'mich', 'abbreviation'),
+            ('michigan state', 'michigan state', 'exact'),
+        ]
+        # Each team is listed once, under its best key
+        assert index.search('penn') == [
+            ('pennsylvania', 'penn', 'alias'),
+            ('penn state', 'penn state', 'exact'),
+        ]
+        # Within a match type, popular teams come first
+        assert [name for name, _, _ in index.search('m')] == ['michigan state', 'michigan']
+        weights = {'michigan': 10.0, 'michigan state': 1.0}
+        assert [name for name, _, _ in index.search('m', popularity=weights.get)] == [
+            'michigan', 'michigan state',
+        ]
+        assert index.search('s') == [('michigan state', 'state', 'word')]
+        assert index.search('p', limit=1) == [('pennsylvania', 'pennsylvania', 'exact')]
+        assert index.search('x') == []
+
+    def test_clean_prefix(self):
+        """Test typed text is cleaned like the index keys."""
+        assert clean_prefix("St. J") == 'st j'
+        assert clean_prefix("Blue Dev") == 'blue dev'
+        assert clean_prefix('  ') == ''
+        with pytest.raises(InvalidInputError):
+            clean_prefix(None)
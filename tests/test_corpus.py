@@ -0,0 +1,84 @@
+"""Unit tests for the noisy-name corpus generator."""
+
+from collections import Counter
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from ncaa_d1_team_normalizer.corpus import NoisyNameGenerator, read_corpus, write_corpus
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+NO_NOISE = dict(
+    mascot_rate=0, university_rate=0, punctuation_rate=0, case_rate=0, typo_rate=0, abbreviation_rate=0,
+)
+
+
+@pytest.fixture
+def mock_espn_data():
+    """Fixture providing mock ESPN data."""
+    return pd.DataFrame([
+        {'display_name': 'Duke', 'id': 150, 'abbreviation': 'DUKE', 'nickname': 'Blue Devils'},
+        {'display_name': 'North Carolina', 'id': 153, 'abbreviation': 'UNC', 'nickname': 'Tar Heels'},
+        {'display_name': 'Connecticut', 'id': 41, 'abbreviation': 'CONN', 'nickname': 'Huskies'},
+        {'display_name': "Saint Mary's", 'id': 2608, 'abbreviation': 'SMC', 'nickname': 'Gaels'},
+        {'display_name': 'Michigan State', 'id': 127, 'abbreviation': 'MSU', 'nickname': 'Spartans'},
+        {'display_name': 'Gonzaga', 'id': 2250, 'abbreviation': 'GONZ', 'nickname': 'Bulldogs'},
+    ])
+
+
+class TestNoisyNameGenerator:
+    """Tests for NoisyNameGenerator class."""
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_seeded_stream(self, mock_espn, mock_espn_data):
+        """Test the same seed gives the same stream and labels are consistent."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        first = list(NoisyNameGenerator(seed=3).generate(200))
+        assert first == list(NoisyNameGenerator(seed=3).generate(200))
+        assert first != list(NoisyNameGenerator(seed=4).generate(200))
+
+        ids = {str(row['id']): row['display_name'] for _, row in mock_espn_data.iterrows()}
+        for name in first:
+            assert ids[name.espn_id] == name.canonical_name
+            assert name.text.strip()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_clean_names_normalize_to_label(self, mock_espn, mock_espn_data):
+        """Test names without noise normalize to their labelled team."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        names = list(NoisyNameGenerator(seed=1, **NO_NOISE).generate(50))
+        assert all(name.noise == () for name in names)
+        results = TeamNormalizer().normalize_batch([name.text for name in names])
+        assert [result['espn_id'] for result in results] == [name.espn_id for name in names]
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_zipf_skew(self, mock_espn, mock_espn_data):
+        """Test a few teams dominate the stream while zipf_exponent=0 is uniform."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        skewed = Counter(name.espn_id for name in NoisyNameGenerator(zipf_exponent=2).generate(3000))
+        counts = sorted(skewed.values(), reverse=True)
+        assert counts[0] > 5 * counts[len(counts) // 2]
+
+        uniform = Counter(name.espn_id for name in NoisyNameGenerator(zipf_exponent=0).generate(3000))
+        assert len(uniform) == len(mock_espn_data)
+        assert max(uniform.values()) < 2 * min(uniform.values())
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_write_read_roundtrip(self, mock_espn, mock_espn_data, tmp_path):
+        """Test a written corpus reads back unchanged."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        names = list(NoisyNameGenerator(seed=5, typo_rate=1.0).generate(100))
+        path = str(tmp_path / 'corpus.csv')
+        assert write_corpus(path, iter(names)) == 100
+        assert list(read_corpus(path)) == names
+        assert all('typo' in name.noise for name in names)
@@ -0,0 +1,66 @@
+"""Unit tests for the ID crosswalk."""
+
+import json
+
+import numpy as np
+import pytest
+
+from ncaa_d1_team_normalizer.crosswalk import MISSING_ID, IdCrosswalk
+from ncaa_d1_team_normalizer.exceptions import DataLoadError, InvalidInputError
+
+ROWS = [
+    {'espn': '150', 'kenpom': '77', 'book': 'DUKE-M'},
+    {'espn': '153', 'kenpom': '181', 'book': 'UNC-M'},
+    {'espn': '41', 'kenpom': '', 'book': 'UCONN-M'},
+    {'espn': '2390', 'kenpom': '160'},
+]
+
+
+class TestIdCrosswalk:
+    """Tests for IdCrosswalk class."""
+
+    def test_translate(self):
+        """Test single-id translation in every direction."""
+        crosswalk = IdCrosswalk(ROWS)
+        assert crosswalk.id_spaces == ('espn', 'kenpom', 'book')
+        assert len(crosswalk) == 4
+
+        assert crosswalk.translate(150, 'espn', 'kenpom') == '77'
+        assert crosswalk.translate('UNC-M', 'book', 'espn') == '153'
+        assert crosswalk.translate('41', 'espn', 'kenpom') is None
+        assert crosswalk.translate('2390', 'espn', 'book') is None
+        assert crosswalk.translate('9999', 'espn', 'kenpom') is None
+        with pytest.raises(InvalidInputError):
+            crosswalk.translate('150', 'espn', 'ncaa')
+
+    def test_translate_ids(self):
+        """Test vectorized translation matches single translations."""
+        crosswalk = IdCrosswalk(ROWS)
+
+        ids = np.array([150, 41, 2390, 153, 9999, -5, 150])
+        kenpom = crosswalk.translate_ids(ids, 'espn', 'kenpom')
+        assert kenpom.dtype == np.int64
+        assert kenpom.tolist() == [77, MISSING_ID, 160, 181, MISSING_ID, MISSING_ID, 77]
+
+        # String ids and non-integer spaces
+        assert crosswalk.translate_ids(['153', '150'], 'espn', 'kenpom').tolist() == [181, 77]
+        assert crosswalk.translate_ids(np.array([[150], [2390]]), 'espn', 'book').tolist() == [
+            ['DUKE-M'], [None],
+        ]
+        assert crosswalk.translate_ids(['UCONN-M', 'X'], 'book', 'espn').tolist() == [41, MISSING_ID]
+
+    def test_load_files(self, tmp_path):
+        """Test CSV and JSON sources load the same table."""
+        csv_path = tmp_path / 'crosswalk.csv'
+        csv_path.write_text('espn,kenpom\n150,77\n153,181\n')
+        json_path = tmp_path / 'crosswalk.json'
+        json_path.write_text(json.dumps([{'espn': 150, 'kenpom': 77}, {'espn': 153, 'kenpom': 181}]))
+
+        for path in (csv_path, json_path):
+            crosswalk = IdCrosswalk.load(str(path))
+            assert crosswalk.translate_ids([153, 150]).tolist() == [181, 77]
+
+        with pytest.raises(DataLoadError):
+            IdCrosswalk.load(str(tmp_path / 'missing.csv'))
+        with pytest.raises(DataLoadError):
+            IdCrosswalk([{'espn': '150'}, {'espn': '150'}])
@@ -1,11 +1,15 @@
 """Unit tests for ESPNDataLoader."""
 
+import gc
+import os
+import sys
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 import pandas as pd
 
-from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.data_loader import DEFAULT_DATASET, Dataset, ESPNDataLoader, load_datasets
 from ncaa_d1_team_normalizer.exceptions import DataLoadError
 
 
@@ -23,6 +27,59 @@ class TestESPNDataLoader:
         loader2 = ESPNDataLoader()
         assert loader1 is loader2
 
+    def test_one_loader_per_dataset(self):
+        """Test each dataset gets its own singleton loader."""
+        womens = ESPNDataLoader(('basketball', 'womens', 50))
+        assert womens is ESPNDataLoader(Dataset('basketball', 'womens', '50'))
+        assert womens is not ESPNDataLoader()
+        assert ESPNDataLoader(DEFAULT_DATASET) is ESPNDataLoader()
+        assert womens.dataset == Dataset('basketball', 'womens', 50)
+
+        with pytest.raises(ValueError):
+            ESPNDataLoader(('hockey', 'mens', 50))
+        with pytest.raises(ValueError):
+            ESPNDataLoader('basketball')
+
+    @patch('sportsdataverse.wbb.espn_wbb_teams')
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_load_datasets(self, mock_mbb, mock_wbb):
+        """Test datasets load concurrently into separate indexes with separate TTLs."""
+        mock_mbb.return_value = pd.DataFrame([{
+            'display_name': 'Duke', 'id': 150, 'abbreviation': 'DUKE',
+            'location': 'Durham', 'nickname': 'Blue Devils', 'name': 'Duke Blue Devils',
+        }])
+        mock_wbb.return_value = pd.DataFrame([{
+            'display_name': 'South Carolina', 'id': 2579, 'abbreviation': 'SC',
+            'location': 'South Carolina', 'nickname': 'Gamecocks', 'name': 'South Carolina Gamecocks',
+        }])
+        womens_d1 = ('basketball', 'womens', 50)
+        womens_d2 = ('basketball', 'womens', 51)
+        for dataset in (womens_d1, womens_d2):
+            ESPNDataLoader(dataset).clear_cache()
+
+        try:
+            loaders = load_datasets([None, womens_d1, womens_d2])
+            assert list(loaders) == [DEFAULT_DATASET, womens_d1, womens_d2]
+            mock_mbb.assert_called_once_with(groups=50)
+            assert sorted(call.kwargs['groups'] for call in mock_wbb.call_args_list) == [50, 51]
+
+            assert 'duke' in ESPNDataLoader().get_team_lookup_dict()['by_name']
+            womens_lookup = ESPNDataLoader(womens_d1).get_team_lookup_dict()
+            assert list(womens_lookup['by_name']) == ['south carolina']
+
+            # Each dataset expires on its own clock
+            ESPNDataLoader(womens_d2).set_cache_ttl(0)
+            assert not ESPNDataLoader(womens_d2).is_loaded()
+            assert ESPNDataLoader(womens_d1).is_loaded()
+
+            mock_wbb.side_effect = Exception("ESPN down")
+            with pytest.raises(DataLoadError):
+                load_datasets([womens_d2], max_retries=1)
+        finally:
+            for dataset in (womens_d1, womens_d2):
+                ESPNDataLoader(dataset).set_cache_ttl(24)
+                ESPNDataLoader(dataset).clear_cache()
+
     @patch('sportsdataverse.mbb.espn_mbb_teams')
     def test_load_teams_success(self, mock_espn):
         """Test successful team data loading."""
@@ -170,3 +227,112 @@ class TestESPNDataLoader:
         assert 'duke' in lookup['by_abbrev']
         assert '150' in lookup['by_id']
         assert 'duke' in lookup['all_names']
+
+    def test_snapshot_round_trip(self, tmp_path):
+        """Test saving and loading a snapshot without fetching from ESPN."""
+        loader = ESPNDataLoader()
+        loader.load_from_dataframe(pd.DataFrame([{
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        }]))
+        path = tmp_path / 'teams.snapshot'
+        loader.save_snapshot(str(path))
+
+        loader.clear_cache()
+        with patch('sportsdataverse.mbb.espn_mbb_teams') as mock_espn:
+            loader.load_snapshot(str(path))
+            lookup = loader.get_team_lookup_dict()
+            mock_espn.assert_not_called()
+
+        assert lookup['by_name']['duke']['team_id'] == '150'
+
+    def test_snapshots_are_versioned_and_immutable(self):
+        """Test each load publishes a new read-only snapshot."""
+        loader = ESPNDataLoader()
+        df = pd.DataFrame([{
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        }])
+
+        loader.load_from_dataframe(df)
+        first = loader.get_snapshot()
+        loader.load_from_dataframe(df)
+        second = loader.get_snapshot()
+
+        assert second.version > first.version
+        assert first.data['by_name']['duke']['team_id'] == '150'
+        with pytest.raises(AttributeError):
+            first.version = 0
+        with pytest.raises(TypeError):
+            first.data['by_name'] = {}
+
+    def test_acronym_index(self):
+        """Test generated acronyms are indexed and collisions recorded."""
+        loader = ESPNDataLoader()
+        loader.load_from_dataframe(pd.DataFrame([
+            {'display_name': 'Kansas State', 'id': 2306, 'abbreviation': 'KSU',
+             'location': 'Manhattan', 'nickname': 'Wildcats', 'name': 'Kansas State Wildcats'},
+            {'display_name': 'Kent State', 'id': 2309, 'abbreviation': 'KENT',
+             'location': 'Kent', 'nickname': 'Golden Flashes', 'name': 'Kent State Golden Flashes'},
+        ]))
+        lookup = loader.get_team_lookup_dict()
+
+        assert lookup['by_acronym']['ksgf'] == 'kent state'
+        assert 'ks' not in lookup['by_acronym']
+        assert lookup['ambiguous_acronyms']['ks'] == ['kansas state', 'kent state']
+        # The ESPN abbreviation also collides with Kent State's initialism
+        assert 'ksu' in lookup['ambiguous_acronyms']
+
+    def test_load_snapshot_missing_file(self, tmp_path):
+        """Test loading a missing snapshot raises DataLoadError."""
+        loader = ESPNDataLoader()
+        with pytest.raises(DataLoadError, match="snapshot"):
+            loader.load_snapshot(str(tmp_path / 'missing.snapshot'))
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_warmup_before_fork(self, mock_espn):
+        """Test forked children reuse the warmed index without refetching."""
+        from ncaa_d1_team_normalizer import TeamNormalizer, warmup
+
+        mock_espn.return_value = pd.DataFrame([{
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        }])
+
+        try:
+            warmup()
+            assert mock_espn.call_count == 1
+
+            children = []
+            for _ in range(3):
+                pid = os.fork()
+                if pid == 0:
+                    # Child: must resolve from the inherited index only
+                    code = 1
+                    try:
+                        result = TeamNormalizer().normalize('Duke')
+                        if result['espn_id'] == '150' and mock_espn.call_count == 1:
+                            code = 0
+                    finally:
+                        sys.stdout.flush()
+                        os._exit(code)
+                children.append(pid)
+
+            for pid in children:
+                _, status = os.waitpid(pid, 0)
+                assert os.waitstatus_to_exitcode(status) == 0
+        finally:
+            gc.unfreeze()
@@ -0,0 +1,61 @@
+"""Unit tests for the season-aware name history."""
+
+import random
+from datetime import date, datetime
+
+import pytest
+
+from ncaa_d1_team_normalizer.aliases import HISTORICAL_NAMES
+from ncaa_d1_team_normalizer.exceptions import InvalidInputError
+from ncaa_d1_team_normalizer.history import NameHistory, as_of_ordinal
+
+ENTRIES = [
+    ('Fort Wayne', None, None, '2001-06-30'),
+    ('Fort Wayne', '2870', '2016-07-01', '2018-06-30'),
+    ('IPFW', '2870', '2001-07-01', '2016-06-30'),
+]
+
+
+class TestNameHistory:
+    """Tests for NameHistory class."""
+
+    def test_lookup(self):
+        """Test a day resolves to the range covering it, if any."""
+        history = NameHistory(ENTRIES)
+        day = as_of_ordinal
+
+        assert history.lookup('fort wayne', day('2017-03-01'))[2] == '2870'
+        assert history.lookup('fort wayne', day('1999-03-01'))[2] is None
+        assert history.lookup('fort wayne', day('2010-03-01')) is None
+        assert history.lookup('ipfw', day('2016-06-30'))[2] == '2870'
+        assert history.lookup('ipfw', day('2016-07-01')) is None
+        assert history.lookup('duke', day('2016-07-01')) is None
+        assert 'ipfw' in history and len(history) == 2
+
+    def test_sweep_matches_lookup(self):
+        """Test the sorted sweep agrees with single lookups in any order."""
+        history = NameHistory(HISTORICAL_NAMES)
+        rng = random.Random(7)
+        names = ['fort wayne', 'ipfw', 'st thomas', 'dixie state', 'duke']
+        start, end = date(1995, 1, 1).toordinal(), date(2026, 1, 1).toordinal()
+        queries = [(rng.choice(names), rng.randint(start, end)) for _ in range(500)]
+
+        assert history.sweep(queries) == [history.lookup(name, day) for name, day in queries]
+
+    def test_overlapping_ranges_rejected(self):
+        """Test one name cannot point at two teams on the same day."""
+        with pytest.raises(ValueError):
+            NameHistory(ENTRIES + [('IPFW', '2870', '2016-01-01', None)])
+        with pytest.raises(ValueError):
+            NameHistory([('IPFW', '2870', '2016-01-01', '2015-01-01')])
+
+    def test_as_of_ordinal(self):
+        """Test dates, datetimes and ISO strings are accepted."""
+        expected = date(2016, 3, 17).toordinal()
+        assert as_of_ordinal(date(2016, 3, 17)) == expected
+        assert as_of_ordinal(datetime(2016, 3, 17, 19, 30)) == expected
+        assert as_of_ordinal('2016-03-17') == expected
+        assert as_of_ordinal('2016-03-17T19:30:00') == expected
+        for bad in ('March 2016', 20160317, None):
+            with pytest.raises(InvalidInputError):
+                as_of_ordinal(bad)
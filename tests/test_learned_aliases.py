@@ -0,0 +1,49 @@
+"""Unit tests for LearnedAliasStore."""
+
+import json
+
+from ncaa_d1_team_normalizer.learned_aliases import LearnedAliasStore
+
+
+class TestLearnedAliasStore:
+    """Tests for LearnedAliasStore class."""
+
+    def test_hits_and_promotion(self, tmp_path):
+        """Test repeated resolutions count hits and promote past thresholds."""
+        path = str(tmp_path / 'learned.sqlite')
+        with LearnedAliasStore(path) as store:
+            store.record('kentuckey', '96', 94.1)
+            store.record_many([('kentuckey', '96', 94.1), ('vilanova', '222', 94.1)])
+
+            assert store.promoted() == {'kentuckey': ('96', 94.1), 'vilanova': ('222', 94.1)}
+            assert store.promoted(min_hits=2) == {'kentuckey': ('96', 94.1)}
+            assert store.promoted(min_score=95) == {}
+
+            entry = store.entries()['kentuckey']
+            assert entry['hits'] == 2
+            assert entry['first_seen'] <= entry['last_seen']
+
+        # Persisted across connections
+        with LearnedAliasStore(path) as store:
+            assert store.entries()['kentuckey']['hits'] == 2
+
+    def test_new_team_resets_hits(self, tmp_path):
+        """Test a name resolved to a different team starts counting again."""
+        with LearnedAliasStore(str(tmp_path / 'learned.sqlite')) as store:
+            store.record_many([('miami', '2390', 90.0), ('miami', '2390', 90.0)])
+            store.record('miami', '193', 91.0)
+
+            entry = store.entries()['miami']
+            assert (entry['team_id'], entry['hits']) == ('193', 1)
+
+    def test_exports(self, tmp_path):
+        """Test TEAM_ALIASES-style JSON and Python exports."""
+        with LearnedAliasStore(str(tmp_path / 'learned.sqlite')) as store:
+            store.record_many([('vilanova', '222', 94.1), ('gone', '999', 99.0)])
+            names = {'222': 'Villanova'}
+
+            assert json.loads(store.export_json(names)) == {'vilanova': 'Villanova'}
+            assert store.export_python(names) == (
+                "    'vilanova': 'Villanova',  # learned: score 94.1, seen 1x\n"
+            )
+            assert store.export_python(names, min_hits=2) == ''
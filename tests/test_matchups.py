@@ -0,0 +1,42 @@
+"""Unit tests for matchup string parsing."""
+
+import pytest
+
+from ncaa_d1_team_normalizer.exceptions import InvalidInputError
+from ncaa_d1_team_normalizer.matchups import parse_matchup
+
+
+class TestParseMatchup:
+    """Tests for parse_matchup function."""
+
+    @pytest.mark.parametrize('text,expected', [
+        ("Duke @ North Carolina", ("Duke", "North Carolina", False)),
+        ("Duke@UNC", ("Duke", "UNC", False)),
+        ("Duke at North Carolina", ("Duke", "North Carolina", False)),
+        ("UConn vs. Marquette", ("UConn", "Marquette", False)),
+        ("UConn v Marquette", ("UConn", "Marquette", False)),
+        ("Miami (OH) - Kent St", ("Miami (OH)", "Kent St", False)),
+        ("St. John's (NY) – Miami (FL)", ("St. John's (NY)", "Miami (FL)", False)),
+    ])
+    def test_separators(self, text, expected):
+        """Test common separators split away and home sides."""
+        assert parse_matchup(text) == expected
+
+    def test_hyphenated_names_are_not_split(self):
+        """Test hyphens inside names are not separators."""
+        assert parse_matchup("Texas A&M-Corpus Christi at Bethune-Cookman") == (
+            "Texas A&M-Corpus Christi", "Bethune-Cookman", False
+        )
+
+    def test_site_markers(self):
+        """Test neutral, home and away markers."""
+        assert parse_matchup("UConn vs Marquette (N)") == ("UConn", "Marquette", True)
+        assert parse_matchup("Gonzaga v. Baylor - Neutral Site") == ("Gonzaga", "Baylor", True)
+        assert parse_matchup("Kansas (H) vs Duke") == ("Duke", "Kansas", False)
+        assert parse_matchup("Kansas vs Duke [A]") == ("Duke", "Kansas", False)
+
+    @pytest.mark.parametrize('text', ["Duke", " @ UNC", "Duke vs (N)", None])
+    def test_unrecognized(self, text):
+        """Test strings without two sides are rejected."""
+        with pytest.raises(InvalidInputError):
+            parse_matchup(text)
@@ -0,0 +1,56 @@
+"""Unit tests for the mention automaton."""
+
+from ncaa_d1_team_normalizer.mentions import MentionAutomaton, build_mention_automaton
+
+PHRASES = {
+    ('penn',): ('pennsylvania', 'alias'),
+    ('penn', 'state'): ('penn state', 'exact'),
+    ('state',): ('state', 'exact'),
+    ('north', 'carolina'): ('north carolina', 'exact'),
+    ('carolina',): ('carolina', 'exact'),
+}
+
+
+class TestMentionAutomaton:
+    """Tests for MentionAutomaton class."""
+
+    def test_leftmost_longest_non_overlapping(self):
+        """Test overlapping phrases resolve to the leftmost, then longest."""
+        automaton = MentionAutomaton(PHRASES)
+
+        words = 'penn state beat north carolina state'.split()
+        assert automaton.find(words) == [
+            (0, 1, 'penn state', 'exact'),
+            (3, 4, 'north carolina', 'exact'),
+            (5, 5, 'state', 'exact'),
+        ]
+        # Failure links find phrases that start inside a partial match
+        assert automaton.find('north penn'.split()) == [(1, 1, 'pennsylvania', 'alias')]
+        assert automaton.find('nothing here'.split()) == []
+
+    def test_rejected_matches_do_not_block(self):
+        """Test an occurrence rejected by accept() leaves room for others."""
+        automaton = MentionAutomaton(PHRASES)
+
+        found = automaton.find(
+            'penn state'.split(),
+            accept=lambda first, last, method: method != 'exact',
+        )
+        assert found == [(0, 0, 'pennsylvania', 'alias')]
+
+    def test_build_drops_ambiguous_phrases(self):
+        """Test phrases claimed by two teams of the same source are left out."""
+        by_name = {
+            'kentucky': {'display_name': 'Kentucky', 'team_id': '1', 'nickname': 'Wildcats'},
+            'villanova': {'display_name': 'Villanova', 'team_id': '2', 'nickname': 'Wildcats'},
+        }
+        by_abbrev = {'uk': by_name['kentucky']}
+        by_nickname = {'wildcats': ['kentucky', 'villanova']}
+        automaton = build_mention_automaton(by_name, {'nova': 'villanova'}, by_abbrev, by_nickname)
+
+        words = 'kentucky wildcats vs nova wildcats uk'.split()
+        assert automaton.find(words) == [
+            (0, 1, 'kentucky', 'exact'),
+            (3, 3, 'villanova', 'alias'),
+            (5, 5, 'kentucky', 'abbreviation'),
+        ]
@@ -0,0 +1,174 @@
+"""Tests for multi-process file normalization."""
+
+import pytest
+import pandas as pd
+
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.exceptions import UnknownTeamError
+from ncaa_d1_team_normalizer.parallel import (
+    ParallelTeamNormalizer,
+    normalize_file,
+    split_ranges,
+)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    """Fixture writing a team snapshot built from offline data."""
+    loader = ESPNDataLoader()
+    loader.clear_cache()
+    loader.load_from_dataframe(pd.DataFrame([
+        {
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        },
+        {
+            'display_name': 'Connecticut',
+            'id': 41,
+            'abbreviation': 'CONN',
+            'location': 'Storrs',
+            'nickname': 'Huskies',
+            'name': 'Connecticut Huskies',
+        },
+    ]))
+    path = tmp_path / 'teams.snapshot'
+    loader.save_snapshot(str(path))
+    yield str(path)
+    loader.clear_cache()
+
+
+class TestSplitRanges:
+    """Tests for newline-aligned byte range splitting."""
+
+    def test_ranges_cover_input_on_line_boundaries(self):
+        """Test ranges are contiguous and end after a newline."""
+        data = b''.join(f"team {i}\n".encode() for i in range(100))
+        ranges = split_ranges(data, 7)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (next_start, _) in zip(ranges, ranges[1:]):
+            assert end == next_start
+            assert data[end - 1:end] == b'\n'
+
+    def test_missing_trailing_newline(self):
+        """Test last line without newline is still covered."""
+        data = b"duke\nuconn"
+        ranges = split_ranges(data, 4)
+        assert b''.join(data[s:e] for s, e in ranges) == data
+
+    def test_empty_input(self):
+        """Test empty input yields no ranges."""
+        assert split_ranges(b'', 4) == []
+
+
+class TestNormalizeFile:
+    """Tests for normalize_file."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_output_in_input_order(self, tmp_path, snapshot_path, workers):
+        """Test rows are normalized and merged in input order."""
+        names = ['Duke', 'UConn', 'Fake University', '', 'Duke Blue Devils'] * 50
+        input_path = tmp_path / 'input.txt'
+        output_path = tmp_path / 'output.tsv'
+        input_path.write_text('\n'.join(names) + '\n', encoding='utf-8')
+
+        rows = normalize_file(str(input_path), str(output_path), snapshot_path,
+                              workers=workers)
+
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert rows == len(names)
+        assert len(lines) == len(names)
+
+        first = lines[:5]
+        assert first[0].split('\t')[1:3] == ['Duke', '150']
+        assert first[1].split('\t')[1:3] == ['Connecticut', '41']
+        assert first[2].split('\t')[1] == ''
+        assert first[3].split('\t')[1] == ''
+        assert first[4].split('\t')[1:3] == ['Duke', '150']
+
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_only_newlines_split_rows(self, tmp_path, snapshot_path, workers):
+        """Test other line separators inside a line do not add output rows."""
+        input_path = tmp_path / 'input.txt'
+        output_path = tmp_path / 'output.tsv'
+        input_path.write_bytes('Duke\r\nDuke\x0cHoops\nUConn\u2028Men\nConnecticut\n'.encode('utf-8'))
+
+        rows = normalize_file(str(input_path), str(output_path), snapshot_path, workers=workers)
+
+        lines = output_path.read_bytes().decode('utf-8').split('\n')[:-1]
+        assert rows == 4
+        assert len(lines) == 4
+        assert lines[0].split('\t')[:3] == ['Duke', 'Duke', '150']
+        assert lines[3].split('\t')[1:3] == ['Connecticut', '41']
+
+    def test_serial_path_keeps_process_loader(self, tmp_path, snapshot_path):
+        """Test workers=1 does not replace the caller's loaded data."""
+        loader = ESPNDataLoader()
+        loader.load_from_dataframe(pd.DataFrame([{'display_name': 'Kansas', 'id': 2305}]))
+        before = loader.get_snapshot()
+
+        input_path = tmp_path / 'input.txt'
+        output_path = tmp_path / 'output.tsv'
+        input_path.write_text('Duke\nKansas\n', encoding='utf-8')
+        normalize_file(str(input_path), str(output_path), snapshot_path, workers=1)
+
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert lines[0].split('\t')[1:3] == ['Duke', '150']
+        assert lines[1].split('\t')[1] == ''
+        assert loader.get_snapshot() is before
+
+
+class TestParallelTeamNormalizer:
+    """Tests for ParallelTeamNormalizer."""
+
+    def test_small_batch_runs_in_process(self, snapshot_path):
+        """Test batches below min_parallel_size never start a pool."""
+        with ParallelTeamNormalizer(workers=2, min_parallel_size=100) as normalizer:
+            results = normalizer.normalize_batch(['Duke', 'UConn', 'Duke'])
+            assert normalizer._executor is None
+
+        assert [r['canonical_name'] for r in results] == ['Duke', 'Connecticut', 'Duke']
+
+    def test_large_batch_uses_pool(self, snapshot_path):
+        """Test sharded results match in-process results and input order."""
+        names = [f"Unknown Team {i}" for i in range(30)] + ['Duke', 'UConn'] * 10
+
+        with ParallelTeamNormalizer(workers=2, min_parallel_size=10, chunk_size=8) as normalizer:
+            results = normalizer.normalize_batch(names)
+            assert normalizer._executor is not None
+
+        assert results[:30] == [None] * 30
+        assert [r['espn_id'] for r in results[30:32]] == ['150', '41']
+        assert results[30] is not results[32]
+        assert len(results) == len(names)
+
+    def test_raise_on_no_match(self, snapshot_path):
+        """Test UnknownTeamError names the first unmatched input."""
+        names = ['Duke'] * 10 + ['Fake University'] + [f"Nope {i}" for i in range(10)]
+
+        with ParallelTeamNormalizer(workers=2, min_parallel_size=5,
+                                    raise_on_no_match=True) as normalizer:
+            with pytest.raises(UnknownTeamError, match="Fake University"):
+                normalizer.normalize_batch(names)
+
+    def test_pool_follows_reloaded_data(self, snapshot_path):
+        """Test a data reload restarts the pool with the new snapshot."""
+        names = [f"Unknown Team {i}" for i in range(10)] + ['Duke']
+        loader = ESPNDataLoader()
+
+        with ParallelTeamNormalizer(workers=2, min_parallel_size=5, chunk_size=4) as normalizer:
+            assert normalizer.normalize_batch(names)[-1]['espn_id'] == '150'
+            first_pool = normalizer._executor
+
+            loader.load_from_dataframe(pd.DataFrame([{
+                'display_name': 'Duke', 'id': 999999, 'abbreviation': 'DUKE',
+                'location': 'Durham', 'nickname': 'Blue Devils', 'name': 'Duke Blue Devils',
+            }]))
+            assert normalizer.normalize_batch(names)[-1]['espn_id'] == '999999'
+            assert normalizer._executor is not first_pool
@@ -0,0 +1,82 @@
+"""
+Performance regression gate against benchmarks/baseline.json.
+
+The stage benchmarks take about half a minute, so the gate only runs when
+selected explicitly:
+
+    pytest -m performance tests/test_performance.py
+    RUN_PERFORMANCE_GATE=1 pytest tests/test_performance.py
+
+Refresh the baseline after an intended change in speed with
+python benchmarks/bench_suite.py --output benchmarks/baseline.json
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import bench_suite  # noqa: E402
+
+# Times a flagged stage is measured again before it counts as a regression
+RETRIES = 2
+
+
+def _report(relative):
+    return {'stages': {name: {'relative': value} for name, value in relative.items()}}
+
+
+class TestCompare:
+    """Tests for the baseline comparison."""
+
+    def test_flags_drops_beyond_tolerance(self):
+        """Test only drops larger than a stage's tolerance are regressions."""
+        baseline = _report({'remove_suffixes': 1.0, 'fuzzy': 0.1, 'cold_start': 1e-5, 'new': 1.0})
+        current = _report({'remove_suffixes': 0.4, 'fuzzy': 0.08, 'cold_start': 0.5e-5, 'extra': 1.0})
+
+        rows = bench_suite.compare(baseline, current)
+        assert [row['stage'] for row in rows] == ['remove_suffixes', 'fuzzy', 'cold_start']
+        assert [row['regressed'] for row in rows] == [True, False, False]
+        assert rows[0]['change'] == pytest.approx(-0.6)
+        assert rows[2]['tolerance'] == bench_suite.STAGE_TOLERANCES['cold_start']
+
+        rows = bench_suite.compare(baseline, current, tolerances={'fuzzy': 0.1})
+        assert [row['regressed'] for row in rows] == [True, True, False]
+
+        table = bench_suite.format_comparison(rows)
+        assert 'remove_suffixes' in table.splitlines()[1]
+        assert table.count('REGRESSION') == 2
+
+
+@pytest.mark.performance
+def test_no_stage_regressed(request):
+    """Test no stage's calibrated throughput dropped beyond its tolerance."""
+    if request.config.getoption('markexpr') != 'performance' and not os.environ.get('RUN_PERFORMANCE_GATE'):
+        pytest.skip("select with -m performance or set RUN_PERFORMANCE_GATE=1")
+
+    with open(bench_suite.BASELINE_PATH) as fh:
+        baseline = json.load(fh)
+    try:
+        current = bench_suite.benchmark()
+        rows = bench_suite.compare(baseline, current)
+
+        # Confirm regressions on a second measurement, keeping each stage's best
+        for _ in range(RETRIES):
+            flagged = [row['stage'] for row in rows if row['regressed']]
+            if not flagged:
+                break
+            for name, result in bench_suite.benchmark(flagged)['stages'].items():
+                if result['relative'] > current['stages'][name]['relative']:
+                    current['stages'][name] = result
+            rows = bench_suite.compare(baseline, current)
+    finally:
+        ESPNDataLoader().clear_cache()
+
+    assert not any(row['regressed'] for row in rows), (
+        "Throughput regressed against benchmarks/baseline.json:\n" + bench_suite.format_comparison(rows)
+    )
@@ -0,0 +1,42 @@
+"""Unit tests for phonetic keys."""
+
+import pytest
+
+from ncaa_d1_team_normalizer.phonetic import metaphone, phonetic_key
+
+
+class TestMetaphone:
+    """Tests for metaphone()."""
+
+    @pytest.mark.parametrize('a,b', [
+        ('gonzaga', 'gonzoga'),
+        ('xavier', 'zavier'),
+        ('villanova', 'vilanova'),
+        ('creighton', 'crayton'),
+        ('michigan', 'mishigan'),
+    ])
+    def test_sound_alikes_share_key(self, a, b):
+        assert metaphone(a) == metaphone(b)
+
+    def test_distinct_names_differ(self):
+        assert metaphone('kansas') != metaphone('kentucky')
+
+    def test_special_initials(self):
+        assert metaphone('knight') == 'NT'
+        assert metaphone('wright') == 'RT'
+        assert metaphone('xavier') == 'SFR'
+
+    def test_non_letters_ignored(self):
+        assert metaphone('') == ''
+        assert metaphone('123') == ''
+
+
+class TestPhoneticKey:
+    """Tests for phonetic_key()."""
+
+    def test_multi_word(self):
+        assert phonetic_key('north carolina') == 'NR0 KRLN'
+
+    def test_short_keys_rejected(self):
+        assert phonetic_key('duke') == ''
+        assert phonetic_key('psu') == ''
@@ -0,0 +1,162 @@
+"""Tests for the HTTP normalization service."""
+
+import http.client
+import json
+import threading
+
+import pytest
+import pandas as pd
+
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.server import NormalizationServer
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+@pytest.fixture
+def server():
+    """Fixture running a NormalizationServer on a free localhost port."""
+    loader = ESPNDataLoader()
+    loader.clear_cache()
+    loader.load_from_dataframe(pd.DataFrame([
+        {
+            'display_name': 'Duke',
+            'id': 150,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        },
+        {
+            'display_name': 'Connecticut',
+            'id': 41,
+            'abbreviation': 'CONN',
+            'location': 'Storrs',
+            'nickname': 'Huskies',
+            'name': 'Connecticut Huskies',
+        },
+    ]))
+
+    server = NormalizationServer(('127.0.0.1', 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    loader.clear_cache()
+
+
+def request(conn, method, path, body=None):
+    """Send a request and return (status, decoded JSON body)."""
+    payload = json.dumps(body) if body is not None else None
+    conn.request(method, path, payload, {'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestNormalizationServer:
+    """Tests for NormalizationServer endpoints."""
+
+    def test_single_and_batch_on_one_connection(self, server):
+        """Test both endpoints over a single keep-alive connection."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+
+        status, body = request(conn, 'POST', '/normalize', {'name': 'UConn'})
+        assert status == 200
+        assert body['result']['canonical_name'] == 'Connecticut'
+
+        status, body = request(conn, 'POST', '/normalize/batch',
+                               {'names': ['Duke', 'Fake University', 'Duke']})
+        assert status == 200
+        assert [r['espn_id'] if r else None for r in body['results']] == ['150', None, '150']
+        conn.close()
+
+    def test_invalid_requests(self, server):
+        """Test malformed bodies and bad names return 400."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+
+        status, body = request(conn, 'POST', '/normalize', {'name': ''})
+        assert status == 400
+        assert 'cannot be empty' in body['error']
+
+        status, _ = request(conn, 'POST', '/normalize/batch', {'names': 'Duke'})
+        assert status == 400
+
+        conn.request('POST', '/normalize', 'not json')
+        response = conn.getresponse()
+        response.read()
+        assert response.status == 400
+
+        status, _ = request(conn, 'GET', '/nope')
+        assert status == 404
+        conn.close()
+
+    @pytest.mark.parametrize("length", ['abc', '-5'])
+    def test_invalid_content_length(self, server, length):
+        """Test a non-numeric or negative Content-Length returns 400."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+        conn.putrequest('POST', '/normalize')
+        conn.putheader('Content-Length', length)
+        conn.endheaders()
+        response = conn.getresponse()
+        body = json.loads(response.read())
+        assert response.status == 400
+        assert 'Content-Length' in body['error']
+        conn.close()
+
+    def test_oversized_body_closes_connection(self, server, monkeypatch):
+        """Test an oversized body is rejected without poisoning the connection."""
+        monkeypatch.setattr('ncaa_d1_team_normalizer.server.MAX_BODY_BYTES', 16)
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+
+        status, body = request(conn, 'POST', '/normalize', {'name': 'Duke', 'padding': 'x' * 64})
+        assert status == 400
+        assert 'too large' in body['error']
+
+        # http.client reconnects after "Connection: close"
+        status, body = request(conn, 'POST', '/normalize', {'name': 'Duke'})
+        assert status == 200
+        assert body['result']['espn_id'] == '150'
+        conn.close()
+
+    def test_health_tracks_load_state(self, server):
+        """Test /health reports readiness from the data loader."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+
+        status, body = request(conn, 'GET', '/health')
+        assert status == 200
+        assert body['ready'] is True
+
+        ESPNDataLoader().clear_cache()
+        status, body = request(conn, 'GET', '/health')
+        assert status == 503
+        assert body['ready'] is False
+        conn.close()
+
+    def test_metrics(self, server):
+        """Test /metrics counts requests and names."""
+        conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+        request(conn, 'POST', '/normalize', {'name': 'Duke'})
+        request(conn, 'POST', '/normalize/batch', {'names': ['Duke', 'UConn']})
+
+        status, body = request(conn, 'GET', '/metrics')
+        assert status == 200
+        assert body['requests']['/normalize'] == 1
+        assert body['requests']['/normalize/batch'] == 1
+        assert body['names_normalized'] == 3
+        assert body['result_cache_size'] == 2
+        conn.close()
+
+    def test_health_follows_normalizer_dataset(self, server):
+        """Test a server for another dataset reports that dataset's loader."""
+        womens = ESPNDataLoader(('basketball', 'womens', 50))
+        womens.clear_cache()
+        other = NormalizationServer(('127.0.0.1', 0), TeamNormalizer(dataset=('basketball', 'womens', 50)))
+        try:
+            assert other.data_loader is womens
+            assert not other.data_loader.is_loaded()
+
+            womens.load_from_dataframe(pd.DataFrame([{'display_name': 'South Carolina', 'id': 2579}]))
+            assert other.data_loader.is_loaded()
+        finally:
+            other.server_close()
+            womens.clear_cache()
@@ -0,0 +1,160 @@
+"""Tests for the memory-mapped shared index file."""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.exceptions import DataLoadError
+from ncaa_d1_team_normalizer.shared_index import SharedIndex, publish_index
+from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
+
+
+def teams_frame(duke_id=150):
+    """Build a small ESPN-shaped team table."""
+    return pd.DataFrame([
+        {
+            'display_name': 'Duke',
+            'id': duke_id,
+            'abbreviation': 'DUKE',
+            'location': 'Durham',
+            'nickname': 'Blue Devils',
+            'name': 'Duke Blue Devils',
+        },
+        {
+            'display_name': 'Connecticut',
+            'id': 41,
+            'abbreviation': 'CONN',
+            'location': 'Storrs',
+            'nickname': 'Huskies',
+            'name': 'Connecticut Huskies',
+        },
+    ])
+
+
+@pytest.fixture
+def loader():
+    """Fixture providing a loader populated with offline data."""
+    loader = ESPNDataLoader()
+    loader.clear_cache()
+    loader.load_from_dataframe(teams_frame())
+    yield loader
+    loader.clear_cache()
+
+
+class TestSharedIndex:
+    """Tests for publish_index and SharedIndex."""
+
+    def test_lookups_without_parsing(self, tmp_path, loader):
+        """Test section lookups read values straight from the mapped file."""
+        path = str(tmp_path / 'teams.idx')
+        publish_index(path, loader.get_team_lookup_dict())
+
+        shared = SharedIndex(path)
+        by_name = shared.section('by_name')
+
+        assert by_name['duke']['team_id'] == '150'
+        assert 'connecticut' in by_name
+        assert 'kansas' not in by_name
+        assert sorted(by_name) == ['connecticut', 'duke']
+        assert shared.section('by_id')['41']['display_name'] == 'Connecticut'
+        assert shared.lookup_dict()['all_names'] == ('duke', 'connecticut')
+
+    def test_normalizer_over_shared_index(self, tmp_path, loader):
+        """Test TeamNormalizer works unchanged on a mapped index."""
+        path = str(tmp_path / 'teams.idx')
+        publish_index(path, loader.get_team_lookup_dict())
+        loader.clear_cache()
+
+        with patch('sportsdataverse.mbb.espn_mbb_teams') as mock_espn:
+            loader.attach_shared_index(path)
+            normalizer = TeamNormalizer(fuzzy_threshold=70)
+            assert normalizer.normalize('UConn')['canonical_name'] == 'Connecticut'
+            assert normalizer.normalize('Dukee')['match_method'] == 'fuzzy'
+            assert normalizer.normalize_batch(['Duke', 'Conneticut'])[1]['espn_id'] == '41'
+            mock_espn.assert_not_called()
+
+    def test_derived_structures_built_on_first_use(self, tmp_path, loader):
+        """Test attaching builds nothing until a feature needs it."""
+        path = str(tmp_path / 'teams.idx')
+        publish_index(path, loader.get_team_lookup_dict())
+        loader.clear_cache()
+
+        with patch('sportsdataverse.mbb.espn_mbb_teams') as mock_espn:
+            loader.attach_shared_index(path)
+            lookup = loader.get_team_lookup_dict()
+            assert lookup._values == {}
+            assert 'mentions' in lookup
+
+            normalizer = TeamNormalizer()
+            assert normalizer.normalize('Duke')['match_method'] == 'exact'
+            assert not {'typo_index', 'mentions', 'completions'} & set(lookup._values)
+
+            assert normalizer.extract_teams('Duke at UConn')[1]['canonical_name'] == 'Connecticut'
+            assert 'mentions' in lookup._values
+            assert 'completions' not in lookup._values
+            mock_espn.assert_not_called()
+
+    def test_attached_index_ignores_ttl(self, tmp_path, loader):
+        """Test an attached index stays ready and is never refetched after the TTL."""
+        path = str(tmp_path / 'teams.idx')
+        publish_index(path, loader.get_team_lookup_dict())
+        loader.clear_cache()
+
+        with patch('sportsdataverse.mbb.espn_mbb_teams') as mock_espn:
+            loader.attach_shared_index(path)
+            loader._last_load_time = datetime.now() - timedelta(days=2)
+
+            assert loader.is_loaded()
+            loader.load_teams()
+            asyncio.run(loader.load_teams_async())
+            mock_espn.assert_not_called()
+            assert loader.get_team_lookup_dict()['by_name']['duke']['team_id'] == '150'
+
+    def test_readers_remap_new_version(self, tmp_path, loader):
+        """Test an atomic republish is picked up by attached readers."""
+        path = str(tmp_path / 'teams.idx')
+        first = publish_index(path, loader.get_team_lookup_dict())
+
+        reader = ESPNDataLoader()
+        reader.attach_shared_index(path, check_seconds=0)
+        old_lookup = reader.get_team_lookup_dict()
+
+        writer_data = ESPNDataLoader()._build_lookup_dict(teams_frame(duke_id=999))
+        second = publish_index(path, writer_data)
+        assert second > first
+
+        new_lookup = reader.get_team_lookup_dict()
+        assert new_lookup['by_name']['duke']['team_id'] == '999'
+        # Views handed out earlier keep reading their own version
+        assert old_lookup['by_name']['duke']['team_id'] == '150'
+
+    def test_persisted_result_cache(self, tmp_path, loader):
+        """Test results published with the index are reused by matching config."""
+        warm = TeamNormalizer(fuzzy_threshold=70)
+        warm.normalize_batch(['Dukee', 'Fake University'])
+
+        path = str(tmp_path / 'teams.idx')
+        publish_index(path, loader.get_team_lookup_dict(), normalizer=warm)
+        loader.attach_shared_index(path)
+
+        same = TeamNormalizer(fuzzy_threshold=70)
+        with patch.object(same, '_fuzzy_match') as fuzzy:
+            assert same.normalize('Dukee')['canonical_name'] == 'Duke'
+            assert same.normalize('Fake University') is None
+            fuzzy.assert_not_called()
+
+        different = TeamNormalizer(fuzzy_threshold=95)
+        assert different.normalize('Dukee') is None
+
+    def test_invalid_file(self, tmp_path):
+        """Test mapping a non-index file raises DataLoadError."""
+        path = tmp_path / 'bogus.idx'
+        path.write_bytes(b'not an index file at all')
+        with pytest.raises(DataLoadError, match="Unsupported"):
+            SharedIndex(str(path))
+        with pytest.raises(DataLoadError):
+            SharedIndex(str(tmp_path / 'missing.idx'))
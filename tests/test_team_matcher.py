@@ -1,11 +1,19 @@
 """Unit tests for TeamNormalizer."""
 
+from datetime import date
+
 import pytest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 
+from ncaa_d1_team_normalizer.aliases import SOURCE_ALIASES, register_source_aliases
+from ncaa_d1_team_normalizer.crosswalk import IdCrosswalk
+from ncaa_d1_team_normalizer.data_loader import ESPNDataLoader
+from ncaa_d1_team_normalizer.matchups import Matchup
 from ncaa_d1_team_normalizer.team_matcher import TeamNormalizer
-from ncaa_d1_team_normalizer.exceptions import UnknownTeamError, InvalidInputError
+from ncaa_d1_team_normalizer.exceptions import (
+    AmbiguousTeamError, DataLoadError, UnknownTeamError, InvalidInputError,
+)
 
 
 @pytest.fixture
@@ -206,3 +214,524 @@ class TestTeamNormalizer:
         assert all(isinstance(team, dict) for team in all_teams)
         assert all('canonical_name' in team for team in all_teams)
         assert all('espn_id' in team for team in all_teams)
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_batch_deduplicates_inputs(self, mock_espn, mock_espn_data):
+        """Test repeated names are matched once but get separate results."""
+        mock_espn.return_value = mock_espn_data
+
+        normalizer = TeamNormalizer()
+        with patch.object(normalizer, '_match_hashed',
+                          wraps=normalizer._match_hashed) as match:
+            results = normalizer.normalize_batch(['Duke', 'UConn', 'Duke', 'Duke'])
+
+        assert match.call_count == 2
+        assert [r['canonical_name'] for r in results] == ['Duke', 'Connecticut', 'Duke', 'Duke']
+        assert results[0] is not results[2]
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_result_cache(self, mock_espn, mock_espn_data):
+        """Test cleaned names are served from the bounded result cache."""
+        mock_espn.return_value = mock_espn_data
+
+        normalizer = TeamNormalizer(cache_size=2)
+        first = normalizer.normalize('Duke')
+        first['canonical_name'] = 'mutated'
+
+        # Different raw input, same cleaned name -> cached, unaffected by mutation
+        assert normalizer.normalize('DUKE Blue Devils')['canonical_name'] == 'Duke'
+
+        normalizer.normalize('UConn')
+        normalizer.normalize('Penn')
+        assert len(normalizer._result_cache) == 2
+        assert 'duke' not in normalizer._result_cache
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_batch_fuzzy_matches_single_path(self, mock_espn, mock_espn_data):
+        """Test batched fuzzy scoring agrees with per-name extractOne."""
+        mock_espn.return_value = mock_espn_data
+        names = ['Duk', 'North Carolena', 'Pensylvania', 'Conneticut', 'Fake University']
+
+        single = [TeamNormalizer(fuzzy_threshold=70, cache_size=0).normalize(n) for n in names]
+        batch = TeamNormalizer(fuzzy_threshold=70, cache_size=0).normalize_batch(names)
+
+        assert batch == single
+        assert batch[1]['match_method'] == 'fuzzy'
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_acronym_match(self, mock_espn, mock_espn_data):
+        """Test generated acronyms resolve without aliases."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        result = normalizer.normalize('C.G.U.')
+        assert result['canonical_name'] == 'Miami (FL)'
+        assert result['match_method'] == 'acronym'
+
+        # Hand-written aliases take precedence over generated acronyms
+        assert normalizer.normalize('PSU')['match_method'] == 'alias'
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_nickname_from_espn_data(self, mock_espn, mock_espn_data):
+        """Test mascots missing from the static suffix list are handled."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        result = normalizer.normalize('Pennsylvania Quakers')
+        assert result['canonical_name'] == 'Pennsylvania'
+        assert result['match_method'] == 'exact'
+
+        result = normalizer.normalize('Blue Devils')
+        assert result['canonical_name'] == 'Duke'
+        assert result['match_method'] == 'nickname'
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_multiword_nickname_ending_in_static_suffix(self, mock_espn, mock_espn_data):
+        """Test whole ESPN mascots are stripped before the static suffix list."""
+        mock_espn.return_value = pd.concat([mock_espn_data, pd.DataFrame([{
+            'display_name': 'Texas Tech',
+            'id': 2641,
+            'abbreviation': 'TTU',
+            'location': 'Lubbock',
+            'nickname': 'Red Raiders',
+            'name': 'Texas Tech Red Raiders',
+        }, {
+            'display_name': 'Middle Tennessee',
+            'id': 2393,
+            'abbreviation': 'MTSU',
+            'location': 'Murfreesboro',
+            'nickname': 'Blue Raiders',
+            'name': 'Middle Tennessee Blue Raiders',
+        }])], ignore_index=True)
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        for name, canonical in [('Texas Tech Red Raiders', 'Texas Tech'),
+                                ('Middle Tennessee Blue Raiders', 'Middle Tennessee'),
+                                ('University of Texas Tech Red Raiders', 'Texas Tech')]:
+            result = normalizer.normalize(name)
+            assert result['canonical_name'] == canonical
+            assert result['match_method'] == 'exact'
+            assert result['confidence'] == 100
+        ESPNDataLoader().clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_ambiguous_nickname(self, mock_espn, mock_espn_data):
+        """Test mascots shared by several teams are flagged, not guessed."""
+        mock_espn.return_value = pd.concat([mock_espn_data, pd.DataFrame([{
+            'display_name': 'Jacksonville',
+            'id': 294,
+            'abbreviation': 'JAX',
+            'location': 'Jacksonville',
+            'nickname': 'Dolphins',
+            'name': 'Jacksonville Dolphins',
+        }, {
+            'display_name': 'Le Moyne',
+            'id': 2330,
+            'abbreviation': 'LEM',
+            'location': 'Syracuse',
+            'nickname': 'Dolphins',
+            'name': 'Le Moyne Dolphins',
+        }])], ignore_index=True)
+        ESPNDataLoader().clear_cache()
+
+        assert TeamNormalizer().normalize('Dolphins') is None
+        assert TeamNormalizer().normalize('Le Moyne Dolphins')['canonical_name'] == 'Le Moyne'
+
+        with pytest.raises(AmbiguousTeamError) as exc_info:
+            TeamNormalizer(raise_on_no_match=True).normalize_batch(['Duke', 'Dolphins'])
+        assert exc_info.value.candidates == ['Jacksonville', 'Le Moyne']
+        assert isinstance(exc_info.value, UnknownTeamError)
+        ESPNDataLoader().clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_phonetic_match(self, mock_espn, mock_espn_data):
+        """Test sound-alike spellings match by phonetic key when enabled."""
+        mock_espn.return_value = mock_espn_data
+
+        result = TeamNormalizer(phonetic=True).normalize('Pensilvania')
+        assert result['canonical_name'] == 'Pennsylvania'
+        assert result['match_method'] == 'phonetic'
+        assert result['confidence'] < 100
+
+        assert TeamNormalizer().normalize('Pensilvania')['match_method'] == 'fuzzy'
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_tiered_fuzzy_scoring(self, mock_espn, mock_espn_data):
+        """Test a prefilter plus token-based rescoring matches reordered names."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        assert TeamNormalizer().normalize('Carolina North') is None
+
+        for config in ({'scorer': 'token_set_ratio'},
+                       {'scorer': 'WRatio', 'prefilter': 'ratio'},
+                       {'scorer': 'WRatio', 'prefilter': 'token_sort_ratio'}):
+            normalizer = TeamNormalizer(**config)
+            result = normalizer.normalize('Carolina North')
+            assert result['canonical_name'] == 'North Carolina'
+            assert result['match_method'] == 'fuzzy'
+
+            names = ['Carolina North', 'State Penn', 'Dukee', 'Fake University']
+            single = [TeamNormalizer(**config).normalize(name) for name in names]
+            assert normalizer.normalize_batch(names) == single
+
+        # Survivors below the prefilter cutoff are never rescored
+        strict = TeamNormalizer(scorer='WRatio', prefilter='ratio', prefilter_cutoff=99)
+        assert strict.normalize('Carolina North') is None
+
+        with pytest.raises(ValueError):
+            TeamNormalizer(scorer='levenshtein')
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_extract_teams(self, mock_espn, mock_espn_data):
+        """Test team mentions are extracted from free text with offsets."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        text = "Duke Blue Devils vs UNC 1H Spread; Penn State, Tar Heels, PSU"
+        mentions = normalizer.extract_teams(text)
+
+        assert [(m['canonical_name'], m['match_method']) for m in mentions] == [
+            ('Duke', 'exact'),
+            ('North Carolina', 'alias'),
+            ('Penn State', 'exact'),
+            ('North Carolina', 'nickname'),
+            ('Penn State', 'alias'),
+        ]
+        for mention in mentions:
+            assert text[mention['start']:mention['end']] == mention['text']
+        assert mentions[0]['text'] == 'Duke Blue Devils'
+
+        # Abbreviations only count in capitals, mascots and one-word aliases
+        # only capitalized
+        assert [m['text'] for m in normalizer.extract_teams("MIA won but mia did not")] == ['MIA']
+        assert normalizer.extract_teams("the huskies and quakers, psu and uconn fans") == []
+        assert [m['text'] for m in normalizer.extract_teams("Huskies beat the Quakers")] == [
+            'Huskies', 'Quakers',
+        ]
+
+        # A parenthesis opened inside a mention is included in its span
+        mentions = normalizer.extract_teams("UNC at Miami (FL), tonight")
+        assert mentions[1]['text'] == 'Miami (FL)'
+        assert mentions[1]['canonical_name'] == 'Miami (FL)'
+
+        texts = ["Connecticut at Pennsylvania", "", "no teams here"]
+        assert normalizer.extract_teams_batch(texts) == [
+            normalizer.extract_teams(text) for text in texts
+        ]
+
+        with pytest.raises(InvalidInputError):
+            normalizer.extract_teams(None)
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_normalize_matchups(self, mock_espn, mock_espn_data):
+        """Test both sides of matchup strings resolve to ESPN ids."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        assert normalizer.normalize_matchup("Duke @ North Carolina") == Matchup('150', '153', False)
+        assert normalizer.normalize_matchup("UConn vs. Penn State (N)") == Matchup('41', '213', True)
+        assert normalizer.normalize_matchup("Miami (FL) - Pennsylvania") == Matchup('2390', '219', False)
+
+        feed = ["Duke @ UNC", "Fake University @ Duke", "Duke @ UNC"]
+        assert normalizer.normalize_matchups(feed) == [
+            Matchup('150', '153', False), None, Matchup('150', '153', False),
+        ]
+
+        with pytest.raises(UnknownTeamError):
+            TeamNormalizer(raise_on_no_match=True).normalize_matchup("Fake University @ Duke")
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_learned_aliases(self, mock_espn, mock_espn_data, tmp_path):
+        """Test confirmed fuzzy matches are promoted to hash lookups."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+        path = str(tmp_path / 'learned.sqlite')
+
+        normalizer = TeamNormalizer(learned_aliases=path, promote_hits=2)
+        assert normalizer.normalize('Pennsylvnia')['match_method'] == 'fuzzy'
+        normalizer.clear_cache()
+        assert normalizer.normalize_batch(['Pennsylvnia'])[0]['match_method'] == 'fuzzy'
+
+        # Seen twice: promoted once the store is reloaded
+        normalizer.reload_learned_aliases()
+        result = normalizer.normalize('Pennsylvnia')
+        assert result['canonical_name'] == 'Pennsylvania'
+        assert result['match_method'] == 'learned'
+        assert result['confidence'] >= 95
+
+        fresh = TeamNormalizer(learned_aliases=path, promote_hits=2)
+        assert fresh.normalize_batch(['Pennsylvnia'])[0]['match_method'] == 'learned'
+
+        # Single lookups are buffered, then written on flush or close
+        other = str(tmp_path / 'other.sqlite')
+        with TeamNormalizer(learned_aliases=other) as buffered:
+            buffered.normalize('Conneticut')
+            assert buffered._learned_store.entries() == {}
+            buffered.flush_learned_aliases()
+            assert list(buffered._learned_store.entries()) == ['conneticut']
+            buffered.normalize('Pennsylvnia')
+        assert TeamNormalizer(learned_aliases=other, promote_hits=1)._learned_index.keys() == {
+            'conneticut', 'pennsylvnia',
+        }
+
+        # Fuzzy matches below learn_threshold are never recorded
+        assert TeamNormalizer(learned_aliases=path).normalize('Conecticutt')['match_method'] == 'fuzzy'
+        assert 'conecticutt' not in normalizer._learned_store.entries()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_source_alias_overlays(self, mock_espn, mock_espn_data):
+        """Test per-source overlays, isolated caches and hit stats."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        register_source_aliases('book_a', {'Canes': 'Miami (FL)'})
+        register_source_aliases('book_b', {'The U': 'Connecticut'})
+        try:
+            normalizer = TeamNormalizer()
+
+            result = normalizer.normalize('Canes', source='book_a')
+            assert result['canonical_name'] == 'Miami (FL)'
+            assert result['match_method'] == 'source_alias'
+            assert normalizer.normalize('Canes') is None
+            assert normalizer.normalize('Canes', source='book_b') is None
+
+            # A source overrides the global aliases for its own lookups only
+            assert normalizer.normalize('The U')['canonical_name'] == 'Miami (FL)'
+            assert normalizer.normalize('The U', source='book_b')['canonical_name'] == 'Connecticut'
+            assert normalizer.normalize_batch(['The U', 'Duke'], source='book_b') == [
+                normalizer.normalize('The U', source='book_b'),
+                normalizer.normalize('Duke', source='book_b'),
+            ]
+
+            stats = normalizer.source_stats('book_b')
+            assert stats['lookups'] == 6
+            assert stats['cache_hits'] == 3
+            assert stats['cache_size'] == 3
+            assert stats['match_methods'] == {'unmatched': 1, 'source_alias': 3, 'exact': 2}
+            assert normalizer.source_stats('book_a')['cache_size'] == 1
+
+            # Re-registering an overlay takes effect with a fresh cache
+            register_source_aliases('book_a', {'Canes': 'Duke'})
+            assert normalizer.normalize('Canes', source='book_a')['canonical_name'] == 'Duke'
+
+            normalizer.reset_source_stats()
+            assert normalizer.source_stats('book_b')['lookups'] == 0
+        finally:
+            SOURCE_ALIASES.pop('book_a', None)
+            SOURCE_ALIASES.pop('book_b', None)
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_dataset_selection(self, mock_espn, mock_espn_data):
+        """Test normalizers for different datasets use separate indexes."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+        womens = ('basketball', 'womens', 50)
+        ESPNDataLoader(womens).load_from_dataframe(pd.DataFrame([{
+            'display_name': 'South Carolina',
+            'id': 2579,
+            'abbreviation': 'SC',
+            'location': 'South Carolina',
+            'nickname': 'Gamecocks',
+            'name': 'South Carolina Gamecocks',
+        }]))
+
+        try:
+            normalizer = TeamNormalizer(dataset=womens)
+            assert normalizer.normalize('South Carolina Gamecocks')['espn_id'] == '2579'
+            assert normalizer.normalize('Duke') is None
+            assert TeamNormalizer().normalize('Duke')['espn_id'] == '150'
+            assert TeamNormalizer().normalize('South Carolina')['espn_id'] != '2579'
+            assert normalizer._match_config()['dataset'] == list(womens)
+        finally:
+            ESPNDataLoader(womens).clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_complete(self, mock_espn, mock_espn_data):
+        """Test typeahead over names, aliases, abbreviations and mascots."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+        normalizer = TeamNormalizer()
+
+        assert [r['canonical_name'] for r in normalizer.complete('Penn')] == ['Pennsylvania', 'Penn State']
+        first = normalizer.complete('Blue Dev')[0]
+        assert (first['espn_id'], first['match_method'], first['matched']) == ('150', 'nickname', 'blue devils')
+        assert normalizer.complete('carolina')[0]['match_method'] == 'word'
+        assert normalizer.complete('') == []
+
+        for espn_id, expected in (('219', 'Pennsylvania'), ('213', 'Penn State')):
+            normalizer.set_popularity({espn_id: 5})
+            assert [r['canonical_name'] for r in normalizer.complete('p', limit=1)] == [expected]
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_id_space(self, mock_espn, mock_espn_data):
+        """Test results carry ids from the loaded crosswalk."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+        normalizer = TeamNormalizer()
+
+        with pytest.raises(DataLoadError):
+            normalizer.normalize('Duke', id_space='kenpom')
+
+        ESPNDataLoader().load_crosswalk(IdCrosswalk([
+            {'espn': '150', 'kenpom': '77'},
+            {'espn': '153', 'kenpom': '181'},
+        ]))
+        try:
+            assert normalizer.normalize('Duke', id_space='kenpom')['kenpom_id'] == '77'
+            assert normalizer.normalize('UConn', id_space='kenpom')['kenpom_id'] is None
+            assert [r and r['kenpom_id'] for r in normalizer.normalize_batch(
+                ['UNC', 'Fake University', 'Duke'], id_space='kenpom',
+            )] == ['181', None, '77']
+            assert normalizer.translate_ids([153, 150], 'espn', 'kenpom').tolist() == [181, 77]
+            with pytest.raises(InvalidInputError):
+                normalizer.normalize('Duke', id_space='ncaa')
+        finally:
+            ESPNDataLoader().clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_as_of_historical_names(self, mock_espn, mock_espn_data):
+        """Test renamed programs resolve by the date the name was used on."""
+        mock_espn.return_value = pd.concat([mock_espn_data, pd.DataFrame([{
+            'display_name': 'Detroit Mercy',
+            'id': 2174,
+            'abbreviation': 'DET',
+            'location': 'Detroit Mercy',
+            'nickname': 'Titans',
+            'name': 'Detroit Mercy Titans',
+        }, {
+            'display_name': 'Purdue Fort Wayne',
+            'id': 2870,
+            'abbreviation': 'PFW',
+            'location': 'Purdue Fort Wayne',
+            'nickname': 'Mastodons',
+            'name': 'Purdue Fort Wayne Mastodons',
+        }, {
+            'display_name': 'UT Rio Grande Valley',
+            'id': 292,
+            'abbreviation': 'UTRGV',
+            'location': 'UT Rio Grande Valley',
+            'nickname': 'Vaqueros',
+            'name': 'UT Rio Grande Valley Vaqueros',
+        }, {
+            'display_name': 'Utah Tech',
+            'id': 3101,
+            'abbreviation': 'UTU',
+            'location': 'Utah Tech',
+            'nickname': 'Trailblazers',
+            'name': 'Utah Tech Trailblazers',
+        }])], ignore_index=True)
+        ESPNDataLoader().clear_cache()
+        normalizer = TeamNormalizer()
+
+        result = normalizer.normalize('Detroit Titans', as_of=date(2015, 1, 10))
+        assert result['canonical_name'] == 'Detroit Mercy'
+        assert result['match_method'] == 'historical'
+        assert normalizer.normalize('IPFW', as_of='2014-02-01')['espn_id'] == '2870'
+
+        # Outside its range a name goes through the regular pipeline
+        assert normalizer.normalize('IPFW', as_of='2019-02-01')['match_method'] == 'alias'
+        assert normalizer.normalize('Duke', as_of='2015-01-10')['match_method'] == 'exact'
+        # A name that referred to no Division I team that day does not match
+        assert normalizer.normalize('St. Thomas', as_of='2019-01-05') is None
+        for name in ('Dixie State', 'Utah Tech'):
+            assert normalizer.normalize(name, as_of='2019-01-05') is None
+        assert normalizer.normalize('Dixie State', as_of='2021-01-05')['espn_id'] == '3101'
+        assert normalizer.normalize('Utah Tech', as_of='2023-01-05')['match_method'] == 'exact'
+
+        for name in ('Texas-Pan American', 'Texas Pan American'):
+            assert normalizer.normalize(name, as_of='2014-02-01')['canonical_name'] == 'UT Rio Grande Valley'
+
+        names = ['Fort Wayne', 'IPFW', 'Duke', 'Fort Wayne', 'IPFW']
+        dates = ['2017-01-01', '2015-12-01', '2015-12-01', '2015-12-01', None]
+        batch = normalizer.normalize_batch(names, as_of=dates)
+        assert batch == [
+            normalizer.normalize(name, as_of=day) for name, day in zip(names, dates)
+        ]
+        assert [r['match_method'] for r in batch] == [
+            'historical', 'historical', 'exact', 'alias', 'alias',
+        ]
+
+        with pytest.raises(InvalidInputError):
+            normalizer.normalize('Detroit', as_of='last season')
+        with pytest.raises(InvalidInputError):
+            normalizer.normalize_batch(['Detroit', 'Duke'], as_of=['2015-01-10'])
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_candidates(self, mock_espn, mock_espn_data):
+        """Test top-k candidates are scored once and ordered by confidence."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        candidates = normalizer.candidates('Pen State', k=3)
+        assert len(candidates) == 3
+        assert candidates[0]['canonical_name'] == 'Penn State'
+        assert all(c['match_method'] == 'fuzzy' for c in candidates)
+        assert [c['confidence'] for c in candidates] == sorted(
+            (c['confidence'] for c in candidates), reverse=True
+        )
+
+        # Only candidates at or above score_cutoff are listed
+        assert normalizer.candidates('Fake University', score_cutoff=90) == []
+
+        # Exact and alias hits short-circuit
+        assert normalizer.candidates('UConn') == [normalizer.normalize('UConn')]
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_candidates_batch_matches_single(self, mock_espn, mock_espn_data):
+        """Test batched candidates agree with per-name candidates."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+        names = ['Pen State', 'Duke', 'Miama', 'Pen State', 'Carolina North']
+
+        normalizer = TeamNormalizer()
+        batch = normalizer.candidates_batch(names, k=4, score_cutoff=20)
+        assert batch == [normalizer.candidates(n, k=4, score_cutoff=20) for n in names]
+        assert batch[0] is not batch[3]
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_picks_up_new_snapshot(self, mock_espn, mock_espn_data):
+        """Test a long-lived normalizer sees reloaded data without stale cache hits."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer()
+        assert normalizer.normalize('Duke')['espn_id'] == '150'
+
+        reloaded = mock_espn_data.copy()
+        reloaded.loc[reloaded['display_name'] == 'Duke', 'id'] = 9150
+        normalizer._data_loader.load_from_dataframe(reloaded)
+
+        assert normalizer.normalize('Duke')['espn_id'] == '9150'
+        assert len(normalizer._result_cache) == 1
+        normalizer._data_loader.clear_cache()
+
+    @patch('sportsdataverse.mbb.espn_mbb_teams')
+    def test_batch_pins_one_snapshot(self, mock_espn, mock_espn_data):
+        """Test a reload during a batch does not mix index versions."""
+        mock_espn.return_value = mock_espn_data
+        ESPNDataLoader().clear_cache()
+
+        normalizer = TeamNormalizer(cache_size=0)
+        loader = normalizer._data_loader
+        reloaded = mock_espn_data.copy()
+        reloaded['id'] = reloaded['id'] + 9000
+        original_match = normalizer._match_hashed
+
+        def reload_midway(cleaned_name, data):
+            result = original_match(cleaned_name, data)
+            loader.load_from_dataframe(reloaded)
+            return result
+
+        with patch.object(normalizer, '_match_hashed', side_effect=reload_midway):
+            results = normalizer.normalize_batch(['Duke', 'UConn', 'Penn State'])
+
+        assert [r['espn_id'] for r in results] == ['150', '41', '213']
+        assert normalizer.normalize('Duke')['espn_id'] == '9150'
+        loader.clear_cache()
@@ -26,6 +26,17 @@ class TestTextCleaner:
         assert TextCleaner.clean("North Carolina Tar Heels") == "north carolina"
         assert TextCleaner.clean("Kentucky Wildcats") == "kentucky"
 
+    def test_clean_keeping_suffixes(self):
+        """Test cleaning without suffix removal (mascot-only input)."""
+        assert TextCleaner.clean("Blue  Devils", strip_suffixes=False) == "blue devils"
+        assert TextCleaner.clean("Duke University", strip_suffixes=False) == "duke university"
+
+    def test_suffix_list_changes_apply(self, monkeypatch):
+        """Test compiled suffix patterns follow changes to the suffix list."""
+        assert TextCleaner.clean("Akron Zips") == "akron zips"
+        monkeypatch.setattr(TextCleaner, 'SUFFIXES_TO_REMOVE', TextCleaner.SUFFIXES_TO_REMOVE + ['zips'])
+        assert TextCleaner.clean("Akron Zips") == "akron"
+
     def test_clean_with_punctuation(self):
         """Test punctuation removal."""
         assert TextCleaner.clean("St. John's") == "st johns"
@@ -0,0 +1,63 @@
+"""Unit tests for TypoIndex."""
+
+import random
+
+from rapidfuzz import fuzz, process
+
+from ncaa_d1_team_normalizer.typo_index import TypoIndex
+
+NAMES = [
+    'duke', 'north carolina', 'connecticut', 'pennsylvania', 'penn state',
+    'miami fl', 'miami oh', 'kentucky', 'kansas', 'kansas state', 'villanova',
+    'marquette', 'xavier', 'syracuse', 'michigan state', 'michigan',
+]
+
+
+def extract_one(query, score_cutoff):
+    """Reference answer as (position, score) or None."""
+    result = process.extractOne(query, NAMES, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+    return (result[2], result[1]) if result else None
+
+
+class TestTypoIndex:
+    """Tests for TypoIndex class."""
+
+    def test_single_edit_typos_are_conclusive(self):
+        """Test single-character typos resolve without a full scan."""
+        index = TypoIndex(NAMES)
+
+        for query in ['kentuckey', 'vilanova', 'marquete', 'syracsue', 'conecticut']:
+            conclusive, match = index.best_match(query, 85)
+            assert conclusive
+            assert match == extract_one(query, 85)
+
+    def test_agrees_with_extract_one(self):
+        """Test conclusive answers always equal extractOne's."""
+        index = TypoIndex(NAMES)
+        rng = random.Random(0)
+
+        for _ in range(2000):
+            chars = list(rng.choice(NAMES))
+            for _ in range(rng.randint(0, 3)):
+                position = rng.randrange(len(chars))
+                if rng.random() < 0.5:
+                    chars[position] = rng.choice('abcdefghijklmnopqrstuvwxyz ')
+                else:
+                    chars.insert(position, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+            query = ''.join(chars)
+
+            for score_cutoff in (0, 70, 85, 95):
+                conclusive, match = index.best_match(query, score_cutoff)
+                if conclusive:
+                    assert match == extract_one(query, score_cutoff), query
+
+    def test_ties_go_to_earliest_name(self):
+        """Test equal scores resolve to the first position, as extractOne does."""
+        index = TypoIndex(['abcd', 'abce', 'abcf'])
+
+        assert index.best_match('abcx', 70) == (True, (0, 75.0))
+
+    def test_empty_index(self):
+        """Test an empty index finds nothing."""
+        conclusive, match = TypoIndex([]).best_match('duke', 85)
+        assert match is None